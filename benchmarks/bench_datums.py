@@ -0,0 +1,90 @@
+# benchmark of the datum inspection engine on a synthetic datum set
+# before: Inspect Grids / Inspect Levels read Name, Pinned and IsMonitoringLinkElement() to build the table
+#         and read Pinned and IsMonitoringLinkElement() again in the counting loop
+# after:  every datum is read once into a DatumRecord, counts and rows come from the same records
+#         (rows in natural order, sort keys computed once per datum)
+# the after run takes longer on this set: before sorts the names as plain strings ("Grid 10" before "Grid 2"),
+# after builds one natural sort key per datum; the interop reads, which dominate in Revit, drop by 40 %
+import random
+
+from benchutils import best_time, print_rows
+from pysweco.datums import GRIDS, DatumRecord, inspect_datums
+
+# STAND-IN DATUMS
+# datum that counts the property reads which would cross the .NET interop boundary in Revit
+class FakeDatum(object):
+	reads = 0
+
+	def __init__(self, element_id, name, pinned, monitored):
+		self.Id         = element_id
+		self._name      = name
+		self._pinned    = pinned
+		self._monitored = monitored
+
+	@property
+	def Name(self):
+		FakeDatum.reads += 1
+		return self._name
+
+	@property
+	def Pinned(self):
+		FakeDatum.reads += 1
+		return self._pinned
+
+	def IsMonitoringLinkElement(self):
+		FakeDatum.reads += 1
+		return self._monitored
+
+# 1) create a function that creates a synthetic datum set
+def make_datums(count, seed=3):
+	rnd = random.Random(seed)
+	return [FakeDatum(i, "Grid {}".format(rnd.randint(1, count)), rnd.random() < 0.7, rnd.random() < 0.2) for i in range(count)]
+
+# PIPELINES
+def before(datums):
+	data = sorted([[d.Name, d.Pinned, d.IsMonitoringLinkElement()] for d in datums])
+	count_pinned, count_unpinned, count_monitored, count_nonmonitored = 0, 0, 0, 0
+	for d in datums:
+		if d.Pinned:
+			count_pinned += 1
+		else:
+			count_unpinned += 1
+		if d.IsMonitoringLinkElement():
+			count_monitored += 1
+		else:
+			count_nonmonitored += 1
+	count_data = [[len(datums), "{} / {}".format(count_pinned, count_unpinned), "{} / {}".format(count_monitored, count_nonmonitored)]]
+	return count_data, data
+
+def read(datum):
+	return DatumRecord(datum.Id, datum.Name, datum.Pinned, datum.IsMonitoringLinkElement())
+
+def after(datums):
+	inspection = inspect_datums(datums, read, GRIDS)
+	return inspection.count_data(), inspection.rows()
+
+# 2) create a function that counts the property reads of one run
+def property_reads(pipeline, datums):
+	FakeDatum.reads = 0
+	pipeline(datums)
+	return FakeDatum.reads
+
+# BENCHMARK
+def main():
+	rows = []
+	for count in (1000, 10000, 50000):
+		datums = make_datums(count)
+		before_counts, before_rows = before(datums)
+		after_counts, after_rows   = after(datums)
+		assert before_counts == after_counts and sorted(before_rows) == sorted(after_rows)
+		rows.append([
+			count,
+			"{:.3f}".format(best_time(lambda: before(datums))),
+			"{:.3f}".format(best_time(lambda: after(datums))),
+			property_reads(before, datums),
+			property_reads(after, datums)
+			])
+	print_rows(["datums", "before s", "after s", "before reads", "after reads"], rows)
+
+if __name__ == "__main__":
+	main()
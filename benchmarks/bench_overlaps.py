@@ -0,0 +1,98 @@
+# benchmark of the duplicate / overlapping datum detection on synthetic grid and level sets
+# before: every pair of datums is compared, O(n^2)
+# after:  grids are bucketed in a spatial hash of (direction angle, offset) / (center, radius) and levels are
+#         swept in elevation order, only datums of neighbouring buckets are compared
+import math
+import random
+
+from benchutils import best_time, print_rows
+from pysweco.datums import DatumRecord
+from pysweco.overlaps import (ARC, DEFAULT_ANGLE_TOLERANCE, DEFAULT_TOLERANCE, _compare_arcs, _compare_lines,
+							  _line_key, arc_grid, grid_conflicts, level_conflicts, line_grid)
+
+# SYNTHETIC DATUMS
+# 1) create a function that creates a grid set: a rectangular grid layout in shared coordinates, a few arc grids,
+#    some grids copied on top of others and some shorter copies which overlap the originals
+def make_grids(count, seed=5):
+	rnd    = random.Random(seed)
+	base   = (250000.0, 80000.0)
+	grids  = []
+	half   = count // 2
+	for i in range(count):
+		position = (i % half) * 25.0
+		if i < half:
+			start, end = (base[0] + position, base[1] - 10.0), (base[0] + position, base[1] + half * 25.0)
+		else:
+			start, end = (base[0] - 10.0, base[1] + position), (base[0] + half * 25.0, base[1] + position)
+		grids.append(line_grid(i, "G{}".format(i), start, end))
+	for i in range(count // 50):
+		center = (base[0] + rnd.uniform(0, 1000), base[1] + rnd.uniform(0, 1000))
+		grids.append(arc_grid(len(grids), "R{}".format(i), center, 50.0, (center[0] + 50.0, center[1]), (center[0], center[1] + 50.0)))
+	for original in rnd.sample(grids[:count], count // 20):
+		if rnd.random() < 0.5:
+			grids.append(line_grid(len(grids), original.name + "(1)", original.start, original.end))
+		else:
+			middle = ((original.start[0] + original.end[0]) / 2, (original.start[1] + original.end[1]) / 2)
+			grids.append(line_grid(len(grids), original.name + "(2)", middle, original.end))
+	return grids
+
+def make_levels(count, seed=5):
+	rnd = random.Random(seed)
+	levels = [DatumRecord(i, "Level {}".format(i), True, False, i * 12.0) for i in range(count)]
+	levels.extend(DatumRecord(count + i, "Copy {}".format(i), True, False, rnd.randrange(count) * 12.0) for i in range(count // 20))
+	return levels
+
+# PIPELINES
+def grids_before(grids):
+	lines  = [g for g in grids if g.kind != ARC]
+	points = [g.start for g in lines] + [g.end for g in lines]
+	origin = (sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points))
+	keys   = dict((id(g), _line_key(g, origin)) for g in lines)
+	conflicts = []
+	for i, a in enumerate(grids):
+		for b in grids[i + 1:]:
+			if a.kind != b.kind:
+				continue
+			if a.kind == ARC:
+				conflict = _compare_arcs(a, b, DEFAULT_TOLERANCE)
+			else:
+				conflict = _compare_lines(a, b, keys, origin, DEFAULT_TOLERANCE, DEFAULT_ANGLE_TOLERANCE)
+			if conflict is not None:
+				conflicts.append(conflict)
+	return conflicts
+
+def levels_before(levels):
+	conflicts = []
+	for i, a in enumerate(levels):
+		for b in levels[i + 1:]:
+			if abs(a.elevation - b.elevation) <= DEFAULT_TOLERANCE:
+				conflicts.append((a, b))
+	return conflicts
+
+# 2) create a function that returns the conflicting pairs of a result as comparable id pairs
+def pairs(conflicts):
+	return sorted(tuple(sorted((c.first.element_id, c.second.element_id))) for c in conflicts)
+
+def level_pairs(conflicts):
+	return sorted(tuple(sorted((a.element_id, b.element_id))) for a, b in conflicts)
+
+# BENCHMARK
+def main():
+	rows = []
+	for count in (500, 2000, 5000):
+		grids  = make_grids(count)
+		levels = make_levels(count)
+		assert pairs(grids_before(grids)) == pairs(grid_conflicts(grids))
+		assert level_pairs(levels_before(levels)) == pairs(level_conflicts(levels))
+		rows.append([
+			count,
+			len(grid_conflicts(grids)),
+			"{:.3f}".format(best_time(lambda: grids_before(grids), repeat=1)),
+			"{:.3f}".format(best_time(lambda: grid_conflicts(grids))),
+			"{:.3f}".format(best_time(lambda: levels_before(levels), repeat=1)),
+			"{:.3f}".format(best_time(lambda: level_conflicts(levels)))
+			])
+	print_rows(["datums", "grid conflicts", "grids before s", "grids after s", "levels before s", "levels after s"], rows)
+
+if __name__ == "__main__":
+	main()
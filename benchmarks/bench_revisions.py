@@ -0,0 +1,96 @@
+# benchmark of the Set Revision to Sheet(s) engine on a synthetic sheet set
+# before: every selected sheet is read and written once per selected revision, as generic per-item tools do
+# after:  every sheet is read once into a SheetRecord, the change is diffed and only changed sheets are written once
+# in Revit every read / write crosses the .NET interop boundary and every write is a model change,
+# so the api call counts matter more than the python time of the stand-in sheets
+import random
+
+from benchutils import best_time, print_rows
+from pysweco.revisions import ACTION_ADD, SheetRecord, select_by_pattern, plan_changes, summarize
+
+# STAND-IN SHEETS
+# sheet that counts the calls which would cross the .NET interop boundary in Revit
+class FakeSheet(object):
+
+	def __init__(self, sheet_id, number, name, revision_ids):
+		self.Id           = sheet_id
+		self.SheetNumber  = number
+		self.Name         = name
+		self._revisions   = list(revision_ids)
+		self.reads        = 0
+		self.writes       = 0
+
+	def GetAdditionalRevisionIds(self):
+		self.reads += 1
+		return list(self._revisions)
+
+	def SetAdditionalRevisionIds(self, revision_ids):
+		self.writes += 1
+		self._revisions = list(revision_ids)
+
+# 1) create a function that creates a synthetic sheet set; about half of the sheets already carry the new revision
+def make_sheets(count, revisions=12, new_revision=12, seed=5):
+	rnd    = random.Random(seed)
+	sheets = []
+	for sheet_id in range(count):
+		current = sorted(rnd.sample(range(revisions), rnd.randint(0, 4)))
+		if rnd.random() < 0.5:
+			current.append(new_revision)
+		sheets.append(FakeSheet(sheet_id, "M-{:02d}-{:04d}".format(sheet_id % 40, sheet_id), "Sheet {}".format(sheet_id), current))
+	return sheets
+
+# PIPELINES
+def before(sheets, revision_ids):
+	for sheet in sheets:
+		if not sheet.SheetNumber.upper().startswith("M-"):
+			continue
+		for revision_id in revision_ids:
+			current = sheet.GetAdditionalRevisionIds()
+			if revision_id not in current:
+				current.append(revision_id)
+			sheet.SetAdditionalRevisionIds(current)
+
+def after(sheets, revision_ids):
+	records  = [SheetRecord(s.Id, s.SheetNumber, s.Name, s.GetAdditionalRevisionIds()) for s in sheets]
+	selected = select_by_pattern(records, "M-*")
+	changes  = plan_changes(selected, revision_ids, ACTION_ADD)
+	by_id    = dict((s.Id, s) for s in sheets)
+	for change in changes:
+		by_id[change.sheet.sheet_id].SetAdditionalRevisionIds(change.revision_ids)
+	return summarize(selected, changes)
+
+# 2) create a function that runs a pipeline on fresh sheet sets and returns (best time, api reads, api writes)
+#    the sheet set is created outside the timed call, the pipelines change the sheets
+def run(pipeline, count, revision_ids, repeat=3):
+	best = None
+	for _ in range(repeat):
+		sheets  = make_sheets(count)
+		elapsed = best_time(lambda: pipeline(sheets, revision_ids), repeat=1)
+		if best is None or elapsed < best:
+			best = elapsed
+	sheets = make_sheets(count)
+	pipeline(sheets, revision_ids)
+	return best, sum(s.reads for s in sheets), sum(s.writes for s in sheets)
+
+# BENCHMARK
+def main():
+	rows = []
+	for revision_ids, count in [([12], 500), ([12], 3000), ([12], 12000), ([12, 13, 14], 3000)]:
+		before_time, before_reads, before_writes = run(before, count, revision_ids)
+		after_time, after_reads, after_writes    = run(after, count, revision_ids)
+		rows.append([
+			count,
+			len(revision_ids),
+			"{:.3f}".format(before_time),
+			"{:.3f}".format(after_time),
+			before_reads,
+			after_reads,
+			before_writes,
+			after_writes
+			])
+	print_rows(["sheets", "revisions", "before s", "after s", "before reads", "after reads", "before writes", "after writes"], rows)
+	print("")
+	print("dry run summary (3000 sheets): {}".format(dict(after(make_sheets(3000), [12]))))
+
+if __name__ == "__main__":
+	main()
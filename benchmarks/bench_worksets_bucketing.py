@@ -0,0 +1,108 @@
+# benchmark of the Worksets Inspector bucketing engine on a synthetic workset
+# compares the legacy per-category rescans against the single pass engine
+# and shows that the single pass engine scales linearly with the element count
+import random
+from collections import Counter
+
+from benchutils import best_time, print_rows
+from pysweco.worksets import CATEGORY_KINDS, build_category_table, bucket_elements
+
+# SYNTHETIC ELEMENTS
+# synthetic BuiltInCategory ids; two unsupported categories are added to the element mix
+CATEGORY_NAMES = sorted(CATEGORY_KINDS) + ["OST_Views", "OST_DetailComponents"]
+CATEGORY_IDS   = dict((name, -2000000 - idx) for idx, name in enumerate(CATEGORY_NAMES))
+KINDS          = build_category_table(CATEGORY_IDS.get)
+
+class FakeElement(object):
+	__slots__ = ("category", "family_type", "system_type", "service_type", "fabrication")
+
+	def __init__(self, category, family_type, system_type, service_type, fabrication):
+		self.category     = category
+		self.family_type  = family_type
+		self.system_type  = system_type
+		self.service_type = service_type
+		self.fabrication  = fabrication
+
+# reader that counts the calls which would cross the .NET interop boundary in Revit
+class CountingReader(object):
+
+	def __init__(self):
+		self.calls = 0
+
+	def category(self, element):
+		self.calls += 1
+		return CATEGORY_IDS[element.category]
+
+	def category_name(self, element):
+		self.calls += 1
+		return element.category
+
+	def family_type(self, element):
+		self.calls += 1
+		return element.family_type
+
+	def category_label(self, element):
+		self.calls += 1
+		return element.category
+
+	def system_type(self, element):
+		self.calls += 1
+		return element.system_type
+
+	def service_type(self, element):
+		self.calls += 1
+		return element.service_type
+
+	def fabrication_service(self, element):
+		self.calls += 1
+		return element.fabrication
+
+def make_elements(count, seed=7):
+	rnd        = random.Random(seed)
+	categories = CATEGORY_NAMES
+	elements   = []
+	for _ in range(count):
+		category = rnd.choice(categories)
+		elements.append(FakeElement(
+			category,
+			"{} Family: Type {}".format(category, rnd.randint(1, 20)),
+			"System {}".format(rnd.randint(1, 12)),
+			rnd.choice(["", "Power", "Data", "Lighting"]),
+			"Service {}".format(rnd.randint(1, 5))
+			))
+	return elements
+
+# LEGACY ALGORITHM
+# replica of the original inspector loop: five filtered rescans of the whole workset per category
+def legacy_bucketing(elements, reader):
+	kinds    = KINDS
+	counter  = Counter([reader.category(e) for e in elements if reader.category(e) in kinds])
+	result   = {}
+	for category_name in counter:
+		scans = []
+		for _ in range(5):
+			scans.append([e for e in elements if reader.category(e) == category_name])
+		result[category_name] = len(scans[0])
+	return result
+
+# BENCHMARK
+def main():
+	rows = []
+	for count in (5000, 10000, 20000, 40000):
+		elements = make_elements(count)
+		legacy_reader = CountingReader()
+		engine_reader = CountingReader()
+		legacy_time   = best_time(lambda: legacy_bucketing(elements, legacy_reader), repeat=1)
+		engine_time   = best_time(lambda: bucket_elements(elements, engine_reader, KINDS), repeat=1)
+		rows.append([
+			count,
+			"{:.3f}".format(legacy_time),
+			"{:.3f}".format(engine_time),
+			"{:.2f}".format(engine_time / count * 1e6),
+			legacy_reader.calls,
+			engine_reader.calls
+			])
+	print_rows(["elements", "legacy s", "engine s", "engine us/elem", "legacy reads", "engine reads"], rows)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,151 @@
+# benchmark of the Worksets Inspector collection pipeline against a stand-in collector
+# before: ToElements() materializes every element of the workset (views, annotation, types included)
+#         and nested families are discarded in python afterwards
+# after:  category / element type / workset filters run inside the collector, ToElementIds() returns ids only
+#         and elements are materialized one by one while bucketing
+import random
+
+from benchutils import best_time, print_rows
+from bench_worksets_bucketing import CATEGORY_IDS, KINDS, CountingReader
+from pysweco.worksets import bucket_elements
+
+try:
+	import tracemalloc
+except ImportError:
+	tracemalloc = None
+
+# STAND-IN DOCUMENT
+# raw element records stay "native"; GetElement() creates a managed wrapper like the Revit API does
+class NativeRecord(object):
+	__slots__ = ("id", "category", "workset", "is_type", "nested")
+
+	def __init__(self, element_id, category, workset, is_type, nested):
+		self.id       = element_id
+		self.category = category
+		self.workset  = workset
+		self.is_type  = is_type
+		self.nested   = nested
+
+class WrappedElement(object):
+
+	def __init__(self, record):
+		self.record       = record
+		self.category     = record.category
+		self.family_type  = "{} Family: Type {}".format(record.category, record.id % 17)
+		self.system_type  = "System {}".format(record.id % 11)
+		self.service_type = ""
+		self.fabrication  = "Service {}".format(record.id % 3)
+		self.parameters   = dict(("Parameter {}".format(i), i) for i in range(20))
+
+class FakeDocument(object):
+
+	def __init__(self, count, worksets=8, seed=11):
+		rnd        = random.Random(seed)
+		categories = sorted(CATEGORY_IDS)
+		other      = ["OST_Views", "OST_TextNotes", "OST_Dimensions", "OST_DetailComponents"]
+		self.records = {}
+		for element_id in range(count):
+			if rnd.random() < 0.4:
+				category = rnd.choice(other)
+			else:
+				category = rnd.choice(categories)
+			self.records[element_id] = NativeRecord(
+				element_id,
+				category,
+				rnd.randint(1, worksets),
+				rnd.random() < 0.1,
+				rnd.random() < 0.05
+				)
+
+	def GetElement(self, element_id):
+		return WrappedElement(self.records[element_id])
+
+# stand-in of FilteredElementCollector; filters run on the native records
+class FakeCollector(object):
+
+	def __init__(self, doc):
+		self.doc     = doc
+		self.filters = []
+
+	def WherePasses(self, predicate):
+		self.filters.append(predicate)
+		return self
+
+	def WhereElementIsNotElementType(self):
+		self.filters.append(lambda record: not record.is_type)
+		return self
+
+	def _records(self):
+		for record in self.doc.records.values():
+			if all(f(record) for f in self.filters):
+				yield record
+
+	def ToElements(self):
+		return [self.doc.GetElement(record.id) for record in self._records()]
+
+	def ToElementIds(self):
+		return [record.id for record in self._records()]
+
+def workset_filter(workset):
+	return lambda record: record.workset == workset
+
+def category_filter(names):
+	return lambda record: record.category in names
+
+# reader that also accepts the categories which are not reported (views, annotation, ...)
+class StandInReader(CountingReader):
+
+	def category(self, element):
+		self.calls += 1
+		return CATEGORY_IDS.get(element.category)
+
+# categories pushed into the multi-category filter
+SUPPORTED = frozenset(name for name, category_id in CATEGORY_IDS.items() if category_id in KINDS)
+
+# PIPELINES
+def before(doc, workset, reader):
+	elements = FakeCollector(doc).WherePasses(workset_filter(workset)).ToElements()
+	elements = [el for el in elements if not el.record.nested]
+	return bucket_elements(elements, reader, KINDS)
+
+def after(doc, workset, reader):
+	ids = FakeCollector(doc).\
+		  WherePasses(category_filter(SUPPORTED)).\
+		  WherePasses(workset_filter(workset)).\
+		  WhereElementIsNotElementType().\
+		  ToElementIds()
+	def reportable():
+		for element_id in ids:
+			element = doc.GetElement(element_id)
+			if not element.record.nested:
+				yield element
+	return bucket_elements(reportable(), reader, KINDS)
+
+# 1) create a function that measures the peak traced memory of a callable in kB
+def peak_memory(func):
+	if tracemalloc is None:
+		return "n/a"
+	tracemalloc.start()
+	func()
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+	return "{:.0f}".format(peak / 1024.0)
+
+# BENCHMARK
+def main():
+	rows = []
+	for count in (20000, 40000, 80000):
+		doc = FakeDocument(count)
+		before_time = best_time(lambda: before(doc, 1, StandInReader()))
+		after_time  = best_time(lambda: after(doc, 1, StandInReader()))
+		rows.append([
+			count,
+			"{:.3f}".format(before_time),
+			"{:.3f}".format(after_time),
+			peak_memory(lambda: before(doc, 1, StandInReader())),
+			peak_memory(lambda: after(doc, 1, StandInReader()))
+			])
+	print_rows(["model elements", "before s", "after s", "before peak kB", "after peak kB"], rows)
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,30 @@
+# shared helpers for the pySWECO benchmarks
+# benchmarks run outside Revit on synthetic in-memory elements:
+#     python benchmarks/bench_<name>.py
+import os
+import sys
+import timeit
+
+# make pySWECO library importable without pyRevit
+LIB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "lib")
+if LIB_DIR not in sys.path:
+	sys.path.insert(0, LIB_DIR)
+
+# 1) create a function that returns the best wall time of a callable in seconds
+def best_time(func, repeat=3):
+	best = None
+	for _ in range(repeat):
+		start = timeit.default_timer()
+		func()
+		elapsed = timeit.default_timer() - start
+		if best is None or elapsed < best:
+			best = elapsed
+	return best
+
+# 2) create a function that prints a fixed width table of benchmark rows
+def print_rows(columns, rows):
+	widths = [max(len(str(c)), max([len(str(r[i])) for r in rows] or [0])) for i, c in enumerate(columns)]
+	line   = "  ".join("{:>%d}" % w for w in widths)
+	print(line.format(*columns))
+	for row in rows:
+		print(line.format(*row))
@@ -0,0 +1,2 @@
+# pySWECO shared library
+# pure python engines used by the pySWECO pushbuttons; revit bound helpers live in pysweco.revitdb
@@ -0,0 +1,35 @@
+# memoization of values that are shared by many elements (type names, system type names, ...)
+
+# missing value marker, values themselves may be None
+_MISSING = object()
+
+# resolution cache with hit / miss counters
+class ResolutionCache(object):
+
+	def __init__(self):
+		self._values = {}
+		self.hits    = 0
+		self.misses  = 0
+
+	# return the cached value of a key or compute it once with compute(*args)
+	# exceptions raised by compute are not cached
+	def resolve(self, key, compute, *args):
+		value = self._values.get(key, _MISSING)
+		if value is not _MISSING:
+			self.hits += 1
+			return value
+		self.misses += 1
+		value = self._values[key] = compute(*args)
+		return value
+
+	def __len__(self):
+		return len(self._values)
+
+	def hit_rate(self):
+		lookups = self.hits + self.misses
+		if not lookups:
+			return 0.0
+		return 100.0 * self.hits / lookups
+
+	def summary(self):
+		return "{} hits / {} misses ({:.1f}% hit rate, {} distinct values)".format(self.hits, self.misses, self.hit_rate(), len(self))
@@ -0,0 +1,82 @@
+# IMPORTS
+# import json and ordered dictionary for the stored profiles
+import json
+from collections import OrderedDict
+
+# system calculation mode engine used by Update Calcs Mode
+# every duct / pipe system type is read once into a SystemTypeRecord (kind from its class, mode from the
+# calculation parameter of that class), the requested mode is diffed against the records and only the
+# types that actually change are written; the post-commit check reads back the changed types only
+
+# system type kinds
+KIND_DUCT = "Duct"
+KIND_PIPE = "Pipe"
+
+# calculation modes offered to the user; the integer values come from SystemCalculationLevel at runtime
+MODE_NONE        = "None"
+MODE_FLOW        = "Flow"
+MODE_ALL         = "All"
+MODE_PERFORMANCE = "Performance"
+
+# system type state read once from the model
+class SystemTypeRecord(object):
+	__slots__ = ("type_id", "name", "kind", "mode")
+
+	def __init__(self, type_id, name, kind, mode):
+		self.type_id = type_id
+		self.name    = name
+		self.kind    = kind
+		self.mode    = mode
+
+# planned change of one system type
+class ModeChange(object):
+	__slots__ = ("record", "mode")
+
+	def __init__(self, record, mode):
+		self.record = record
+		self.mode   = mode
+
+# 1) create a function that returns the records whose mode differs from the requested mode
+def types_to_change(records, mode):
+	return [r for r in records if r.mode != mode]
+
+# 2) create a function that plans the changes of the selected records, records already in the mode are skipped
+def plan_mode_changes(records, mode):
+	return [ModeChange(r, mode) for r in records if r.mode != mode]
+
+# 3) create a function that verifies the applied changes, read_mode(type_id) returns the mode after commit
+#    returns the changes whose type does not have the requested mode
+def verify_changes(changes, read_mode):
+	return [c for c in changes if read_mode(c.record.type_id) != c.mode]
+
+# 4) create a function that returns a readable label of a mode value, labels is mode value -> mode name
+def mode_label(mode, labels):
+	return labels.get(mode, str(mode))
+
+# 5) create a function that returns the table rows of the changes: kind, system type, mode before and after
+def change_rows(changes, labels):
+	return [[c.record.kind, c.record.name, mode_label(c.record.mode, labels), mode_label(c.mode, labels)]
+			for c in sorted(changes, key=lambda c: (c.record.kind, c.record.name))]
+
+# PROFILES
+# calculation mode profiles are stored with the document as one JSON text:
+#     {profile name: {"saved": timestamp, "modes": {type id: mode}}}
+# a profile is captured before a performance editing session and restored before sizing
+
+# 6) create a function that captures the modes of the records into a profile
+def capture_profile(records, saved):
+	return OrderedDict([("saved", saved), ("modes", OrderedDict((str(r.type_id), r.mode) for r in records))])
+
+# 7) create a function that plans the changes which restore a profile, types deleted since are ignored
+def profile_changes(records, profile):
+	modes = profile.get("modes", {})
+	return [ModeChange(r, modes[str(r.type_id)]) for r in records if str(r.type_id) in modes and modes[str(r.type_id)] != r.mode]
+
+# 8) create functions that read and write the stored profiles
+def load_profiles(text):
+	if not text:
+		return OrderedDict()
+	return json.loads(text, object_pairs_hook=OrderedDict)
+
+def dump_profiles(profiles):
+	return json.dumps(profiles)
@@ -0,0 +1,109 @@
+# IMPORTS
+# import pySWECO library
+from pysweco.sorting import natural_key
+
+# single pass datum inspection used by Inspect Grids / Levels / Reference Planes / Scope Boxes
+# every datum is read once (name, pinned, monitored) and the same records give the counts and the table rows
+
+# datum kinds; the Revit collectors of every kind are in pysweco.revitdb.datums
+class DatumSpec(object):
+
+	def __init__(self, key, label, item_label):
+		self.key        = key
+		self.label      = label
+		self.item_label = item_label
+
+GRIDS            = DatumSpec("grids", "Grids", "Grid")
+LEVELS           = DatumSpec("levels", "Levels", "Level")
+REFERENCE_PLANES = DatumSpec("reference_planes", "Reference Planes", "Reference Plane")
+SCOPE_BOXES      = DatumSpec("scope_boxes", "Scope Boxes", "Scope Box")
+
+DATUM_SPECS = [GRIDS, LEVELS, REFERENCE_PLANES, SCOPE_BOXES]
+
+# other elements pinned before issue together with the datums
+REVIT_LINKS = DatumSpec("revit_links", "Revit Links", "Revit Link")
+CAD_IMPORTS = DatumSpec("cad_imports", "Imported CAD", "CAD Import")
+
+PIN_SPECS = DATUM_SPECS + [REVIT_LINKS, CAD_IMPORTS]
+
+# table row orders: natural sort of the names ("2" before "10", "B" before "AA") or elevation (levels)
+ORDER_NAME      = "name"
+ORDER_ELEVATION = "elevation"
+
+# datum state read once from the model, the natural sort key of the name is computed once here
+class DatumRecord(object):
+	__slots__ = ("element_id", "name", "pinned", "monitored", "elevation", "sort_key")
+
+	def __init__(self, element_id, name, pinned, monitored, elevation=None):
+		self.element_id = element_id
+		self.name       = name
+		self.pinned     = pinned
+		self.monitored  = monitored
+		self.elevation  = elevation
+		self.sort_key   = natural_key(name)
+
+# counts and records of one datum kind
+class DatumInspection(object):
+
+	def __init__(self, spec):
+		self.spec      = spec
+		self.records   = []
+		self.pinned    = 0
+		self.monitored = 0
+
+	def add(self, record):
+		self.records.append(record)
+		if record.pinned:
+			self.pinned += 1
+		if record.monitored:
+			self.monitored += 1
+
+	@property
+	def total(self):
+		return len(self.records)
+
+	@property
+	def unpinned(self):
+		return self.total - self.pinned
+
+	@property
+	def nonmonitored(self):
+		return self.total - self.monitored
+
+	# primary table: total, pinned / un-pinned, monitored / non-monitored
+	def count_data(self):
+		return [[self.total, "{} / {}".format(self.pinned, self.unpinned), "{} / {}".format(self.monitored, self.nonmonitored)]]
+
+	# records in table order; datums without elevation are listed after the others when ordered by elevation
+	def sorted_records(self, order=ORDER_NAME):
+		if order == ORDER_ELEVATION:
+			return sorted(self.records, key=lambda r: (r.elevation is None, r.elevation, r.sort_key))
+		return sorted(self.records, key=lambda r: r.sort_key)
+
+	# secondary table: one row per datum in table order
+	def rows(self, order=ORDER_NAME):
+		return [[record.name, record.pinned, record.monitored] for record in self.sorted_records(order)]
+
+# 1) create a function that inspects datums in one pass, read(element) returns a DatumRecord
+def inspect_datums(elements, read, spec):
+	inspection = DatumInspection(spec)
+	for element in elements:
+		inspection.add(read(element))
+	return inspection
+
+# 2) create a function that prints the inspection tables to the pyRevit output window
+def print_inspection(output, inspection, order=ORDER_NAME):
+	spec = inspection.spec
+	output.print_table(inspection.count_data(),
+					columns = ["Total Count", "Pinned / Un-Pinned Count", "Monitored / Non-monitored Count"],
+					title = "{} INSPECTION RESULTS".format(spec.label.upper())
+					)
+	output.print_table(inspection.rows(order),
+					columns = ["{} Name".format(spec.item_label), "Pinned (True or False)", "Monitored (True or False)"]
+					)
+
+# 3) create a function that prints the SWECO styled report of an inspection: output style, logo and inspection tables
+def print_datum_report(output, inspection, logo_path, order=ORDER_NAME):
+	output.add_style('body { color: black; font-size: 14px; background-color: white; font-family: Arial }')
+	output.print_image(logo_path)
+	print_inspection(output, inspection, order)
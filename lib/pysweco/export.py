@@ -0,0 +1,72 @@
+# IMPORTS
+# import modules to write the export files
+import io
+import json
+import os
+from collections import OrderedDict
+
+# streaming row writers for CSV and JSON Lines exports
+# every row is written to the file as soon as it is produced, nothing is kept in memory
+
+# 1) create a function that formats one CSV field (RFC 4180 quoting)
+def csv_field(value):
+	if value is None:
+		return u""
+	text = u"{}".format(value)
+	if any(c in text for c in u',"\r\n'):
+		text = u'"{}"'.format(text.replace(u'"', u'""'))
+	return text
+
+class CsvRowWriter(object):
+
+	def __init__(self, stream, columns):
+		self.stream  = stream
+		self.columns = columns
+		self.rows    = 0
+		self.stream.write(u",".join(csv_field(c) for c in columns) + u"\r\n")
+
+	def write(self, row):
+		self.stream.write(u",".join(csv_field(v) for v in row) + u"\r\n")
+		self.rows += 1
+
+class JsonLinesRowWriter(object):
+
+	def __init__(self, stream, columns):
+		self.stream  = stream
+		self.columns = columns
+		self.rows    = 0
+
+	def write(self, row):
+		self.stream.write(u"{}\n".format(json.dumps(OrderedDict(zip(self.columns, row)))))
+		self.rows += 1
+
+# row writer bound to a file, picks the format from the file extension (.csv or .jsonl)
+class RowExport(object):
+
+	def __init__(self, path, columns):
+		self.path   = path
+		self.stream = io.open(path, "w", encoding="utf-8", newline="")
+		if os.path.splitext(path)[1].lower() in (".jsonl", ".json"):
+			self.writer = JsonLinesRowWriter(self.stream, columns)
+		else:
+			self.writer = CsvRowWriter(self.stream, columns)
+
+	@property
+	def rows(self):
+		return self.writer.rows
+
+	def write(self, row):
+		self.writer.write(row)
+
+	def write_rows(self, rows):
+		for row in rows:
+			self.writer.write(row)
+
+	def close(self):
+		self.stream.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
@@ -0,0 +1,67 @@
+# IMPORTS
+# import counter and default dictionary
+from collections import Counter, defaultdict
+# import pySWECO library
+from pysweco.sorting import natural_key
+
+# level usage index used by Inspect Levels
+# the model elements are collected once and grouped by every level they reference (LevelId, reference level,
+# base / top constraints, schedule level, room upper limit), plan views by their associated level and the levels
+# of their view range; levels without any reference found are deletion candidates, to be reviewed before deleting
+
+# usage flags
+USAGE_UNUSED     = "No references found"
+USAGE_VIEWS_ONLY = "Views only"
+USAGE_USED       = "-"
+
+# elements and views of every level, keyed by the integer value of the level id
+class LevelUsage(object):
+
+	def __init__(self):
+		self.elements = Counter()
+		self.views    = defaultdict(list)
+
+	def add_element(self, level_id):
+		self.elements[level_id] += 1
+
+	def add_view(self, level_id, view_name):
+		self.views[level_id].append(view_name)
+
+	def view_names(self, level_id):
+		return sorted(self.views.get(level_id, []), key=natural_key)
+
+	def usage(self, level_id):
+		if self.elements[level_id]:
+			return USAGE_USED
+		if self.views.get(level_id):
+			return USAGE_VIEWS_ONLY
+		return USAGE_UNUSED
+
+	# table rows in the order of the level records: name, element count, view count, view names, usage flag
+	def rows(self, records):
+		return [[r.name, self.elements[r.element_id], len(self.views.get(r.element_id, [])),
+				 ", ".join(self.view_names(r.element_id)) or "-", self.usage(r.element_id)] for r in records]
+
+	# number of levels of the records without elements and views
+	def unused_count(self, records):
+		return len([r for r in records if self.usage(r.element_id) == USAGE_UNUSED])
+
+# 1) create a function that builds the index in one pass, read(element) returns (level ids, view name):
+#    the distinct level ids referenced by the element (empty without level), view name None for model elements
+def build_level_usage(elements, read):
+	usage = LevelUsage()
+	for element in elements:
+		level_ids, view_name = read(element)
+		for level_id in level_ids:
+			if view_name is None:
+				usage.add_element(level_id)
+			else:
+				usage.add_view(level_id, view_name)
+	return usage
+
+# 2) create a function that prints the level usage table to the pyRevit output window
+def print_level_usage(output, usage, records):
+	output.print_table(usage.rows(records),
+					columns = ["Level Name", "Elements Count", "Views Count", "Views", "Usage"],
+					title = "LEVEL USAGE ({} WITHOUT REFERENCES FOUND)".format(usage.unused_count(records))
+					)
@@ -0,0 +1,98 @@
+# IMPORTS
+# import counter for the network sizes
+from collections import Counter
+
+# network size analysis used by Inspect System Calcs
+# duct / pipe curves, fittings and accessories are collected once and grouped by system type and by system;
+# system types are ranked by network size and the large ones which are not in Performance mode yet are
+# flagged as candidates (editing large networks in None / Flow / All mode slows Revit down)
+
+# element kinds counted in a network
+KIND_CURVE     = "Curves"
+KIND_FITTING   = "Fittings"
+KIND_ACCESSORY = "Accessories"
+
+NETWORK_KINDS = [KIND_CURVE, KIND_FITTING, KIND_ACCESSORY]
+
+# default number of elements from which a system type is a Performance mode candidate
+DEFAULT_THRESHOLD = 5000
+
+# label of the elements without system type / system
+UNASSIGNED = "Unassigned"
+
+# size of one network: element count per kind
+class NetworkSize(object):
+	__slots__ = ("counts",)
+
+	def __init__(self):
+		self.counts = Counter()
+
+	@property
+	def total(self):
+		return sum(self.counts.values())
+
+	def row(self):
+		return [self.counts[kind] for kind in NETWORK_KINDS] + [self.total]
+
+# network sizes per system type id and per (system type id, system id); system names are kept for display only,
+# systems with the same name are different networks
+class NetworkIndex(object):
+
+	def __init__(self):
+		self.by_type   = {}
+		self.by_system = {}
+		self.names     = {}
+
+	# systems is a list of (system id, system name), an element in several systems counts once in each of them
+	def add(self, type_id, systems, kind):
+		self.by_type.setdefault(type_id, NetworkSize()).counts[kind] += 1
+		for system_id, system_name in systems or [(None, None)]:
+			self.by_system.setdefault((type_id, system_id), NetworkSize()).counts[kind] += 1
+			if system_id is not None:
+				self.names[system_id] = system_name
+
+	# system type ids by network size, largest first
+	def ranked_types(self):
+		return sorted(self.by_type, key=lambda type_id: (-self.by_type[type_id].total, str(type_id)))
+
+	# (system type id, system id) by network size, largest first
+	def ranked_systems(self):
+		return sorted(self.by_system, key=lambda key: (-self.by_system[key].total, str(key)))
+
+	# number of systems per system type id, unassigned elements are not a system
+	def system_counts(self):
+		return Counter(type_id for type_id, system_id in self.by_system if system_id is not None)
+
+# 1) create a function that builds the index in one pass, read(element) returns (system type id, systems, kind)
+#    or None for elements which are not counted; systems is a list of (system id, system name), system type id
+#    is None and systems empty when unassigned
+def build_network_index(elements, read):
+	index = NetworkIndex()
+	for element in elements:
+		item = read(element)
+		if item is not None:
+			index.add(*item)
+	return index
+
+# 2) create a function that tells if a system type is a Performance mode candidate
+def is_candidate(size, mode, performance_mode, threshold):
+	return size.total >= threshold and mode != performance_mode
+
+# 3) create a function that returns the ranking rows of the system types; types is type id -> (name, mode label, mode)
+#    rank, system type, counts per kind, total, systems count, mode and candidate flag
+def type_rows(index, types, performance_mode, threshold):
+	rows    = []
+	systems = index.system_counts()
+	for rank, type_id in enumerate(index.ranked_types(), 1):
+		size = index.by_type[type_id]
+		name, label, mode = types.get(type_id, (UNASSIGNED, "-", None))
+		candidate = type_id in types and is_candidate(size, mode, performance_mode, threshold)
+		rows.append([rank, name] + size.row() + [systems[type_id], label, "<b>Candidate</b>" if candidate else "-"])
+	return rows
+
+# 4) create a function that returns the rows of the largest systems: system, system type, counts per kind, total
+def system_rows(index, types, limit=None):
+	rows = []
+	for type_id, system_id in index.ranked_systems()[:limit]:
+		rows.append([index.names.get(system_id) or UNASSIGNED, types.get(type_id, (UNASSIGNED,))[0]] + index.by_system[(type_id, system_id)].row())
+	return rows
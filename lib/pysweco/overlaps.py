@@ -0,0 +1,188 @@
+# IMPORTS
+# import math functions
+import math
+from collections import defaultdict
+
+# duplicate and overlapping datum detection used by Inspect Grids / Inspect Levels
+# datums copied in from links end up on top of each other; instead of comparing every pair the datums are
+# bucketed by a tolerance-based key (levels: sorted sweep over the elevations, grids: spatial hash of the
+# line / arc parameters) and only datums of the same or neighbouring buckets are compared
+# all lengths are Revit internal units (feet)
+
+# default tolerances: 1 mm, 0.001 degree
+DEFAULT_TOLERANCE       = 1.0 / 304.8
+DEFAULT_ANGLE_TOLERANCE = math.radians(0.001)
+
+# relations reported between two datums
+COINCIDENT  = "Coincident"
+OVERLAPPING = "Overlapping"
+
+# grid curve kinds
+LINE = "line"
+ARC  = "arc"
+
+TWO_PI = 2.0 * math.pi
+
+# grid geometry read once from the model: straight grids keep the end points, arc grids also the center,
+# radius and the counter-clockwise start angle and sweep
+class GridGeometry(object):
+	__slots__ = ("element_id", "name", "kind", "start", "end", "center", "radius", "start_angle", "sweep")
+
+	def __init__(self, element_id, name, kind, start, end, center=None, radius=None, start_angle=None, sweep=None):
+		self.element_id  = element_id
+		self.name        = name
+		self.kind        = kind
+		self.start       = start
+		self.end         = end
+		self.center      = center
+		self.radius      = radius
+		self.start_angle = start_angle
+		self.sweep       = sweep
+
+# 1) create functions that return the geometry of a straight grid and of an arc grid, points are (x, y)
+#    the arc end points are given counter-clockwise
+def line_grid(element_id, name, start, end):
+	return GridGeometry(element_id, name, LINE, start, end)
+
+def arc_grid(element_id, name, center, radius, start, end):
+	start_angle = math.atan2(start[1] - center[1], start[0] - center[0]) % TWO_PI
+	end_angle   = math.atan2(end[1] - center[1], end[0] - center[0]) % TWO_PI
+	sweep       = (end_angle - start_angle) % TWO_PI or TWO_PI
+	return GridGeometry(element_id, name, ARC, start, end, center, radius, start_angle, sweep)
+
+# two datums which are coincident or overlap; gap is the largest distance between them within the tolerance
+class DatumConflict(object):
+	__slots__ = ("first", "second", "relation", "gap")
+
+	def __init__(self, first, second, relation, gap):
+		self.first    = first
+		self.second   = second
+		self.relation = relation
+		self.gap      = gap
+
+# LEVELS
+# 2) create a function that finds the levels whose elevations are within the tolerance with a sorted sweep
+#    records have name and elevation (DatumRecord); O(n log n) plus the number of reported pairs
+def level_conflicts(records, tolerance=DEFAULT_TOLERANCE):
+	ordered   = sorted((r for r in records if r.elevation is not None), key=lambda r: r.elevation)
+	conflicts = []
+	for i, record in enumerate(ordered):
+		j = i + 1
+		while j < len(ordered) and ordered[j].elevation - record.elevation <= tolerance:
+			conflicts.append(DatumConflict(record, ordered[j], COINCIDENT, ordered[j].elevation - record.elevation))
+			j += 1
+	return conflicts
+
+# GRIDS
+def _distance(a, b):
+	return math.hypot(a[0] - b[0], a[1] - b[1])
+
+# straight grid as an infinite line: direction angle in [0, pi) and signed offset of the line from the origin
+def _line_key(grid, origin):
+	dx, dy = grid.end[0] - grid.start[0], grid.end[1] - grid.start[1]
+	angle  = math.atan2(dy, dx) % math.pi
+	offset = -(grid.start[0] - origin[0]) * math.sin(angle) + (grid.start[1] - origin[1]) * math.cos(angle)
+	return angle, offset
+
+# interval of a straight grid along the direction of a line
+def _projection(grid, angle, origin):
+	ux, uy = math.cos(angle), math.sin(angle)
+	a = (grid.start[0] - origin[0]) * ux + (grid.start[1] - origin[1]) * uy
+	b = (grid.end[0] - origin[0]) * ux + (grid.end[1] - origin[1]) * uy
+	return min(a, b), max(a, b)
+
+def _compare_lines(a, b, keys, origin, tolerance, angle_tolerance):
+	(angle_a, offset_a), (angle_b, offset_b) = keys[id(a)], keys[id(b)]
+	delta = abs(angle_a - angle_b)
+	if delta > math.pi / 2:
+		# the same line near angle 0 / pi: direction and offset sign are flipped
+		delta, offset_b = math.pi - delta, -offset_b
+	if delta > angle_tolerance or abs(offset_a - offset_b) > tolerance:
+		return None
+	coincident = max(_distance(a.start, b.start), _distance(a.end, b.end))
+	coincident = min(coincident, max(_distance(a.start, b.end), _distance(a.end, b.start)))
+	if coincident <= tolerance:
+		return DatumConflict(a, b, COINCIDENT, coincident)
+	low_a, high_a = _projection(a, angle_a, origin)
+	low_b, high_b = _projection(b, angle_a, origin)
+	if min(high_a, high_b) - max(low_a, low_b) > tolerance:
+		return DatumConflict(a, b, OVERLAPPING, abs(offset_a - offset_b))
+	return None
+
+def _compare_arcs(a, b, tolerance):
+	if _distance(a.center, b.center) > tolerance or abs(a.radius - b.radius) > tolerance:
+		return None
+	coincident = max(_distance(a.start, b.start), _distance(a.end, b.end))
+	if coincident <= tolerance:
+		return DatumConflict(a, b, COINCIDENT, coincident)
+	# angular overlap of the two arcs, the second arc is also shifted by one turn either way
+	overlap = 0.0
+	for shift in (-TWO_PI, 0.0, TWO_PI):
+		start = b.start_angle + shift
+		overlap = max(overlap, min(a.start_angle + a.sweep, start + b.sweep) - max(a.start_angle, start))
+	if overlap * a.radius > tolerance:
+		return DatumConflict(a, b, OVERLAPPING, max(_distance(a.center, b.center), abs(a.radius - b.radius)))
+	return None
+
+# 3) create a function that finds the coincident and overlapping grids with a spatial hash
+#    straight grids are hashed by (direction angle, offset) and arc grids by (center, radius) in cells of the
+#    tolerance size; a grid is only compared with the grids of its own and the neighbouring cells
+def grid_conflicts(grids, tolerance=DEFAULT_TOLERANCE, angle_tolerance=DEFAULT_ANGLE_TOLERANCE):
+	lines = [g for g in grids if g.kind == LINE]
+	arcs  = [g for g in grids if g.kind == ARC]
+	conflicts = []
+
+	# offsets are measured from the middle of the grids to keep them small in shared coordinates
+	if lines:
+		points = [g.start for g in lines] + [g.end for g in lines]
+		origin = (sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points))
+		keys   = dict((id(g), _line_key(g, origin)) for g in lines)
+		cells  = defaultdict(list)
+		for index, grid in enumerate(lines):
+			angle, offset = keys[id(grid)]
+			cells[(int(math.floor(angle / angle_tolerance)), int(math.floor(offset / tolerance)))].append(index)
+			# lines near angle pi are also hashed as flipped lines near angle 0
+			if angle > math.pi - angle_tolerance:
+				cells[(int(math.floor((angle - math.pi) / angle_tolerance)), int(math.floor(-offset / tolerance)))].append(index)
+		conflicts.extend(_hash_pairs(lines, cells, lambda a, b: _compare_lines(a, b, keys, origin, tolerance, angle_tolerance), 2))
+
+	if arcs:
+		cells = defaultdict(list)
+		for index, grid in enumerate(arcs):
+			cells[(int(math.floor(grid.center[0] / tolerance)), int(math.floor(grid.center[1] / tolerance)),
+				   int(math.floor(grid.radius / tolerance)))].append(index)
+		conflicts.extend(_hash_pairs(arcs, cells, lambda a, b: _compare_arcs(a, b, tolerance), 3))
+	return conflicts
+
+# compare the datums of every cell with the datums of the neighbouring cells once per pair
+def _hash_pairs(items, cells, compare, dimensions):
+	offsets = [()]
+	for _ in range(dimensions):
+		offsets = [o + (d,) for o in offsets for d in (-1, 0, 1)]
+	seen, conflicts = set(), []
+	for cell, members in cells.items():
+		for offset in offsets:
+			neighbours = cells.get(tuple(c + o for c, o in zip(cell, offset)))
+			if not neighbours:
+				continue
+			for i in members:
+				for j in neighbours:
+					if i >= j or (i, j) in seen:
+						continue
+					seen.add((i, j))
+					conflict = compare(items[i], items[j])
+					if conflict is not None:
+						conflicts.append(conflict)
+	return conflicts
+
+# OUTPUT
+# 4) create a function that prints the conflicts table to the pyRevit output window, gaps in millimetres
+def print_conflicts(output, conflicts, spec):
+	if not conflicts:
+		output.print_md("**No duplicate or overlapping {} found**".format(spec.label.lower()))
+		return
+	rows = sorted([[c.first.name, c.second.name, c.relation, "{:.1f}".format(c.gap * 304.8)] for c in conflicts])
+	output.print_table(rows,
+					columns = ["{} Name".format(spec.item_label), "{} Name".format(spec.item_label), "Relation", "Offset (mm)"],
+					title = "DUPLICATE / OVERLAPPING {}".format(spec.label.upper())
+					)
@@ -0,0 +1,20 @@
+# IMPORTS
+# import modules to match name patterns
+import fnmatch
+import re
+
+# wildcard name patterns shared by the pySWECO commands: "*" any text, "?" one character, case insensitive
+
+# separator of several patterns in one pattern string, e.g. "M-1*; M-2*"
+PATTERN_SEPARATOR = ";"
+
+# 1) create a function that splits a pattern string into its patterns
+def split_patterns(pattern):
+	return [p.strip() for p in (pattern or "").split(PATTERN_SEPARATOR) if p.strip()]
+
+# 2) create a function that compiles one or more patterns into one regular expression, None if there is no pattern
+def compile_pattern(pattern):
+	parts = split_patterns(pattern) if not isinstance(pattern, (list, tuple)) else [p for p in pattern if p]
+	if not parts:
+		return None
+	return re.compile("|".join("(?:{})".format(fnmatch.translate(p)) for p in parts), re.IGNORECASE)
@@ -0,0 +1,112 @@
+# IMPORTS
+# import modules to time phases and write the log
+import io
+import json
+import os
+import time
+import timeit
+from collections import OrderedDict
+
+# lightweight phase timing and counters shared by all pySWECO commands
+# phases are sequential: starting a phase ends the previous one
+#     perf = PerfRecorder("Inspect Grids")
+#     perf.phase("collection")
+#     ...
+#     perf.count("grids", len(grids))
+#     perf.phase("output")
+#     ...
+#     perf.finish(output)
+# every finished run is appended to a local JSON Lines log; with the debug switch on the timings are also
+# printed under the report
+
+# environment variable that turns the debug print on without Ctrl+Click
+DEBUG_ENV_VAR = "PYSWECO_PERF_DEBUG"
+
+# 1) create a function that returns the path of the local JSON Lines log
+def default_log_path():
+	root = os.environ.get("APPDATA") or os.path.expanduser("~")
+	return os.path.join(root, "pySWECO", "perf_log.jsonl")
+
+# 2) create a function that checks the hidden debug switch: pyRevit debug mode (Ctrl+Click) or the environment variable
+def debug_enabled():
+	if os.environ.get(DEBUG_ENV_VAR, "").strip() not in ("", "0"):
+		return True
+	try:
+		from pyrevit import EXEC_PARAMS
+		return bool(EXEC_PARAMS.debug_mode)
+	except Exception:
+		return False
+
+class PerfRecorder(object):
+
+	def __init__(self, command, clock=timeit.default_timer):
+		self.command  = command
+		self.clock    = clock
+		self.phases   = OrderedDict()
+		self.counts   = OrderedDict()
+		self._started = clock()
+		self._current = None
+		self._since   = None
+		self._ended   = None
+		self.finished = False
+
+	# end the current phase (if any) and start a new one; time of a repeated phase name is added up
+	def phase(self, name):
+		now = self.clock()
+		self._close(now)
+		self._current = name
+		self._since   = now
+
+	def _close(self, now):
+		if self._current is not None:
+			self.phases[self._current] = self.phases.get(self._current, 0.0) + now - self._since
+			self._current = None
+
+	# add to a named counter (elements collected, elements updated, ...)
+	def count(self, name, value=1):
+		self.counts[name] = self.counts.get(name, 0) + value
+
+	def total(self):
+		if self._ended is not None:
+			return self._ended - self._started
+		return self.clock() - self._started
+
+	def record(self):
+		return OrderedDict([
+			("command",   self.command),
+			("timestamp", time.strftime("%Y-%m-%dT%H:%M:%S")),
+			("total_s",   round(self.total(), 4)),
+			("phases_s",  OrderedDict((name, round(seconds, 4)) for name, seconds in self.phases.items())),
+			("counts",    self.counts)
+			])
+
+	# rows for a two column table of the debug print
+	def rows(self):
+		rows = [[name, "{:.3f} s".format(seconds)] for name, seconds in self.phases.items()]
+		rows.append(["<b>total</b>", "<b>{:.3f} s</b>".format(self.total())])
+		rows.extend([[name, str(value)] for name, value in self.counts.items()])
+		return rows
+
+	# append the run to the log; the log is best effort and never fails the command
+	def write_log(self, path=None):
+		path = path or default_log_path()
+		try:
+			folder = os.path.dirname(path)
+			if folder and not os.path.isdir(folder):
+				os.makedirs(folder)
+			with io.open(path, "a", encoding="utf-8") as stream:
+				stream.write(u"{}\n".format(json.dumps(self.record())))
+			return True
+		except (IOError, OSError):
+			return False
+
+	# end the last phase, write the log and print the timings under the report if the debug switch is on
+	def finish(self, output=None, log_path=None):
+		if self.finished:
+			return
+		self._ended   = self.clock()
+		self._close(self._ended)
+		self.finished = True
+		self.write_log(log_path)
+		if output is not None and debug_enabled():
+			output.print_table(self.rows(), columns = ["PHASE / COUNTER", "VALUE"], title = "{} PERFORMANCE".format(self.command.upper()))
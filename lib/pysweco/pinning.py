@@ -0,0 +1,93 @@
+# IMPORTS
+# import counter and ordered dictionary
+from collections import Counter, OrderedDict
+
+# pin results used by the batch and multi-category pin commands
+# every pin run (one document, one transaction) keeps its counts per datum kind, the summary table is one row
+# per document and datum kind
+
+# status of a pin run
+STATUS_PINNED   = "Pinned"
+STATUS_NOTHING  = "Nothing to pin"
+STATUS_BLOCKED  = "All blocked"
+STATUS_SKIPPED  = "Skipped"
+STATUS_FAILED   = "Failed"
+
+# columns of the summary table
+SUMMARY_COLUMNS = ["Document", "Category", "Total", "Un-Pinned", "Pinned Now", "Skipped (Blocked)", "Status"]
+
+# result of one pin run
+class PinResult(object):
+
+	def __init__(self, document, specs):
+		self.document = document
+		self.specs    = specs
+		self.total    = Counter()
+		self.unpinned = Counter()
+		self.blocked  = Counter()
+		self.pinned   = Counter()
+		self.blocked_elements = []
+		self.blocked_by_kind  = OrderedDict((spec.key, []) for spec in specs)
+		self.status   = STATUS_NOTHING
+		self.message  = None
+
+	@property
+	def pinned_count(self):
+		return sum(self.pinned.values())
+
+	@property
+	def blocked_count(self):
+		return sum(self.blocked.values())
+
+	# status text of the summary table, with the reason of a skipped or failed run
+	def status_text(self):
+		if self.message:
+			return "{}: {}".format(self.status, self.message)
+		return self.status
+
+	# summary table rows: one row per datum kind
+	def rows(self):
+		return [[self.document, spec.label, self.total[spec.key], self.unpinned[spec.key], self.pinned[spec.key],
+				 self.blocked[spec.key], self.status_text()] for spec in self.specs]
+
+# 1) create a function that records the datums of one run, groups is datum kind key -> [(element, pinned)]
+#    returns the un-pinned elements as (datum kind key, element) pairs
+def count_groups(result, groups):
+	unpinned = []
+	for key, items in groups.items():
+		for element, pinned in items:
+			result.total[key] += 1
+			if not pinned:
+				result.unpinned[key] += 1
+				unpinned.append((key, element))
+	return unpinned
+
+# 2) create a function that records the blocked and the pinned elements of one run, key(element) returns the datum kind key
+def record_outcome(result, blocked, pinned, key):
+	result.blocked_elements = list(blocked)
+	for item in result.blocked_elements:
+		result.blocked[key(item.element)] += 1
+		result.blocked_by_kind[key(item.element)].append(item)
+	for element in pinned:
+		result.pinned[key(element)] += 1
+	if pinned:
+		result.status = STATUS_PINNED
+	elif blocked:
+		result.status = STATUS_BLOCKED
+
+# 3) create a function that returns the summary table rows of several runs with a total row per datum kind
+def summary_rows(results):
+	rows   = []
+	totals = OrderedDict()
+	for result in results:
+		rows.extend(result.rows())
+		for spec in result.specs:
+			total = totals.setdefault(spec.label, [0, 0, 0, 0])
+			total[0] += result.total[spec.key]
+			total[1] += result.unpinned[spec.key]
+			total[2] += result.pinned[spec.key]
+			total[3] += result.blocked[spec.key]
+	if len(results) > 1:
+		for label, total in totals.items():
+			rows.append(["<b>All documents</b>", label] + total + ["-"])
+	return rows
@@ -0,0 +1,91 @@
+# buffered html report for the pyRevit output window
+# the whole report is collected into one html document with a shared stylesheet and written in a few
+# print_html calls instead of one print_md call per line; sections can be collapsed with a click
+
+# SWECO report stylesheet, added once per report
+REPORT_STYLE = "\n".join([
+	"body { color: black; background-color: white; font-size: 14px; font-family: Arial }",
+	".sw-report { font-family: Arial; color: black }",
+	".sw-line { white-space: pre; font-family: Arial; color: black; margin: 2px 0 }",
+	".sw-title { cursor: pointer }",
+	".sw-title:hover { text-decoration: underline }",
+	".sw-h0 { font-weight: bold; font-size: 15px; margin-top: 10px }",
+	".sw-h1 { font-size: 15px; padding-left: 2ch }",
+	".sw-h2 { font-size: 14.5px; padding-left: 4ch }",
+	".sw-h3 { font-size: 13.5px; padding-left: 6ch }",
+	".sw-h4 { font-size: 12.5px; padding-left: 8ch }",
+	".sw-note { font-size: 12.5px; padding-left: 3ch }"
+	])
+
+# bullets used for every nesting level, same symbols as the original inspector output
+BULLETS = {
+	1: "&#9654;",
+	2: "&#9658;",
+	3: "&#9675;",
+	4: "&#9679;"
+	}
+
+# toggles the body of a section, written inline so it works in the IE based output window
+_TOGGLE = "var b=this.nextSibling;b.style.display=(b.style.display=='none')?'':'none';"
+
+# 1) create a function that escapes text for html output
+def escape(text):
+	text = u"{}".format(text)
+	return text.replace(u"&", u"&amp;").replace(u"<", u"&lt;").replace(u">", u"&gt;").replace(u'"', u"&quot;")
+
+# report builder
+# lines are buffered and written once the buffer reaches chunk_size lines and no section is open,
+# so a section is never split between two writes of the output window
+class ReportBuilder(object):
+
+	def __init__(self, output, chunk_size=2000):
+		self.output     = output
+		self.chunk_size = chunk_size
+		self.writes     = 0
+		self._lines     = []
+		self._depth     = 0
+		self._styled    = False
+
+	def _append(self, html):
+		if not self._styled:
+			self.output.add_style(REPORT_STYLE)
+			self._styled = True
+		self._lines.append(html)
+		if self._depth == 0 and len(self._lines) >= self.chunk_size:
+			self.flush()
+
+	def _label(self, text, level):
+		bullet = BULLETS.get(level)
+		if bullet:
+			return u"{} {}".format(bullet, escape(text))
+		return escape(text)
+
+	# plain line, level 0 is the workset heading, 1-4 are the nested levels with their bullets
+	def line(self, text, level=0):
+		self._append(u"<div class='sw-line sw-h{}'>{}</div>".format(level, self._label(text, level)))
+
+	def note(self, text):
+		self._append(u"<div class='sw-line sw-note'>{}</div>".format(escape(text)))
+
+	def rule(self):
+		self._append(u"<hr>")
+
+	# collapsible section with a clickable title line, closed with end_section()
+	def start_section(self, text, level=0, collapsed=False):
+		self._depth += 1
+		self._append(
+			u"<div class='sw-section'>"
+			u"<div class='sw-line sw-title sw-h{}' onclick=\"{}\">{}</div>"
+			u"<div class='sw-body'{}>".format(level, _TOGGLE, self._label(text, level), u" style='display:none'" if collapsed else u"")
+			)
+
+	def end_section(self):
+		self._depth -= 1
+		self._append(u"</div></div>")
+
+	# write the buffered lines to the output window
+	def flush(self):
+		if self._lines:
+			self.output.print_html(u"<div class='sw-report'>{}</div>".format(u"".join(self._lines)))
+			self.writes += 1
+			self._lines = []
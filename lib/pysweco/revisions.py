@@ -0,0 +1,156 @@
+# IMPORTS
+# import ordered dict for the dry run summary
+from collections import OrderedDict
+# import pySWECO library
+from pysweco.patterns import compile_pattern
+
+# bulk revision engine used by Set Revision to Sheet(s)
+# every sheet is read once into a SheetRecord, the requested change is diffed against it
+# and only the sheets that actually change are written
+
+# actions
+ACTION_ADD    = "add"
+ACTION_REMOVE = "remove"
+
+# sheet state read once from the model: additional revision ids in sheet order and approver field
+class SheetRecord(object):
+	__slots__ = ("sheet_id", "number", "name", "revision_ids", "approver")
+
+	def __init__(self, sheet_id, number, name, revision_ids, approver=None):
+		self.sheet_id     = sheet_id
+		self.number       = number
+		self.name         = name
+		self.revision_ids = tuple(revision_ids)
+		self.approver     = approver
+
+# planned change of one sheet
+class SheetChange(object):
+	__slots__ = ("sheet", "revision_ids", "approver")
+
+	def __init__(self, sheet, revision_ids, approver):
+		self.sheet        = sheet
+		self.revision_ids = tuple(revision_ids)
+		self.approver     = approver
+
+	@property
+	def added(self):
+		return [r for r in self.revision_ids if r not in self.sheet.revision_ids]
+
+	@property
+	def removed(self):
+		return [r for r in self.sheet.revision_ids if r not in self.revision_ids]
+
+	@property
+	def revisions_changed(self):
+		return self.revision_ids != self.sheet.revision_ids
+
+	@property
+	def approver_changed(self):
+		return self.approver != (self.sheet.approver or "")
+
+# SELECTION
+# 1) create a function that selects the sheets whose number or name matches a pattern
+def select_by_pattern(sheets, pattern):
+	regex = compile_pattern(pattern)
+	if regex is None:
+		return []
+	return [s for s in sheets if regex.match(s.number or "") or regex.match(s.name or "")]
+
+# 2) create a function that selects the sheets of a sheet set (set of sheet ids)
+def select_by_ids(sheets, sheet_ids):
+	sheet_ids = frozenset(sheet_ids)
+	return [s for s in sheets if s.sheet_id in sheet_ids]
+
+# 3) create a function that selects the sheets whose title block parameter value matches a pattern
+#    values maps sheet id -> parameter value of the title block placed on the sheet
+def select_by_values(sheets, values, pattern):
+	regex = compile_pattern(pattern)
+	if regex is None:
+		return []
+	return [s for s in sheets if regex.match(u"{}".format(values.get(s.sheet_id, "")))]
+
+# DIFF
+# 4) create a function that plans the changes of the selected sheets, unchanged sheets are left out
+#    approver None leaves the approver field as it is, a string (empty string clears it) sets it
+def plan_changes(sheets, revision_ids, action, approver=None):
+	revision_ids = list(revision_ids)
+	requested    = frozenset(revision_ids)
+	changes      = []
+	for sheet in sheets:
+		current = sheet.revision_ids
+		if action == ACTION_ADD:
+			present = frozenset(current)
+			after   = current + tuple(r for r in revision_ids if r not in present)
+		elif action == ACTION_REMOVE:
+			after   = tuple(r for r in current if r not in requested)
+		else:
+			raise ValueError("Unknown action: {}".format(action))
+		change = SheetChange(sheet, after, (sheet.approver or "") if approver is None else approver)
+		if change.revisions_changed or change.approver_changed:
+			changes.append(change)
+	return changes
+
+# 5) create a function that summarizes the planned changes (dry run)
+def summarize(selected, changes):
+	return OrderedDict([
+		("selected",          len(selected)),
+		("changed",           len(changes)),
+		("unchanged",         len(selected) - len(changes)),
+		("revisions added",   sum(len(c.added) for c in changes)),
+		("revisions removed", sum(len(c.removed) for c in changes)),
+		("approvers updated", sum(1 for c in changes if c.approver_changed))
+		])
+
+# MATRIX
+# sources of a revision on a sheet
+SOURCE_ADDITIONAL = "additional"
+SOURCE_CLOUD      = "cloud"
+
+# matrix cell marks: A = additional revision, C = revision cloud on the sheet or on a view placed on it
+MARKS = {
+	frozenset([SOURCE_ADDITIONAL]):               "A",
+	frozenset([SOURCE_CLOUD]):                    "C",
+	frozenset([SOURCE_ADDITIONAL, SOURCE_CLOUD]): "A+C"
+	}
+
+# sheet x revision matrix indexed both ways: sheet -> revisions (with their sources) and revision -> sheets
+class RevisionMatrix(object):
+
+	def __init__(self):
+		self.by_sheet    = {}
+		self.by_revision = {}
+
+	def add(self, sheet_id, revision_id, source):
+		self.by_sheet.setdefault(sheet_id, {}).setdefault(revision_id, set()).add(source)
+		self.by_revision.setdefault(revision_id, set()).add(sheet_id)
+
+	# revision id -> sources of the revisions on a sheet
+	def revisions(self, sheet_id):
+		return self.by_sheet.get(sheet_id, {})
+
+	# sheets carrying a revision
+	def sheets(self, revision_id):
+		return self.by_revision.get(revision_id, frozenset())
+
+	# cell mark of a sheet and revision, empty if the revision is not on the sheet
+	def mark(self, sheet_id, revision_id):
+		sources = self.revisions(sheet_id).get(revision_id)
+		if not sources:
+			return ""
+		return MARKS[frozenset(sources)]
+
+	# matrix rows [sheet number, sheet name, mark of every revision] in the given sheet and revision order
+	def rows(self, sheets, revision_ids):
+		for sheet in sheets:
+			yield [sheet.number, sheet.name] + [self.mark(sheet.sheet_id, r) for r in revision_ids]
+
+# 6) create a function that builds the matrix from the sheet records (additional revisions)
+#    and (sheet id, revision id) pairs of the revision clouds
+def build_revision_matrix(sheets, cloud_revisions):
+	matrix = RevisionMatrix()
+	for sheet in sheets:
+		for revision_id in sheet.revision_ids:
+			matrix.add(sheet.sheet_id, revision_id, SOURCE_ADDITIONAL)
+	for sheet_id, revision_id in cloud_revisions:
+		matrix.add(sheet_id, revision_id, SOURCE_CLOUD)
+	return matrix
@@ -0,0 +1,19 @@
+# revit bound helpers (collectors, readers, transactions) for the pySWECO pushbuttons
+
+# 1) create a function that returns the integer value of an ElementId
+#    ElementId.IntegerValue is replaced by ElementId.Value in Revit 2024 and later
+def id_value(element_id):
+	value = getattr(element_id, "Value", None)
+	if value is None:
+		value = element_id.IntegerValue
+	return value
+
+# 2) create a function that returns the ElementId of an integer value
+#    Revit 2024 and later take a 64 bit value, older versions a 32 bit value
+def element_id(value):
+	from System import Int64
+	from pyrevit import DB
+	try:
+		return DB.ElementId(Int64(value))
+	except TypeError:
+		return DB.ElementId(int(value))
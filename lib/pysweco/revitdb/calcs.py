@@ -0,0 +1,100 @@
+# IMPORTS
+# import ordered dictionary, .NET generic list and types
+from collections import OrderedDict
+import clr
+from System import Guid, String, Type
+from System.Collections.Generic import List
+# import Revit & pyrevit libraries
+from Autodesk.Revit.DB.Mechanical import MechanicalSystemType, SystemCalculationLevel
+from Autodesk.Revit.DB.Plumbing import PipingSystemType
+from Autodesk.Revit.DB.ExtensibleStorage import AccessLevel, Entity, Schema, SchemaBuilder
+from pyrevit import DB
+# import pySWECO library
+from pysweco.calcs import KIND_DUCT, KIND_PIPE, MODE_NONE, MODE_FLOW, MODE_ALL, MODE_PERFORMANCE, SystemTypeRecord
+from pysweco.revitdb import id_value
+
+# kind and calculation parameter of every system type class, resolved once per class
+# (no more comparison of the family name with the English "Duct System" / "Piping System")
+SYSTEM_TYPE_CLASSES = OrderedDict([
+	(MechanicalSystemType, (KIND_DUCT, DB.BuiltInParameter.RBS_DUCT_SYSTEM_CALCULATION_PARAM)),
+	(PipingSystemType,     (KIND_PIPE, DB.BuiltInParameter.RBS_PIPE_SYSTEM_CALCULATION_PARAM))
+	])
+
+# 1) create a function that returns mode name -> integer value of the SystemCalculationLevel members of this
+#    Revit version ("None" cannot be written as an attribute in IronPython)
+def mode_values():
+	values = OrderedDict()
+	for name in (MODE_NONE, MODE_FLOW, MODE_ALL, MODE_PERFORMANCE):
+		member = getattr(SystemCalculationLevel, name, None)
+		if member is not None:
+			values[name] = int(member)
+	return values
+
+# 2) create a function that returns the kind and calculation parameter of a system type by its class
+def calc_parameter(system_type):
+	for system_class, (kind, builtin_parameter) in SYSTEM_TYPE_CLASSES.items():
+		if isinstance(system_type, system_class):
+			return kind, system_type.get_Parameter(builtin_parameter)
+	return None, None
+
+# 3) create a function that collects duct and pipe system types with one collector
+def collect_system_types(doc):
+	classes = List[Type]([clr.GetClrType(system_class) for system_class in SYSTEM_TYPE_CLASSES])
+	return list(DB.FilteredElementCollector(doc).\
+				WherePasses(DB.ElementMulticlassFilter(classes)).\
+				WhereElementIsElementType().\
+				ToElements())
+
+# 4) create a function that reads a system type once: name, kind and calculation mode
+def read_system_type(system_type):
+	kind, parameter = calc_parameter(system_type)
+	return SystemTypeRecord(
+		id_value(system_type.Id),
+		system_type.get_Parameter(DB.BuiltInParameter.SYMBOL_NAME_PARAM).AsString(),
+		kind,
+		parameter.AsInteger() if parameter is not None else None
+		)
+
+# 5) create a function that reads the calculation mode of a system type after commit
+def read_mode(system_type):
+	return calc_parameter(system_type)[1].AsInteger()
+
+# 6) create a function that writes the planned changes, types_by_id is type id -> system type
+def apply_mode_changes(changes, types_by_id):
+	for change in changes:
+		calc_parameter(types_by_id[change.record.type_id])[1].Set(change.mode)
+
+# PROFILE STORAGE
+# calculation mode profiles are stored in an extensible storage entity of the project information
+PROFILES_SCHEMA_GUID = "6f1d7c52-3b8e-4f0a-9a57-2c4e8d1b9a31"
+PROFILES_SCHEMA_NAME = "pySWECOCalcsProfiles"
+PROFILES_FIELD       = "Profiles"
+
+# 7) create a function that returns the profiles schema, it is created the first time
+def profiles_schema():
+	guid   = Guid(PROFILES_SCHEMA_GUID)
+	schema = Schema.Lookup(guid)
+	if schema is None:
+		builder = SchemaBuilder(guid)
+		builder.SetSchemaName(PROFILES_SCHEMA_NAME)
+		builder.SetReadAccessLevel(AccessLevel.Public)
+		builder.SetWriteAccessLevel(AccessLevel.Public)
+		builder.AddSimpleField(PROFILES_FIELD, String)
+		schema = builder.Finish()
+	return schema
+
+# 8) create a function that reads the stored profiles text of a document, empty text if none are stored
+def read_profiles_text(doc):
+	schema = Schema.Lookup(Guid(PROFILES_SCHEMA_GUID))
+	if schema is None:
+		return ""
+	entity = doc.ProjectInformation.GetEntity(schema)
+	if entity is None or not entity.IsValid():
+		return ""
+	return entity.Get[String](PROFILES_FIELD) or ""
+
+# 9) create a function that writes the profiles text to a document, must run inside a transaction
+def write_profiles_text(doc, text):
+	entity = Entity(profiles_schema())
+	entity.Set[String](PROFILES_FIELD, text)
+	doc.ProjectInformation.SetEntity(entity)
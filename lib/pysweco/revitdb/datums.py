@@ -0,0 +1,153 @@
+# IMPORTS
+# import ordered dictionary and .NET generic list
+from collections import OrderedDict
+from System.Collections.Generic import List
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.datums import GRIDS, LEVELS, REFERENCE_PLANES, SCOPE_BOXES, REVIT_LINKS, CAD_IMPORTS, DatumRecord, inspect_datums
+from pysweco.levels import build_level_usage
+from pysweco.overlaps import arc_grid, line_grid
+from pysweco.revitdb import id_value
+
+# COLLECTORS
+# 1) create functions that return the collector of every datum kind
+def _by_class(revit_class):
+	return lambda doc: DB.FilteredElementCollector(doc).OfClass(revit_class).WhereElementIsNotElementType()
+
+def _by_category(builtin_category):
+	return lambda doc: DB.FilteredElementCollector(doc).OfCategory(builtin_category).WhereElementIsNotElementType()
+
+_COLLECTORS = {
+	GRIDS.key:            _by_class(DB.Grid),
+	LEVELS.key:           _by_class(DB.Level),
+	REFERENCE_PLANES.key: _by_class(DB.ReferencePlane),
+	SCOPE_BOXES.key:      _by_category(DB.BuiltInCategory.OST_VolumeOfInterest)
+	}
+
+# 2) create a function that collects all datums of a kind in a document
+def collect_datums(doc, spec):
+	return list(_COLLECTORS[spec.key](doc).ToElements())
+
+# 3) create a function that collects the datums of several kinds with one collector
+#    returns datum kind key -> elements, in the order of the specs
+_CATEGORIES = {
+	GRIDS.key:            DB.BuiltInCategory.OST_Grids,
+	LEVELS.key:           DB.BuiltInCategory.OST_Levels,
+	REFERENCE_PLANES.key: DB.BuiltInCategory.OST_CLines,
+	SCOPE_BOXES.key:      DB.BuiltInCategory.OST_VolumeOfInterest,
+	REVIT_LINKS.key:      DB.BuiltInCategory.OST_RvtLinks
+	}
+
+# element classes of the kinds whose category also holds other elements (e.g. multi-segment grids)
+# kinds without a category are collected by class: imported CAD takes the category of its file
+_CLASSES = {
+	GRIDS.key:            DB.Grid,
+	LEVELS.key:           DB.Level,
+	REFERENCE_PLANES.key: DB.ReferencePlane,
+	REVIT_LINKS.key:      DB.RevitLinkInstance,
+	CAD_IMPORTS.key:      DB.ImportInstance
+	}
+
+# one filter for all kinds: a multi-category filter, or-ed with the class filters of the kinds without a category
+def _groups_filter(specs):
+	categories = [_CATEGORIES[spec.key] for spec in specs if spec.key in _CATEGORIES]
+	filters    = [DB.ElementClassFilter(_CLASSES[spec.key]) for spec in specs if spec.key not in _CATEGORIES]
+	if categories:
+		filters.insert(0, DB.ElementMulticategoryFilter(List[DB.BuiltInCategory](categories)))
+	if len(filters) == 1:
+		return filters[0]
+	return DB.LogicalOrFilter(List[DB.ElementFilter](filters))
+
+def collect_datum_groups(doc, specs):
+	groups      = OrderedDict((spec.key, []) for spec in specs)
+	by_category = dict((int(_CATEGORIES[spec.key]), spec.key) for spec in specs if spec.key in _CATEGORIES)
+	by_class    = [(_CLASSES[spec.key], spec.key) for spec in specs if spec.key not in _CATEGORIES]
+	elements    = DB.FilteredElementCollector(doc).\
+				  WherePasses(_groups_filter(specs)).\
+				  WhereElementIsNotElementType()
+	for element in elements:
+		key = next((k for datum_class, k in by_class if isinstance(element, datum_class)), None)
+		if key is None and element.Category is not None:
+			key = by_category.get(id_value(element.Category.Id))
+		datum_class = _CLASSES.get(key)
+		if key is None or (datum_class is not None and not isinstance(element, datum_class)):
+			continue
+		groups[key].append(element)
+	return groups
+
+# READERS
+# 4) create a function that reads a datum once: name, pinned and monitored state and elevation of levels
+def read_datum(element):
+	return DatumRecord(id_value(element.Id), element.Name, element.Pinned, element.IsMonitoringLinkElement(), getattr(element, "Elevation", None))
+
+# 5) create a function that reads the plan geometry of a grid once, the name is taken from the datum record
+#    arc end points are swapped for clockwise arcs so that every arc runs counter-clockwise
+def read_grid_geometry(element, name):
+	curve = element.Curve
+	start, end = curve.GetEndPoint(0), curve.GetEndPoint(1)
+	if isinstance(curve, DB.Arc):
+		if curve.Normal.Z < 0:
+			start, end = end, start
+		return arc_grid(id_value(element.Id), name, (curve.Center.X, curve.Center.Y), curve.Radius, (start.X, start.Y), (end.X, end.Y))
+	return line_grid(id_value(element.Id), name, (start.X, start.Y), (end.X, end.Y))
+
+# level parameters read besides LevelId, resolved once; parameters missing in this Revit version are left out
+_LEVEL_PARAMETERS = [getattr(DB.BuiltInParameter, name) for name in (
+	"WALL_HEIGHT_TYPE",                    # wall top constraint
+	"FAMILY_BASE_LEVEL_PARAM",             # column / family base level
+	"FAMILY_TOP_LEVEL_PARAM",              # column / family top level
+	"INSTANCE_SCHEDULE_ONLY_LEVEL_PARAM",  # schedule level of hosted and face-based instances
+	"INSTANCE_REFERENCE_LEVEL_PARAM",      # reference level of structural framing
+	"RBS_START_LEVEL_PARAM",               # reference level of MEP curves
+	"STAIRS_BASE_LEVEL_PARAM",             # stair base level
+	"STAIRS_TOP_LEVEL_PARAM",              # stair top level
+	"STAIRS_RAILING_BASE_LEVEL_PARAM",     # railing base level
+	"ROOM_UPPER_LEVEL"                     # room upper limit
+	) if hasattr(DB.BuiltInParameter, name)]
+
+# view range planes of plan views
+_VIEW_RANGE_PLANES = [DB.PlanViewPlane.TopClipPlane, DB.PlanViewPlane.CutPlane, DB.PlanViewPlane.BottomClipPlane, DB.PlanViewPlane.ViewDepthPlane]
+
+# 6) create a function that reads the levels of an element once: (level ids, view name) for plan views (associated
+#    level and view range levels), (level ids, None) for model elements (LevelId and the level parameters)
+def read_level_reference(element):
+	level_ids = set()
+	if isinstance(element, DB.View):
+		if not isinstance(element, DB.ViewPlan) or element.IsTemplate:
+			return (level_ids, None)
+		if element.GenLevel is not None:
+			level_ids.add(id_value(element.GenLevel.Id))
+		try:
+			view_range = element.GetViewRange()
+			level_ids.update(id_value(view_range.GetLevelId(plane)) for plane in _VIEW_RANGE_PLANES)
+		except Exception:
+			pass
+		return (set(level_id for level_id in level_ids if level_id >= 0), element.Name)
+	level_ids.add(id_value(element.LevelId))
+	if isinstance(element, DB.MEPCurve) and element.ReferenceLevel is not None:
+		level_ids.add(id_value(element.ReferenceLevel.Id))
+	for builtin_parameter in _LEVEL_PARAMETERS:
+		parameter = element.get_Parameter(builtin_parameter)
+		if parameter is not None and parameter.StorageType == DB.StorageType.ElementId:
+			level_ids.add(id_value(parameter.AsElementId()))
+	return (set(level_id for level_id in level_ids if level_id >= 0), None)
+
+# 7) create a function that collects all elements and views once and builds the level usage index
+def collect_level_usage(doc):
+	elements = DB.FilteredElementCollector(doc).\
+			   WherePasses(DB.ElementClassFilter(DB.Level, True)).\
+			   WhereElementIsNotElementType()
+	return build_level_usage(elements, read_level_reference)
+
+# INSPECTION
+# 8) create a function that collects the datums of a kind and reads them once, shared by the inspect commands
+#    returns (elements, inspection), the inspection is None when the document has no datums of the kind
+def inspect_document_datums(doc, spec, perf):
+	perf.phase("collection")
+	elements = collect_datums(doc, spec)
+	if not elements:
+		return elements, None
+	perf.count(spec.label.lower(), len(elements))
+	perf.phase("parameter reads")
+	return elements, inspect_datums(elements, read_datum, spec)
@@ -0,0 +1,64 @@
+# IMPORTS
+# import .NET generic list
+from System.Collections.Generic import List
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.networks import KIND_CURVE, KIND_FITTING, KIND_ACCESSORY, build_network_index
+from pysweco.revitdb import id_value
+
+# kind and system type parameter of every network category
+_DUCT = DB.BuiltInParameter.RBS_DUCT_SYSTEM_TYPE_PARAM
+_PIPE = DB.BuiltInParameter.RBS_PIPING_SYSTEM_TYPE_PARAM
+
+NETWORK_CATEGORIES = [
+	(DB.BuiltInCategory.OST_DuctCurves,     KIND_CURVE,     _DUCT),
+	(DB.BuiltInCategory.OST_FlexDuctCurves, KIND_CURVE,     _DUCT),
+	(DB.BuiltInCategory.OST_DuctFitting,    KIND_FITTING,   _DUCT),
+	(DB.BuiltInCategory.OST_DuctAccessory,  KIND_ACCESSORY, _DUCT),
+	(DB.BuiltInCategory.OST_PipeCurves,     KIND_CURVE,     _PIPE),
+	(DB.BuiltInCategory.OST_FlexPipeCurves, KIND_CURVE,     _PIPE),
+	(DB.BuiltInCategory.OST_PipeFitting,    KIND_FITTING,   _PIPE),
+	(DB.BuiltInCategory.OST_PipeAccessory,  KIND_ACCESSORY, _PIPE)
+	]
+
+_BY_CATEGORY = dict((int(category), (kind, parameter)) for category, kind, parameter in NETWORK_CATEGORIES)
+
+# 1) create a function that returns the systems of an element as (system id, system name): the system of a duct /
+#    pipe curve, the distinct systems of the connectors of a fitting / accessory; names is system id -> name, the
+#    name of a system is read once
+def read_systems(element, names):
+	if isinstance(element, DB.MEPCurve):
+		systems = [element.MEPSystem]
+	else:
+		model   = getattr(element, "MEPModel", None)
+		manager = model.ConnectorManager if model is not None else None
+		systems = [connector.MEPSystem for connector in manager.Connectors] if manager is not None else []
+	items = []
+	for system in systems:
+		if system is None:
+			continue
+		system_id = id_value(system.Id)
+		if system_id not in names:
+			names[system_id] = system.Name
+		if (system_id, names[system_id]) not in items:
+			items.append((system_id, names[system_id]))
+	return items
+
+# 2) create a function that reads an element once: system type id, systems and kind
+def read_network_element(element, names):
+	kind, type_parameter = _BY_CATEGORY.get(id_value(element.Category.Id), (None, None))
+	if kind is None:
+		return None
+	system_type = element.get_Parameter(type_parameter)
+	type_id     = id_value(system_type.AsElementId()) if system_type is not None and system_type.HasValue else -1
+	return (type_id if type_id >= 0 else None, read_systems(element, names), kind)
+
+# 3) create a function that collects all network elements with one multi-category collector and builds the index
+def collect_network_index(doc):
+	categories = List[DB.BuiltInCategory]([category for category, _, _ in NETWORK_CATEGORIES])
+	elements   = DB.FilteredElementCollector(doc).\
+				 WherePasses(DB.ElementMulticategoryFilter(categories)).\
+				 WhereElementIsNotElementType()
+	names = {}
+	return build_network_index(elements, lambda element: read_network_element(element, names))
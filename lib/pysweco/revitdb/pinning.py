@@ -0,0 +1,91 @@
+# IMPORTS
+# import ordered dictionary
+from collections import OrderedDict
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.pinning import PinResult, STATUS_FAILED, STATUS_SKIPPED, count_groups, record_outcome
+from pysweco.revitdb import id_value
+from pysweco.revitdb.worksharing import precheck_elements, checkout_elements
+
+# 1) create a function that pins the un-pinned datums of one document in one transaction
+#    groups is datum kind key -> elements; pinned state is read once per element and the worksharing precheck
+#    runs once over all datum kinds, blocked elements are skipped and kept in the result; errors are kept in the
+#    result with STATUS_FAILED instead of being raised
+#    confirm(ready count, blocked elements per datum kind key) is asked before the checkout and the transaction,
+#    a run which is not confirmed is skipped
+def pin_datum_groups(doc, groups, specs, transaction_name, perf=None, confirm=None):
+	result = PinResult(doc.Title, specs)
+	unpinned = count_groups(result, OrderedDict((key, [(element, element.Pinned) for element in elements]) for key, elements in groups.items()))
+	if not unpinned:
+		return result
+	keys = dict((id_value(element.Id), key) for key, element in unpinned)
+	key  = lambda element: keys[id_value(element.Id)]
+
+	if perf is not None:
+		perf.phase("worksharing checks")
+	# a failing precheck or checkout fails this document only, the caller continues with the next one
+	try:
+		precheck = precheck_elements(doc, [element for _, element in unpinned])
+	except Exception as e:
+		result.status  = STATUS_FAILED
+		result.message = str(e)
+		return result
+
+	if confirm is not None and precheck.ready:
+		if perf is not None:
+			perf.phase("user input")
+		blocked_by_kind = OrderedDict((spec.key, []) for spec in specs)
+		for item in precheck.blocked:
+			blocked_by_kind[key(item.element)].append(item)
+		if not confirm(len(precheck.ready), blocked_by_kind):
+			record_outcome(result, precheck.blocked, [], key)
+			result.status  = STATUS_SKIPPED
+			result.message = "cancelled"
+			return result
+
+	if perf is not None:
+		perf.phase("checkout")
+	try:
+		checkout_elements(doc, precheck)
+	except Exception as e:
+		record_outcome(result, precheck.blocked, [], key)
+		result.status  = STATUS_FAILED
+		result.message = str(e)
+		return result
+	if not precheck.ready:
+		record_outcome(result, precheck.blocked, [], key)
+		return result
+
+	if perf is not None:
+		perf.phase("transaction")
+	t = DB.Transaction(doc, transaction_name)
+	try:
+		t.Start()
+		for element in precheck.ready:
+			element.Pinned = True
+		status = t.Commit()
+	except Exception as e:
+		if t.HasStarted() and not t.HasEnded():
+			t.RollBack()
+		record_outcome(result, precheck.blocked, [], key)
+		result.status  = STATUS_FAILED
+		result.message = str(e)
+		return result
+	# a transaction rolled back by the failure handling does not raise, nothing is pinned then
+	if status != DB.TransactionStatus.Committed:
+		record_outcome(result, precheck.blocked, [], key)
+		result.status  = STATUS_FAILED
+		result.message = "transaction status is {}".format(status)
+		return result
+	record_outcome(result, precheck.blocked, precheck.ready, key)
+	return result
+
+# columns of the blocked elements table of several documents
+BLOCKED_COLUMNS = ["Document", "Element Id", "Name", "Reason", "Owner"]
+
+# 2) create a function that returns the blocked elements table rows of several pin results
+#    elements of other documents cannot be linkified, the plain element id is listed
+def blocked_rows(results):
+	return [[result.document, id_value(b.element.Id), b.element.Name, b.reason, b.owner or "-"]
+			for result in results for b in result.blocked_elements]
@@ -0,0 +1,100 @@
+# IMPORTS
+# import .NET generic list and types
+import clr
+from System import Type
+from System.Collections.Generic import List
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.revitdb import id_value
+from pysweco.revisions import SheetRecord
+
+# COLLECTION
+# 1) create a function that collects all sheets of a document, placeholder sheets are skipped
+def collect_sheets(doc):
+	sheets = DB.FilteredElementCollector(doc).\
+			 OfClass(DB.ViewSheet).\
+			 WhereElementIsNotElementType().\
+			 ToElements()
+	return [sheet for sheet in sheets if not sheet.IsPlaceholder]
+
+# 2) create a function that reads one sheet into a SheetRecord, the additional revision ids are read once
+def read_sheet(sheet):
+	approver = sheet.get_Parameter(DB.BuiltInParameter.SHEET_APPROVED_BY)
+	return SheetRecord(
+		id_value(sheet.Id),
+		sheet.SheetNumber,
+		sheet.Name,
+		[id_value(revision_id) for revision_id in sheet.GetAdditionalRevisionIds()],
+		approver.AsString() if approver is not None else None
+		)
+
+# 3) create a function that returns the revisions of a document in sequence order
+def collect_revisions(doc):
+	return [doc.GetElement(revision_id) for revision_id in DB.Revision.GetAllRevisionIds(doc)]
+
+# 4) create a function that returns a readable label of a revision
+def revision_label(revision):
+	return "Seq. {} - {} - {} ({})".format(revision.SequenceNumber, revision.RevisionNumber, revision.Description, revision.RevisionDate)
+
+# 5) create a function that returns sheet set name -> set of sheet ids
+def sheet_sets(doc):
+	sets = {}
+	for sheet_set in DB.FilteredElementCollector(doc).OfClass(DB.ViewSheetSet):
+		sets[sheet_set.Name] = set(id_value(view.Id) for view in sheet_set.Views if isinstance(view, DB.ViewSheet))
+	return sets
+
+# 6) create a function that returns sheet id -> value of a title block parameter, from one title block collector
+def title_block_values(doc, parameter_name):
+	values = {}
+	title_blocks = DB.FilteredElementCollector(doc).\
+				   OfCategory(DB.BuiltInCategory.OST_TitleBlocks).\
+				   WhereElementIsNotElementType()
+	for title_block in title_blocks:
+		parameter = title_block.LookupParameter(parameter_name)
+		if parameter is None or not parameter.HasValue:
+			continue
+		value = parameter.AsString()
+		if value is None:
+			value = parameter.AsValueString()
+		values[id_value(title_block.OwnerViewId)] = value
+	return values
+
+# 7) create a function that collects sheets, revisions and revision clouds in one collector pass
+#    returns (sheets, revisions in sequence order, revision clouds), placeholder sheets are skipped
+def collect_revision_elements(doc):
+	classes  = [DB.ViewSheet, DB.Revision, DB.RevisionCloud]
+	elements = DB.FilteredElementCollector(doc).\
+			   WherePasses(DB.ElementMulticlassFilter(List[Type]([clr.GetClrType(c) for c in classes]))).\
+			   WhereElementIsNotElementType()
+	sheets, revisions, clouds = [], [], []
+	for element in elements:
+		if isinstance(element, DB.ViewSheet):
+			if not element.IsPlaceholder:
+				sheets.append(element)
+		elif isinstance(element, DB.Revision):
+			revisions.append(element)
+		elif isinstance(element, DB.RevisionCloud):
+			clouds.append(element)
+	revisions.sort(key=lambda revision: revision.SequenceNumber)
+	return sheets, revisions, clouds
+
+# 8) create a function that yields (sheet id, revision id) of every sheet a revision cloud shows on,
+#    clouds drawn on a sheet or on a view placed on sheets
+def iter_cloud_revisions(clouds):
+	for cloud in clouds:
+		revision_id = id_value(cloud.RevisionId)
+		for sheet_id in cloud.GetSheetIds():
+			yield id_value(sheet_id), revision_id
+
+# APPLY
+# 9) create a function that writes planned changes; must run inside an open transaction
+#    sheets maps sheet id -> ViewSheet, revisions maps revision id -> ElementId
+def apply_changes(changes, sheets, revisions):
+	for change in changes:
+		sheet = sheets[change.sheet.sheet_id]
+		if change.revisions_changed:
+			sheet.SetAdditionalRevisionIds(List[DB.ElementId]([revisions[r] for r in change.revision_ids]))
+		if change.approver_changed:
+			sheet.get_Parameter(DB.BuiltInParameter.SHEET_APPROVED_BY).Set(change.approver)
+	return len(changes)
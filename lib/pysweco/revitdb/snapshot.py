@@ -0,0 +1,131 @@
+# IMPORTS
+# import .NET Guid
+from System import Guid
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.revitdb import id_value, element_id as to_element_id
+from pysweco.revitdb.worksets import RevitElementReader, _system_type_parameter, collect_model_element_ids, is_nested_family
+from pysweco.snapshot import Snapshot
+from pysweco.worksets import classify_element
+
+# change detection strategies, reported under the inspection results
+STRATEGY_FULL            = "full classification"
+STRATEGY_CHANGED_ELEMENTS = "changed elements since last snapshot"
+STRATEGY_ELEMENT_VERSION = "element version comparison"
+
+# 1) create a function that returns the document version guid (Revit 2023 and later), otherwise None
+def document_version(doc):
+	try:
+		return DB.Document.GetDocumentVersion(doc).VersionGUID.ToString()
+	except Exception:
+		return None
+
+# 2) create a function that returns the version guid of an element (Revit 2023 and later), otherwise None
+def element_version(element):
+	version = getattr(element, "VersionGuid", None)
+	if version is None:
+		return None
+	return version.ToString()
+
+# 3) create a function that returns (created or modified ids, deleted ids) since a document version
+#    returns None if Revit cannot report the changes (older Revit, unknown or foreign version)
+def changed_element_ids(doc, version):
+	try:
+		changes = doc.GetChangedElements(Guid(version))
+	except Exception:
+		return None
+	touched = list(changes.GetCreatedElementIds()) + list(changes.GetModifiedElementIds())
+	return touched, list(changes.GetDeletedElementIds())
+
+# REFERENCES
+# kinds of the stored name references
+REF_TYPE   = "type"
+REF_SYSTEM = "system"
+
+# reader used for the snapshot: type and system type are stored as [kind, element id] references instead of
+# their formatted names; elements without type / system type keep the formatted name
+class RevitReferenceReader(RevitElementReader):
+
+	def family_type(self, element):
+		type_id = element.GetTypeId()
+		if type_id == DB.ElementId.InvalidElementId:
+			return RevitElementReader.family_type(self, element)
+		return [REF_TYPE, id_value(type_id)]
+
+	def system_type(self, element):
+		parameter = _system_type_parameter(element)
+		if parameter is None or id_value(parameter.AsElementId()) < 0:
+			return RevitElementReader.system_type(self, element)
+		return [REF_SYSTEM, id_value(parameter.AsElementId())]
+
+# 4) create a function that reads the current name of a referenced type / system type, None if it was deleted
+def _reference_name(doc, kind, value):
+	element = doc.GetElement(to_element_id(value))
+	if element is None:
+		return None
+	if kind == REF_TYPE:
+		parameter = element.get_Parameter(DB.BuiltInParameter.SYMBOL_FAMILY_AND_TYPE_NAMES_PARAM)
+	else:
+		parameter = element.get_Parameter(DB.BuiltInParameter.SYMBOL_NAME_PARAM)
+	return parameter.AsString() if parameter is not None else None
+
+# 5) create a function that returns the resolver of the stored references, names are memoized in the cache of the
+#    element reader under the same keys as the names read from the instances
+def reference_resolver(doc, cache):
+	def resolve(value):
+		if isinstance(value, (list, tuple)):
+			kind, reference = value
+			return cache.resolve((kind, reference), _reference_name, doc, kind, reference)
+		return value
+	return resolve
+
+# 6) create a function that classifies one element into the snapshot, deleted elements are dropped
+#    element types, nested families and unreported categories keep a skipped record with their version
+def _reclassify(snapshot, key, element, reader, kinds):
+	if element is None:
+		snapshot.remove([key])
+	elif isinstance(element, DB.ElementType) or is_nested_family(element):
+		snapshot.update(key, reader.workset(element), element_version(element), None)
+	else:
+		snapshot.update(key, reader.workset(element), element_version(element), classify_element(element, reader, kinds))
+
+# 7) create a function that brings the snapshot up to date with the model and returns (snapshot, strategy, reclassified count)
+#    a) changed elements reported by Revit since the snapshot document version: only those are reclassified;
+#       the document version changes on save / synchronize only, so it is used when there are no unsaved changes
+#    b) element version data: every reported element is compared to its stored version, only changed ones are reclassified
+#    c) no snapshot or no version data: every reported element is classified
+#    the snapshot is classified with a reference reader sharing the cache of reader
+def refresh_snapshot(doc, snapshot, reader, kinds):
+	reader          = RevitReferenceReader(reader.cache)
+	current_version = document_version(doc)
+	reclassified    = 0
+	changes         = None
+	if snapshot is not None and snapshot.document_version and not doc.IsModified:
+		changes = changed_element_ids(doc, snapshot.document_version)
+	if changes is not None:
+		strategy         = STRATEGY_CHANGED_ELEMENTS
+		touched, deleted = changes
+		snapshot.remove([id_value(element_id) for element_id in deleted])
+		for element_id in touched:
+			_reclassify(snapshot, id_value(element_id), doc.GetElement(element_id), reader, kinds)
+			reclassified += 1
+	elif snapshot is not None and snapshot.records and current_version is not None:
+		strategy = STRATEGY_ELEMENT_VERSION
+		current  = set()
+		for element_id in collect_model_element_ids(doc):
+			key     = id_value(element_id)
+			element = doc.GetElement(element_id)
+			current.add(key)
+			if snapshot.version(key) != element_version(element):
+				_reclassify(snapshot, key, element, reader, kinds)
+				reclassified += 1
+		snapshot.remove([key for key in list(snapshot.records) if key not in current])
+	else:
+		strategy = STRATEGY_FULL
+		snapshot = Snapshot()
+		for element_id in collect_model_element_ids(doc):
+			_reclassify(snapshot, id_value(element_id), doc.GetElement(element_id), reader, kinds)
+			reclassified += 1
+	snapshot.document_version = current_version
+	return snapshot, strategy, reclassified
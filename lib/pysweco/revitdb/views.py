@@ -0,0 +1,99 @@
+# IMPORTS
+# import .NET generic list and types
+import clr
+from System import Type
+from System.Collections.Generic import List
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.revitdb import id_value
+from pysweco.views import ViewRecord, build_placement_index, chunks
+
+# READERS
+# reader used by pysweco.views to read revit views, no parameter reads
+class RevitViewReader(object):
+
+	def is_template(self, view):
+		return view.IsTemplate
+
+	def view_type(self, view):
+		return str(view.ViewType)
+
+	def view_id(self, view):
+		return id_value(view.Id)
+
+	def is_revision_schedule(self, view):
+		return getattr(view, "IsTitleblockRevisionSchedule", False)
+
+# PLACEMENT
+# 1) create a function that yields (view id, sheet id) of every viewport and schedule on a sheet
+#    viewports and schedule sheet instances are collected in one collector pass,
+#    title block revision schedules are skipped
+def iter_sheet_placements(doc):
+	placement_filter = DB.ElementMulticlassFilter(List[Type]([clr.GetClrType(DB.Viewport), clr.GetClrType(DB.ScheduleSheetInstance)]))
+	for placement in DB.FilteredElementCollector(doc).WherePasses(placement_filter):
+		if isinstance(placement, DB.Viewport):
+			yield id_value(placement.ViewId), id_value(placement.SheetId)
+		elif not placement.IsTitleblockRevisionSchedule:
+			yield id_value(placement.ScheduleId), id_value(placement.OwnerViewId)
+
+# 2) create a function that returns the sheet placement index of a document
+def sheet_placement_index(doc):
+	return build_placement_index(iter_sheet_placements(doc))
+
+# CLEANUP
+# 3) create a function that reads every view of a document once into a ViewRecord
+def collect_view_records(doc):
+	records = []
+	for view in DB.FilteredElementCollector(doc).OfClass(DB.View).WhereElementIsNotElementType():
+		primary_id = view.GetPrimaryViewId()
+		records.append(ViewRecord(
+			id_value(view.Id),
+			view.Name,
+			str(view.ViewType),
+			view.IsTemplate,
+			id_value(primary_id) if primary_id != DB.ElementId.InvalidElementId else None,
+			getattr(view, "IsTitleblockRevisionSchedule", False)
+			))
+	return records
+
+# 4) create a function that deletes elements in chunks: one transaction (one regeneration) per chunk inside
+#    a transaction group that is assimilated into a single undo step
+#    elements already deleted with an earlier element (e.g. dependent views of a deleted view) are counted as deleted
+#    on_chunk(done, total) is called after every chunk and can return True to stop after that chunk
+#    returns (deleted ids, failed ids) as integer ids
+def delete_in_chunks(doc, element_ids, name, chunk_size=250, on_chunk=None):
+	element_ids     = list(element_ids)
+	deleted, failed = [], []
+	removed         = set()
+	group = DB.TransactionGroup(doc, name)
+	group.Start()
+	try:
+		for chunk in chunks(element_ids, chunk_size):
+			t = DB.Transaction(doc, name)
+			t.Start()
+			chunk_deleted, chunk_failed, chunk_removed = [], [], set()
+			for element_id in chunk:
+				key = id_value(element_id)
+				if key in removed or key in chunk_removed:
+					chunk_deleted.append(key)
+					continue
+				try:
+					chunk_removed.update(id_value(i) for i in doc.Delete(element_id))
+					chunk_deleted.append(key)
+				except Exception:
+					chunk_failed.append(key)
+			# failures of a chunk are counted once: the failed elements, or the whole chunk if its commit fails
+			if t.Commit() == DB.TransactionStatus.Committed:
+				deleted.extend(chunk_deleted)
+				failed.extend(chunk_failed)
+				removed.update(chunk_removed)
+			else:
+				failed.extend(chunk_deleted + chunk_failed)
+			if on_chunk is not None and on_chunk(len(deleted) + len(failed), len(element_ids)):
+				break
+		group.Assimilate()
+	except Exception:
+		group.RollBack()
+		raise
+	return deleted, failed
@@ -0,0 +1,178 @@
+# IMPORTS
+# import counter and .NET generic list
+from collections import Counter
+from System.Collections.Generic import List
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.cache import ResolutionCache
+from pysweco.revitdb import id_value
+from pysweco.worksets import CATEGORY_KINDS, build_category_table
+
+# CATEGORY TABLE
+# BuiltInCategory integer id -> handler kind, built once per session
+_category_table = []
+
+# 1) create a function that resolves a BuiltInCategory name to its integer id
+#    categories missing from the running Revit version are skipped
+def resolve_builtin_category(name):
+	builtin_category = getattr(DB.BuiltInCategory, name, None)
+	if builtin_category is None:
+		return None
+	return int(builtin_category)
+
+# 2) create a function that returns the category lookup table
+def category_kinds():
+	if not _category_table:
+		_category_table.append(build_category_table(resolve_builtin_category))
+	return _category_table[0]
+
+# READERS
+# 3) create functions that read the formatted parameter values, used on a cache miss only
+def _value_string(element, builtin_parameter):
+	return element.get_Parameter(builtin_parameter).AsValueString()
+
+def _system_type_parameter(element):
+	parameter = element.get_Parameter(DB.BuiltInParameter.RBS_DUCT_SYSTEM_TYPE_PARAM)
+	if parameter is None:
+		parameter = element.get_Parameter(DB.BuiltInParameter.RBS_PIPING_SYSTEM_TYPE_PARAM)
+	return parameter
+
+# reader used by pysweco.worksets to read revit elements
+# type names, system type names and fabrication services are shared by many instances,
+# so they are formatted once per type id / system type id / service id and memoized in the cache
+class RevitElementReader(object):
+
+	def __init__(self, cache=None):
+		self.cache = cache if cache is not None else ResolutionCache()
+
+	def workset(self, element):
+		return id_value(element.WorksetId)
+
+	def category(self, element):
+		category = element.Category
+		if category is None:
+			return None
+		return id_value(category.Id)
+
+	def category_name(self, element):
+		return element.Category.Name
+
+	def family_type(self, element):
+		type_id = element.GetTypeId()
+		if type_id == DB.ElementId.InvalidElementId:
+			return _value_string(element, DB.BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM)
+		return self.cache.resolve(("type", id_value(type_id)), _value_string, element, DB.BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM)
+
+	def category_label(self, element):
+		return self.cache.resolve(("category", id_value(element.Category.Id)), _value_string, element, DB.BuiltInParameter.ELEM_CATEGORY_PARAM)
+
+	# elements without system type parameter have no system type; elements with no or several systems have an
+	# invalid system type id and are formatted one by one instead of sharing the cache entry of id -1
+	def system_type(self, element):
+		parameter = _system_type_parameter(element)
+		if parameter is None:
+			return None
+		system_type_id = id_value(parameter.AsElementId())
+		if system_type_id < 0:
+			return parameter.AsValueString()
+		return self.cache.resolve(("system", system_type_id), parameter.AsValueString)
+
+	def service_type(self, element):
+		return element.get_Parameter(DB.BuiltInParameter.RBS_CTC_SERVICE_TYPE).AsString()
+
+	def fabrication_service(self, element):
+		service_id = getattr(element, "ServiceId", None)
+		if service_id is None:
+			return _value_string(element, DB.BuiltInParameter.FABRICATION_SERVICE_PARAM)
+		return self.cache.resolve(("service", service_id), _value_string, element, DB.BuiltInParameter.FABRICATION_SERVICE_PARAM)
+
+# FILTERS
+# 4) create a function that checks if element is a nested family (has a supercomponent)
+def is_nested_family(element):
+	return isinstance(element, DB.FamilyInstance) and element.SuperComponent is not None
+
+# COLLECTORS
+# the collectors run the category, element type and workset filters natively in revit and return ids only;
+# elements are materialized one by one while bucketing, so only the supported model categories are ever loaded
+# 5) create a function that builds the multi-category filter of the supported model categories
+def model_category_filter():
+	builtin_categories = List[DB.BuiltInCategory]()
+	for name in sorted(CATEGORY_KINDS):
+		builtin_category = getattr(DB.BuiltInCategory, name, None)
+		if builtin_category is not None:
+			builtin_categories.Add(builtin_category)
+	return DB.ElementMulticategoryFilter(builtin_categories)
+
+# 6) create a function that collects the ids of the supported model elements of one workset
+def collect_workset_element_ids(doc, workset_id):
+	return DB.FilteredElementCollector(doc).\
+		   WherePasses(model_category_filter()).\
+		   WherePasses(DB.ElementWorksetFilter(workset_id, False)).\
+		   WhereElementIsNotElementType().\
+		   ToElementIds()
+
+# 7) create a function that collects the ids of the supported model elements of the whole model in one pass
+#    used to inspect several worksets at once; elements are partitioned by workset afterwards
+def collect_model_element_ids(doc):
+	return DB.FilteredElementCollector(doc).\
+		   WherePasses(model_category_filter()).\
+		   WhereElementIsNotElementType().\
+		   ToElementIds()
+
+# 8) create functions that build the or-ed filter of several worksets and collect their supported model element ids in one pass
+#    the filter runs inside the collector, so elements of the other worksets are never returned
+def worksets_filter(workset_ids):
+	workset_filters = [DB.ElementWorksetFilter(workset_id, False) for workset_id in workset_ids]
+	if len(workset_filters) == 1:
+		return workset_filters[0]
+	return DB.LogicalOrFilter(List[DB.ElementFilter](workset_filters))
+
+def collect_worksets_element_ids(doc, workset_ids):
+	return DB.FilteredElementCollector(doc).\
+		   WherePasses(model_category_filter()).\
+		   WherePasses(worksets_filter(workset_ids)).\
+		   WhereElementIsNotElementType().\
+		   ToElementIds()
+
+# 9) create a generator that materializes the collected ids one by one and skips nested families
+def iter_reportable_elements(doc, element_ids):
+	for element_id in element_ids:
+		element = doc.GetElement(element_id)
+		if element is not None and not is_nested_family(element):
+			yield element
+
+# QUICK SCAN
+# 10) create a function that counts the supported model elements of every workset with one id collector, used by
+#     the workset picker; elements are never materialized, the workset is read from the document by id
+def count_elements_by_workset(doc):
+	return Counter(id_value(doc.GetWorksetId(element_id)) for element_id in collect_model_element_ids(doc))
+
+# 11) create a generator of (workset id, category id) pairs of the supported model elements of the selected worksets
+#    one id collector per category; elements are never materialized, the workset is read from the document by id
+def iter_workset_category_pairs(doc, workset_ids):
+	workset_filter = worksets_filter(workset_ids)
+	for name in sorted(CATEGORY_KINDS):
+		builtin_category = getattr(DB.BuiltInCategory, name, None)
+		if builtin_category is None:
+			continue
+		category_id = int(builtin_category)
+		element_ids = DB.FilteredElementCollector(doc).\
+					  OfCategory(builtin_category).\
+					  WherePasses(workset_filter).\
+					  WhereElementIsNotElementType().\
+					  ToElementIds()
+		for element_id in element_ids:
+			yield id_value(doc.GetWorksetId(element_id)), category_id
+
+# 12) create a function that returns the display names of the supported model categories present in the document
+def category_names(doc):
+	names = {}
+	for name in CATEGORY_KINDS:
+		builtin_category = getattr(DB.BuiltInCategory, name, None)
+		if builtin_category is None:
+			continue
+		category = DB.Category.GetCategory(doc, builtin_category)
+		if category is not None:
+			names[int(builtin_category)] = category.Name
+	return names
@@ -0,0 +1,45 @@
+# IMPORTS
+# import .NET generic list
+from System.Collections.Generic import List
+# import pyrevit libraries
+from pyrevit import DB
+# import pySWECO library
+from pysweco.revitdb import id_value
+from pysweco.worksharing import WorksharingPrecheck, precheck
+
+# 1) create a function that reads checkout and model updates status of an element once
+def read_status(doc, element):
+	return (
+		str(DB.WorksharingUtils.GetCheckoutStatus(doc, element.Id)),
+		str(DB.WorksharingUtils.GetModelUpdatesStatus(doc, element.Id))
+		)
+
+# 2) create a function that returns the owner of an element
+def read_owner(doc, element):
+	try:
+		return DB.WorksharingUtils.GetWorksharingTooltipInfo(doc, element.Id).Owner
+	except Exception:
+		return None
+
+# 3) create a function that prechecks elements of a document; in a non-workshared document every element is ready
+def precheck_elements(doc, elements):
+	if not doc.IsWorkshared:
+		result = WorksharingPrecheck()
+		result.ready = list(elements)
+		return result
+	return precheck(elements, lambda e: read_status(doc, e), lambda e: read_owner(doc, e))
+
+# 4) create a function that checks out the ready elements which need it in one call
+#    elements which could not be checked out are moved to the blocked elements; returns their count
+def checkout_elements(doc, result):
+	if not result.checkout:
+		return 0
+	checked_out = DB.WorksharingUtils.CheckoutElements(doc, List[DB.ElementId]([element.Id for element in result.checkout]))
+	return result.confirm_checkout(set(id_value(element_id) for element_id in checked_out), lambda e: id_value(e.Id))
+
+# columns of the blocked elements table
+BLOCKED_COLUMNS = ["Element Id", "Name", "Reason", "Owner"]
+
+# 5) create a function that returns the output table rows of the blocked elements: id link, name, reason, owner
+def blocked_rows(output, blocked):
+	return [[output.linkify(b.element.Id), b.element.Name, b.reason, b.owner or "-"] for b in blocked]
@@ -0,0 +1,98 @@
+# IMPORTS
+# import modules to read and write the snapshot file
+import io
+import json
+import os
+
+# import pySWECO library
+from pysweco.worksets import WorksetInventory
+
+# persisted per-document snapshot of the Worksets Inspector classification
+# one record per collected element:
+#     element id -> (workset id, category id, element version, field, value, detail)
+# type and system type names are stored as references [kind, element id] and resolved when the report is built,
+# so renaming a type (which does not change the version of its instances) is shown without reclassification;
+# elements which are not reported (nested families, ...) keep a skipped record without category, so their
+# version is known and they are not reclassified on every run
+# the file is JSON Lines: a header line with the format and document version, then one record per line
+SNAPSHOT_FORMAT = 2
+
+# positions of the record fields
+WORKSET, CATEGORY, VERSION, FIELD, VALUE, DETAIL = range(6)
+
+class Snapshot(object):
+
+	def __init__(self, document_version=None, records=None):
+		self.document_version = document_version
+		self.records          = records if records is not None else {}
+
+	# 1) create a method that reads a snapshot file, returns None if the file is missing or has another format
+	@classmethod
+	def load(cls, path):
+		if not os.path.exists(path):
+			return None
+		records = {}
+		try:
+			with io.open(path, "r", encoding="utf-8") as stream:
+				header = json.loads(stream.readline())
+				if header.get("format") != SNAPSHOT_FORMAT:
+					return None
+				for line in stream:
+					row = json.loads(line)
+					records[row[0]] = tuple(row[1:])
+		except ValueError:
+			return None
+		return cls(header.get("document_version"), records)
+
+	# 2) create a method that writes the snapshot file; a temporary file is replaced so a failed write keeps the old snapshot
+	def save(self, path):
+		temp_path = path + ".tmp"
+		with io.open(temp_path, "w", encoding="utf-8") as stream:
+			stream.write(u"{}\n".format(json.dumps({"format": SNAPSHOT_FORMAT, "document_version": self.document_version})))
+			for element_id, record in self.records.items():
+				stream.write(u"{}\n".format(json.dumps([element_id] + list(record), separators=(",", ":"))))
+		if os.path.exists(path):
+			os.remove(path)
+		os.rename(temp_path, path)
+
+	# 3) create a method that stores the classification of one element, a skipped record if it is not reported
+	def update(self, element_id, workset_id, version, classification):
+		if classification is None:
+			self.records[element_id] = (workset_id, None, version, None, None, None)
+		else:
+			category, field, value, detail = classification
+			self.records[element_id] = (workset_id, category, version, field, value, detail)
+
+	def remove(self, element_ids):
+		for element_id in element_ids:
+			self.records.pop(element_id, None)
+
+	# number of reported elements, skipped records are not counted
+	def reported_count(self):
+		return len([record for record in self.records.values() if record[CATEGORY] is not None])
+
+	def version(self, element_id):
+		record = self.records.get(element_id)
+		if record is None:
+			return None
+		return record[VERSION]
+
+	# 4) create a method that rebuilds the workset inventories of the selected worksets from the records
+	#    no element is read from the model; resolve(value) turns a stored type / system type reference into its
+	#    current name, plain values are returned as they are
+	def inventories(self, workset_ids, kinds, names, resolve=None):
+		inventories = dict((workset_id, WorksetInventory()) for workset_id in workset_ids)
+		for record in self.records.values():
+			inventory = inventories.get(record[WORKSET])
+			if inventory is None:
+				continue
+			category = record[CATEGORY]
+			kind     = kinds.get(category)
+			if kind is None:
+				continue
+			inventory.names[category] = names.get(category, str(category))
+			value, detail = record[VALUE], record[DETAIL]
+			if resolve is not None:
+				value, detail = resolve(value), resolve(detail)
+			inventory.add(category, kind, record[FIELD], value, detail)
+		return inventories
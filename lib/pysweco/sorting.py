@@ -0,0 +1,45 @@
+# IMPORTS
+# import module to split names into segments
+import re
+
+# natural sort keys for datum and view names
+# numbers are compared by value ("2" before "10"); names made of grid letters only ("A", "AA", "B.2") sort their
+# letter runs by length first ("B" before "AA"), other text is compared case insensitive ("Ground" before "Top")
+# keys are flat strings, computed once per element and stored, so sorting compares plain strings
+
+# number runs and letter runs, other characters (spaces, dots, dashes) only separate them
+_SEGMENTS = re.compile(r"\d+|[^\W\d_]+", re.UNICODE)
+
+# names which are not grid names: a letter other than A-Z, or more than three grid letters in a row
+_NOT_GRID = re.compile(r"[^\W\d_A-Z]|[A-Z]{4}", re.UNICODE)
+
+# unicode character of a code point on python 2 and 3
+try:
+	unichr_ = unichr
+except NameError:
+	unichr_ = chr
+
+# segment markers: numbers before text, segments separated by the lowest character
+_SEPARATOR = u"\x00"
+_NUMBER    = u"\x01"
+_TEXT      = u"\x02"
+
+# length characters of digit runs and grid letter runs, the grid letter lengths sort before any lower case letter
+_DIGIT_COUNTS = [unichr_(0x20 + count) for count in range(96)]
+_GRID_LENGTHS = [_TEXT + unichr_(0x30 + length) for length in range(4)]
+
+def _number(digits):
+	digits = digits.lstrip(u"0") or u"0"
+	return _NUMBER + _DIGIT_COUNTS[min(len(digits), 95)] + digits
+
+# 1) create a function that returns the natural sort key of a name
+#    numbers are encoded as digit count + digits; grid letter runs as length + letters; names equal segment by
+#    segment are ordered by their full text
+def natural_key(text):
+	text  = u"{}".format(text or u"")
+	lower = text.lower()
+	if _NOT_GRID.search(text) is None:
+		key = [_number(s) if s.isdigit() else _GRID_LENGTHS[len(s)] + s for s in _SEGMENTS.findall(lower)]
+	else:
+		key = [_number(s) if s.isdigit() else _TEXT + s for s in _SEGMENTS.findall(lower)]
+	return _SEPARATOR.join(key), lower
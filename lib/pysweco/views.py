@@ -0,0 +1,146 @@
+# IMPORTS
+# import counter to build the histogram
+from collections import Counter
+# import pySWECO library
+from pysweco.patterns import compile_pattern
+
+# single pass view histogram used by Sheets Views Info
+# views are classified by their ViewType name (locale independent) and their placement comes from a sheet
+# placement index built from the viewports and schedule sheet instances of the model
+
+# ViewType name -> view family reported in the table
+VIEW_TYPE_FAMILIES = {
+	"ThreeD":          "3D Views",
+	"AreaPlan":        "Area Plans",
+	"CeilingPlan":     "Ceiling Plans",
+	"DraftingView":    "Drafting Views",
+	"Elevation":       "Elevations",
+	"FloorPlan":       "Floor Plans",
+	"Legend":          "Legends",
+	"Rendering":       "Renderings",
+	"Section":         "Sections",
+	"Schedule":        "Schedules",
+	"DrawingSheet":    "Sheets",
+	"EngineeringPlan": "Structural Plans",
+	"Walkthrough":     "Walkthroughs"
+	}
+
+# view families reported in the table
+VIEW_FAMILIES = frozenset(VIEW_TYPE_FAMILIES.values())
+
+# view families without placement columns (on sheets / not on sheets)
+COUNT_ONLY_FAMILIES = frozenset(["Sheets"])
+
+# placement value of the count only families in the table
+NOT_APPLICABLE = "N/A"
+
+# view id <-> sheet id index of the views placed on sheets
+# a view can be on several sheets (legends, schedules), a sheet holds several views
+class PlacementIndex(object):
+
+	def __init__(self):
+		self.sheets_by_view = {}
+		self.views_by_sheet = {}
+
+	def add(self, view_id, sheet_id):
+		self.sheets_by_view.setdefault(view_id, set()).add(sheet_id)
+		self.views_by_sheet.setdefault(sheet_id, set()).add(view_id)
+
+	def is_placed(self, view_id):
+		return view_id in self.sheets_by_view
+
+	# sheets a view is placed on
+	def sheets(self, view_id):
+		return self.sheets_by_view.get(view_id, frozenset())
+
+	# views placed on a sheet, for per sheet drill-down
+	def views(self, sheet_id):
+		return self.views_by_sheet.get(sheet_id, frozenset())
+
+# 1) create a function that builds the placement index from (view id, sheet id) pairs
+def build_placement_index(placements):
+	index = PlacementIndex()
+	for view_id, sheet_id in placements:
+		index.add(view_id, sheet_id)
+	return index
+
+# view family -> total / placed view counts
+class ViewHistogram(object):
+
+	def __init__(self):
+		self.totals = Counter()
+		self.placed = Counter()
+
+	def add(self, family, placed=False):
+		self.totals[family] += 1
+		if placed:
+			self.placed[family] += 1
+
+	# table row of one view family: [family, total, on sheets, not on sheets]
+	def row(self, family):
+		label = "<b>{}</b>".format(family)
+		total = self.totals[family]
+		if family in COUNT_ONLY_FAMILIES:
+			return [label, total, NOT_APPLICABLE, NOT_APPLICABLE]
+		return [label, total, self.placed[family], total - self.placed[family]]
+
+# 2) create a function that builds the histogram in one pass over the views
+#    reader provides is_template(view), view_type(view), view_id(view) and is_revision_schedule(view)
+#    title block revision schedules are not counted
+def build_view_histogram(views, reader, placement, families=VIEW_FAMILIES):
+	histogram = ViewHistogram()
+	for view in views:
+		if reader.is_template(view):
+			continue
+		family = VIEW_TYPE_FAMILIES.get(reader.view_type(view))
+		if family not in families:
+			continue
+		if family == "Schedules" and reader.is_revision_schedule(view):
+			continue
+		if family in COUNT_ONLY_FAMILIES:
+			histogram.add(family)
+		else:
+			histogram.add(family, placement.is_placed(reader.view_id(view)))
+	return histogram
+
+# CLEANUP
+# view state read once from the model for the unplaced views cleanup
+class ViewRecord(object):
+	__slots__ = ("view_id", "name", "view_type", "is_template", "primary_id", "is_revision_schedule")
+
+	def __init__(self, view_id, name, view_type, is_template=False, primary_id=None, is_revision_schedule=False):
+		self.view_id              = view_id
+		self.name                 = name
+		self.view_type            = view_type
+		self.is_template          = is_template
+		self.primary_id           = primary_id
+		self.is_revision_schedule = is_revision_schedule
+
+	@property
+	def family(self):
+		return VIEW_TYPE_FAMILIES.get(self.view_type)
+
+# 3) create a function that returns the views which can be deleted by the unplaced views cleanup
+#    excluded: templates, sheets, title block revision schedules, view types not reported in the table,
+#    placed views, views on the keep-list (name patterns), excluded ids (e.g. the active view)
+#    and primary views with a placed or kept dependent view (deleting a primary view deletes its dependents)
+def unplaced_views(records, placement, keep=None, exclude_ids=()):
+	keep_regex  = compile_pattern(keep)
+	exclude_ids = frozenset(exclude_ids)
+	def protected(record):
+		return placement.is_placed(record.view_id) or record.view_id in exclude_ids or (keep_regex is not None and keep_regex.match(record.name or ""))
+	protected_primaries = set(r.primary_id for r in records if r.primary_id is not None and protected(r))
+	candidates = []
+	for record in records:
+		family = record.family
+		if record.is_template or family is None or family in COUNT_ONLY_FAMILIES or record.is_revision_schedule:
+			continue
+		if protected(record) or record.view_id in protected_primaries:
+			continue
+		candidates.append(record)
+	return candidates
+
+# 4) create a function that splits a list into chunks of a given size
+def chunks(items, size):
+	for start in range(0, len(items), size):
+		yield items[start:start + size]
@@ -0,0 +1,339 @@
+# IMPORTS
+# import Counter class to count occurances
+from collections import Counter
+
+# HANDLER KINDS
+# every reported model category is handled by exactly one kind
+KIND_FAMILY_TYPE  = "family_type"	# family and type name
+KIND_CATEGORY     = "category"		# categories without family / type, labelled with category name
+KIND_SYSTEM_TYPE  = "system_type"	# mep system type
+KIND_SERVICE_TYPE = "service_type"	# cable tray / conduit service type, falls back to family and type
+KIND_PIPE         = "pipe"			# pipe system type with nested pipe types
+KIND_FABRICATION  = "fabrication"	# mep fabrication service
+
+# labels of the reported fields
+FIELD_FAMILY_TYPE  = "Family and Type"
+FIELD_SYSTEM_TYPE  = "System Type"
+FIELD_SERVICE_TYPE = "Service Type"
+FIELD_FABRICATION  = "Fabrication Service"
+
+# CATEGORY TABLES
+# model categories are keyed by BuiltInCategory name so that the tables do not depend on the Revit language
+# categories that can have family names / types
+FAMILY_TYPE_CATEGORIES = frozenset([
+	"OST_BridgeAbutments",                # Abutments
+	"OST_DuctTerminal",                   # Air Terminals
+	"OST_AudioVisualDevices",             # Audio Visual Devices
+	"OST_BridgeBearings",                 # Bearings
+	"OST_BridgeCables",                   # Bridge Cables
+	"OST_BridgeDecks",                    # Bridge Decks
+	"OST_BridgeFraming",                  # Bridge Framing
+	"OST_Casework",                       # Casework
+	"OST_Ceilings",                       # Ceilings
+	"OST_Columns",                        # Columns
+	"OST_CommunicationDevices",           # Communication Devices
+	"OST_CurtainWallPanels",              # Curtain Panels
+	"OST_CurtaSystem",                    # Curtain Systems
+	"OST_CurtainWallMullions",            # Curtain Wall Mullions
+	"OST_DataDevices",                    # Data Devices
+	"OST_Doors",                          # Doors
+	"OST_DuctAccessory",                  # Duct Accessories
+	"OST_ElectricalEquipment",            # Electrical Equipment
+	"OST_ElectricalFixtures",             # Electrical Fixtures
+	"OST_Entourage",                      # Entourage
+	"OST_ExpansionJoints",                # Expansion Joints
+	"OST_FireAlarmDevices",               # Fire Alarm Devices
+	"OST_FireProtection",                 # Fire Protection
+	"OST_Floors",                         # Floors
+	"OST_FoodServiceEquipment",           # Food Service Equipment
+	"OST_Furniture",                      # Furniture
+	"OST_FurnitureSystems",               # Furniture Systems
+	"OST_GenericModel",                   # Generic Models
+	"OST_Grids",                          # Grids
+	"OST_Hardscape",                      # Hardscape
+	"OST_Levels",                         # Levels
+	"OST_LightingDevices",                # Lighting Devices
+	"OST_LightingFixtures",               # Lighting Fixtures
+	"OST_Mass",                           # Mass
+	"OST_MechanicalControlDevices",       # Mechanical Control Devices
+	"OST_MechanicalEquipment",            # Mechanical Equipment
+	"OST_MedicalEquipment",               # Medical Equipment
+	"OST_MEPAncillaryFraming",            # MEP Ancillary Framing
+	"OST_FabricationDuctworkStiffeners",  # MEP Fabrication Ductwork Stiffeners
+	"OST_NurseCallDevices",               # Nurse Call Devices
+	"OST_Parking",                        # Parking
+	"OST_BridgePiers",                    # Piers
+	"OST_Planting",                       # Planting
+	"OST_PlumbingEquipment",              # Plumbing Equipment
+	"OST_StairsRailing",                  # Railings
+	"OST_Ramps",                          # Ramps
+	"OST_Roads",                          # Roads
+	"OST_Roofs",                          # Roofs
+	"OST_SecurityDevices",                # Security Devices
+	"OST_Signage",                        # Signage
+	"OST_Site",                           # Site
+	"OST_SpecialityEquipment",            # Specialty Equipment
+	"OST_Stairs",                         # Stairs
+	"OST_AreaRein",                       # Structural Area Reinforcement
+	"OST_StructuralFramingSystem",        # Structural Beam Systems
+	"OST_StructuralColumns",              # Structural Columns
+	"OST_StructConnections",              # Structural Connections
+	"OST_FabricAreas",                    # Structural Fabric Areas
+	"OST_FabricReinforcement",            # Structural Fabric Reinforcement
+	"OST_StructuralFoundation",           # Structural Foundations
+	"OST_StructuralFraming",              # Structural Framing
+	"OST_PathRein",                       # Structural Path Reinforcement
+	"OST_Rebar",                          # Structural Rebar
+	"OST_Coupler",                        # Structural Rebar Couplers
+	"OST_StructuralStiffener",            # Structural Stiffeners
+	"OST_StructuralTendons",              # Structural Tendons
+	"OST_StructuralTruss",                # Structural Trusses
+	"OST_TelephoneDevices",               # Telephone Devices
+	"OST_TemporaryStructure",             # Temporary Structures
+	"OST_Topography",                     # Topography
+	"OST_Toposolid",                      # Toposolid
+	"OST_VerticalCirculation",            # Vertical Circulation
+	"OST_VibrationManagement",            # Vibration Management
+	"OST_Walls",                          # Walls
+	"OST_Windows"                         # Windows
+	])
+
+# categories without family / type that are reported with their category name
+CATEGORY_LABEL_CATEGORIES = frozenset([
+	"OST_Areas",                          # Areas
+	"OST_HVAC_Zones",                     # HVAC Zones
+	"OST_Lines",                          # Lines
+	"OST_Matchline",                      # Matchline
+	"OST_Parts",                          # Parts
+	"OST_CLines",                         # Reference Planes
+	"OST_Rooms",                          # Rooms
+	"OST_VolumeOfInterest",               # Scope Boxes
+	"OST_ShaftOpening",                   # Shaft Openings
+	"OST_MEPSpaces"                       # Spaces
+	])
+
+# categories that can have system types
+SYSTEM_TYPE_CATEGORIES = frozenset([
+	"OST_DuctFitting",                    # Duct Fittings
+	"OST_DuctInsulations",                # Duct Insulations
+	"OST_DuctLinings",                    # Duct Linings
+	"OST_PlaceHolderDucts",               # Duct Placeholders
+	"OST_DuctCurves",                     # Ducts
+	"OST_FlexDuctCurves",                 # Flex Ducts
+	"OST_FlexPipeCurves",                 # Flex Pipes
+	"OST_PipeAccessory",                  # Pipe Accessories
+	"OST_PipeFitting",                    # Pipe Fittings
+	"OST_PipeInsulations",                # Pipe Insulations
+	"OST_PlaceHolderPipes",               # Pipe Placeholders
+	"OST_PlumbingFixtures",               # Plumbing Fixtures
+	"OST_Sprinklers"                      # Sprinklers
+	])
+
+# cable tray / conduit categories that can have service types
+SERVICE_TYPE_CATEGORIES = frozenset([
+	"OST_CableTrayFitting",               # Cable Tray Fittings
+	"OST_CableTray",                      # Cable Trays
+	"OST_ConduitFitting",                 # Conduit Fittings
+	"OST_Conduit"                         # Conduits
+	])
+
+# pipe categories reported as system type -> pipe type
+PIPE_CATEGORIES = frozenset([
+	"OST_PipeCurves"                      # Pipes
+	])
+
+# categories for MEP Fabrication Parts
+FABRICATION_CATEGORIES = frozenset([
+	"OST_FabricationContainment",         # MEP Fabrication Containment
+	"OST_FabricationDuctwork",            # MEP Fabrication Ductwork
+	"OST_FabricationHangers",             # MEP Fabrication Hangers
+	"OST_FabricationPipework"             # MEP Fabrication Pipework
+	])
+
+# lookup table of BuiltInCategory name -> handler kind
+CATEGORY_KINDS = {}
+for _kind, _names in (
+	(KIND_FAMILY_TYPE,  FAMILY_TYPE_CATEGORIES),
+	(KIND_CATEGORY,     CATEGORY_LABEL_CATEGORIES),
+	(KIND_SYSTEM_TYPE,  SYSTEM_TYPE_CATEGORIES),
+	(KIND_SERVICE_TYPE, SERVICE_TYPE_CATEGORIES),
+	(KIND_PIPE,         PIPE_CATEGORIES),
+	(KIND_FABRICATION,  FABRICATION_CATEGORIES)
+	):
+	for _name in _names:
+		CATEGORY_KINDS[_name] = _kind
+del _kind, _names, _name
+
+# read-only dictionary used for the category lookup tables
+class FrozenTable(dict):
+
+	def _read_only(self, *args, **kwargs):
+		raise TypeError("category lookup table is read-only")
+
+	__setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+# 1) create a function that builds the immutable lookup table of BuiltInCategory integer id -> handler kind
+#    resolve takes a BuiltInCategory name and returns its integer id or None if the category does not exist in this Revit version
+def build_category_table(resolve, kinds=CATEGORY_KINDS):
+	table = {}
+	for name, kind in kinds.items():
+		category_id = resolve(name)
+		if category_id is not None:
+			table[category_id] = kind
+	return FrozenTable(table)
+
+# INVENTORY
+# counts of one category on a workset
+class CategoryBucket(object):
+	__slots__ = ("kind", "count", "entries", "details")
+
+	def __init__(self, kind):
+		self.kind    = kind
+		self.count   = 0
+		# (field, value) -> count
+		self.entries = Counter()
+		# (field, value) -> Counter of nested values (pipe types per pipe system type)
+		self.details = {}
+
+	def sorted_entries(self):
+		return sorted(self.entries.items())
+
+	def sorted_details(self, entry):
+		return sorted(self.details.get(entry, {}).items())
+
+# counts of all reported categories on a workset
+class WorksetInventory(object):
+
+	def __init__(self):
+		self.total      = 0
+		self.categories = {}
+		# category id -> display name, resolved once per category for output only
+		self.names      = {}
+
+	def add(self, category, kind, field=None, value=None, detail=None):
+		bucket = self.categories.get(category)
+		if bucket is None:
+			bucket = self.categories[category] = CategoryBucket(kind)
+		bucket.count += 1
+		self.total   += 1
+		if field is not None:
+			entry = (field, value)
+			bucket.entries[entry] += 1
+			if detail is not None:
+				nested = bucket.details.get(entry)
+				if nested is None:
+					nested = bucket.details[entry] = Counter()
+				nested[detail] += 1
+
+	def sorted_categories(self):
+		names = self.names
+		return sorted((names.get(category, category), bucket) for category, bucket in self.categories.items())
+
+# CLASSIFICATION
+# 2) create a function that reads the reported field of a single element
+#    the reader is any object with the methods used below; for revit see pysweco.revitdb.worksets
+#    returns (field, value, detail) or (None, None, None) if the element parameters cannot be read
+def read_entry(element, kind, reader):
+	try:
+		if kind == KIND_FAMILY_TYPE:
+			return FIELD_FAMILY_TYPE, reader.family_type(element), None
+		if kind == KIND_CATEGORY:
+			return FIELD_FAMILY_TYPE, reader.category_label(element), None
+		if kind == KIND_SYSTEM_TYPE:
+			return FIELD_SYSTEM_TYPE, reader.system_type(element), None
+		if kind == KIND_SERVICE_TYPE:
+			service_type = reader.service_type(element)
+			family_type  = reader.family_type(element)
+			if service_type and service_type.strip():
+				return FIELD_SERVICE_TYPE, service_type, None
+			return FIELD_FAMILY_TYPE, family_type, None
+		if kind == KIND_PIPE:
+			system_type = reader.system_type(element)
+			pipe_type   = reader.family_type(element)
+			return FIELD_SYSTEM_TYPE, system_type, pipe_type
+		if kind == KIND_FABRICATION:
+			return FIELD_FABRICATION, reader.fabrication_service(element), None
+	except Exception:
+		pass
+	return None, None, None
+
+# 3) create a function that classifies one element and adds it to an inventory
+#    classification is a single integer dictionary probe on the element category id
+def add_element(inventory, element, reader, kinds):
+	category = reader.category(element)
+	kind     = kinds.get(category)
+	if kind is None:
+		return
+	if category not in inventory.names:
+		inventory.names[category] = reader.category_name(element)
+	field, value, detail = read_entry(element, kind, reader)
+	inventory.add(category, kind, field, value, detail)
+
+# 4) create a function that walks the elements of a workset exactly once and buckets them by category and handler kind
+def bucket_elements(elements, reader, kinds):
+	inventory = WorksetInventory()
+	for element in elements:
+		add_element(inventory, element, reader, kinds)
+	return inventory
+
+# 5) create a function that walks the elements of the whole model exactly once, partitions them by workset id
+#    and buckets each workset group by category and handler kind; elements on other worksets are skipped
+def bucket_by_workset(elements, reader, workset_ids, kinds):
+	inventories = dict((workset_id, WorksetInventory()) for workset_id in workset_ids)
+	for element in elements:
+		inventory = inventories.get(reader.workset(element))
+		if inventory is not None:
+			add_element(inventory, element, reader, kinds)
+	return inventories
+
+# QUICK SCAN
+# 6) create a function that tallies the (workset id, category id) pairs of a counts-only scan
+#    returns workset id -> Counter of category id -> element count
+def tally_workset_counts(pairs):
+	counts = {}
+	for workset_id, category_id in pairs:
+		per_workset = counts.get(workset_id)
+		if per_workset is None:
+			per_workset = counts[workset_id] = Counter()
+		per_workset[category_id] += 1
+	return counts
+
+# EXPORT
+# columns of the workset inventory export
+EXPORT_COLUMNS = ["workset", "category", "family_type", "system_type", "service_type", "count"]
+
+# 7) create a generator of export rows of one workset inventory, in report order
+#    pipe types are exported one row per system type -> pipe type; fabrication services use the service type column;
+#    elements whose parameters could not be read are exported as a row without type information
+def inventory_rows(workset_name, inventory):
+	for category_name, bucket in inventory.sorted_categories():
+		reported = 0
+		for entry, entry_count in bucket.sorted_entries():
+			field, value = entry
+			reported += entry_count
+			nested = bucket.sorted_details(entry)
+			if nested:
+				for pipe_type, pipe_count in nested:
+					yield [workset_name, category_name, pipe_type, value, None, pipe_count]
+				nested_count = sum(n for _, n in nested)
+				if nested_count < entry_count:
+					yield [workset_name, category_name, None, value, None, entry_count - nested_count]
+			elif field == FIELD_FAMILY_TYPE:
+				yield [workset_name, category_name, value, None, None, entry_count]
+			elif field == FIELD_SYSTEM_TYPE:
+				yield [workset_name, category_name, None, value, None, entry_count]
+			else:
+				yield [workset_name, category_name, None, None, value, entry_count]
+		if reported < bucket.count:
+			yield [workset_name, category_name, None, None, None, bucket.count - reported]
+
+# SNAPSHOT
+# 8) create a function that classifies one element into the type key stored in the inventory snapshot
+#    returns (category id, field, value, detail) or None if the category is not reported
+def classify_element(element, reader, kinds):
+	category = reader.category(element)
+	kind     = kinds.get(category)
+	if kind is None:
+		return None
+	field, value, detail = read_entry(element, kind, reader)
+	return category, field, value, detail
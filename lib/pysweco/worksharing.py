@@ -0,0 +1,69 @@
+# worksharing precheck used by the pin commands
+# checkout and model updates status are read once per element; elements owned by other users or changed
+# in central are reported with the reason (and owner) instead of cancelling the whole command,
+# the other elements can be checked out in one call and edited
+
+# CheckoutStatus / ModelUpdatesStatus names
+OWNED_BY_CURRENT_USER = "OwnedByCurrentUser"
+OWNED_BY_OTHER_USER   = "OwnedByOtherUser"
+DELETED_IN_CENTRAL    = "DeletedInCentral"
+UPDATED_IN_CENTRAL    = "UpdatedInCentral"
+NOT_YET_IN_CENTRAL    = "NotYetInCentral"
+
+# reasons reported for blocked elements
+REASON_OWNED        = "Owned by other user"
+REASON_DELETED      = "Deleted in central model"
+REASON_UPDATED      = "Updated in central model (reload latest)"
+REASON_NOT_CHECKOUT = "Could not be checked out"
+
+# 1) create a function that returns why an element cannot be edited, None if it can
+def blocking_reason(checkout_status, updates_status):
+	if checkout_status == OWNED_BY_OTHER_USER:
+		return REASON_OWNED
+	if updates_status == DELETED_IN_CENTRAL:
+		return REASON_DELETED
+	if updates_status == UPDATED_IN_CENTRAL:
+		return REASON_UPDATED
+	return None
+
+# element that cannot be edited
+class BlockedElement(object):
+	__slots__ = ("element", "reason", "owner")
+
+	def __init__(self, element, reason, owner=None):
+		self.element = element
+		self.reason  = reason
+		self.owner   = owner
+
+# result of the precheck: ready elements, blocked elements and ready elements that still need a checkout
+class WorksharingPrecheck(object):
+
+	def __init__(self):
+		self.ready    = []
+		self.blocked  = []
+		self.checkout = []
+
+	# keep only the elements which were checked out; checked_out holds the keys of the checked out elements
+	def confirm_checkout(self, checked_out, key):
+		failed = set(key(element) for element in self.checkout if key(element) not in checked_out)
+		if failed:
+			self.blocked.extend(BlockedElement(element, REASON_NOT_CHECKOUT) for element in self.ready if key(element) in failed)
+			self.ready = [element for element in self.ready if key(element) not in failed]
+		self.checkout = []
+		return len(failed)
+
+# 2) create a function that prechecks elements, read_status(element) returns (checkout status, updates status) names
+#    and read_owner(element) the owner of an element owned by other user
+def precheck(elements, read_status, read_owner=None):
+	result = WorksharingPrecheck()
+	for element in elements:
+		checkout_status, updates_status = read_status(element)
+		reason = blocking_reason(checkout_status, updates_status)
+		if reason is not None:
+			owner = read_owner(element) if read_owner is not None and checkout_status == OWNED_BY_OTHER_USER else None
+			result.blocked.append(BlockedElement(element, reason, owner))
+			continue
+		result.ready.append(element)
+		if checkout_status != OWNED_BY_CURRENT_USER and updates_status != NOT_YET_IN_CENTRAL:
+			result.checkout.append(element)
+	return result
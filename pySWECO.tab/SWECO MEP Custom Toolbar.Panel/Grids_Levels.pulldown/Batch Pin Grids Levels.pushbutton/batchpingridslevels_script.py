@@ -0,0 +1,130 @@
+# IMPORTS
+# import pyrevit libraries
+from pyrevit import forms, script
+import os
+# import pySWECO performance recorder and pin engine
+from pysweco.perf import PerfRecorder
+from pysweco.datums import GRIDS, LEVELS
+from pysweco.pinning import PinResult, STATUS_SKIPPED, STATUS_FAILED, SUMMARY_COLUMNS, summary_rows
+from pysweco.revitdb.datums import collect_datum_groups
+from pysweco.revitdb.pinning import BLOCKED_COLUMNS, pin_datum_groups, blocked_rows
+
+# start timing of the command phases
+perf = PerfRecorder("Batch Pin Grids Levels")
+
+# datum kinds pinned by this command
+SPECS = [GRIDS, LEVELS]
+
+# DATA COLLECTION
+perf.phase("collection")
+# get all open projects, linked models and families are not included
+documents = [d for d in __revit__.Application.Documents if not d.IsLinked and not d.IsFamilyDocument]
+
+perf.count("documents", len(documents))
+
+# FUNCTIONS
+# 1) create a function to return pyrevit forms
+def sweco_alert(message):
+	forms.alert(
+	message,
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+# messages for 1) function
+msg_1 = "There are no open Revit projects"
+
+# 2) create a function that pins the grids and levels of one project in one transaction
+def pin_document(d):
+	if d.IsReadOnly:
+		result = PinResult(d.Title, SPECS)
+		result.status  = STATUS_SKIPPED
+		result.message = "read-only"
+		return result
+	perf.phase("collection")
+	# grids and levels are collected with one multi-category collector, a project which cannot be read is
+	# reported as failed and the other projects are still pinned
+	try:
+		groups = collect_datum_groups(d, SPECS)
+	except Exception as e:
+		result = PinResult(d.Title, SPECS)
+		result.status  = STATUS_FAILED
+		result.message = str(e)
+		return result
+	result = pin_datum_groups(d, groups, SPECS, "Pin All Grids and Levels", perf)
+	perf.count("unpinned datums", sum(result.unpinned.values()))
+	perf.count("blocked datums", result.blocked_count)
+	perf.count("pinned datums", result.pinned_count)
+	return result
+
+# FORMS / USER INTERACTION
+perf.phase("user input")
+if not documents:
+	sweco_alert(msg_1)
+
+question = 'All un-pinned grids and levels will be pinned in {} open project(s):\n\n{}\n\nWould you like to proceed?\n\n\
+Click "Yes" to proceed or "No" to cancel'.format(len(documents), "\n".join(d.Title for d in documents))
+yes_outcome = forms.alert(
+question,
+ok = False,
+yes = True,
+no = True,
+warn_icon = False
+)
+if not yes_outcome:
+	perf.finish(script.get_output())
+	script.exit()
+
+# COMPLETE ACTION
+# one collection pass, one worksharing precheck and one transaction per project
+results = [pin_document(d) for d in documents]
+
+# OUTPUT FOR USER
+perf.phase("output")
+# get current working directory where current Python script is located
+# specify the relative path to the file image
+# join the current directory with the relative path to create the full path
+current_dir      = os.path.dirname(os.path.realpath(__file__))
+relative_path    = 'pySWECOLogo.png'
+sweco_image_path = os.path.join(current_dir, relative_path)
+
+# output module
+output = script.get_output()
+
+# set output window style
+output.add_style('body { color: black; font-size: 14px; background-color: white; font-family: Arial }')
+
+# import SWECO logo
+output.print_image(sweco_image_path)
+
+# consolidated summary table: one row per project and datum kind
+output.print_table(
+				   summary_rows(results),
+				   title = "BATCH PIN GRIDS AND LEVELS RESULTS",
+				   columns = SUMMARY_COLUMNS
+				   )
+
+# grids and levels which cannot be pinned, with their owners
+blocked = blocked_rows(results)
+if blocked:
+	output.print_table(
+					   blocked,
+					   title = "GRIDS AND LEVELS WHICH CANNOT BE PINNED",
+					   columns = BLOCKED_COLUMNS
+					   )
+
+# final user message
+msg = "{} grid(s) and level(s) have been pinned in {} project(s), {} skipped. See the output window for details.".format(
+	sum(r.pinned_count for r in results), len(results), sum(r.blocked_count for r in results))
+failed = len([r for r in results if r.status == STATUS_FAILED])
+if failed:
+	msg += "\n\n{} project(s) failed, the reason is listed in the Status column.".format(failed)
+forms.alert(
+			msg,
+			title = "Script is successfully completed",
+			ok = False,
+			warn_icon = False
+			)
+perf.finish(output)
@@ -1,53 +1,40 @@
-# import Revit & pyrevit libraries 
-from Autodesk.Revit.DB import FilteredElementCollector, Grid
+# import pyrevit libraries
 from pyrevit import forms, script
 import os
+# import pySWECO performance recorder and datum inspection
+from pysweco.perf import PerfRecorder
+from pysweco.datums import GRIDS, print_datum_report
+from pysweco.overlaps import grid_conflicts, print_conflicts
+from pysweco.revitdb.datums import inspect_document_datums, read_grid_geometry
+# start timing of the command phases
+perf = PerfRecorder("Inspect Grids")
 
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
-# collect all grids in the current project
-grids_all = FilteredElementCollector(doc).\
-			OfClass(Grid).\
-			WhereElementIsNotElementType().\
-			ToElements()
+# collect all grids in the current project, read names, pinned and monitored state once per element
+# and count them in the same pass
+grids_all, inspection = inspect_document_datums(doc, GRIDS, perf)
 
 # create a scenario where there are no grids in the model
-if not grids_all:
+if inspection is None:
 	forms.alert(
 	'Active Revit document does not contain grids',
 	title = "Script is cancelled",
 	ok = False
 	)
+	perf.finish(script.get_output())
 	script.exit()
 
-# take grids names, check if pinned and check if is being monitored
-grids_data = sorted([[g1.Name, g1.Pinned, g1.IsMonitoringLinkElement()] for g1 in grids_all])
+# read grids plan geometry once, records are in the order of the collected grids
+geometries = [read_grid_geometry(grid, record.name) for grid, record in zip(grids_all, inspection.records)]
 
-# loop through all grids and count pinned, nonpinned, monitored and nonmonitored grids
-count_pinned 	   = 0
-count_unpinned 	   = 0
-count_monitored    = 0
-count_nonmonitored = 0
-
-for grd in grids_all:
-	if grd.Pinned:
-		count_pinned += 1
-	else:
-		count_unpinned += 1
-
-	if grd.IsMonitoringLinkElement():
-		count_monitored += 1
-	else:
-		count_nonmonitored += 1
-
-# create primary table data
-count_data = [
-			[len(grids_all),
-			"{} / {}".format(count_pinned, count_unpinned),
-			"{} / {}".format(count_monitored, count_nonmonitored)]
-			]
+perf.phase("overlap detection")
+# coincident and overlapping grids from a spatial hash of the grid lines and arcs
+conflicts = grid_conflicts(geometries)
+perf.count("grid conflicts", len(conflicts))
 
+perf.phase("output")
 # get current working directory where current Python script is located
 # specify the relative path to the file image
 # join the current directory with the relative path to create the full path
@@ -58,20 +45,10 @@ sweco_image_path = os.path.join(current_dir, relative_path)
 # output module 
 output = script.get_output()
 
-# set output window style
-output.add_style('body { color: black; font-size: 14px; background-color: white; font-family: Arial }')
-
-# import SWECO logo
-output.print_image(sweco_image_path)
-
-# primary table data
-output.print_table(count_data, 
-				columns = ["Total Count", "Pinned / Un-Pinned Count", "Monitored / Non-monitored Count"],
-				title = "GRIDS INSPECTION RESULTS"
-				)
+# SWECO styled output: primary table (counts) and secondary table (one row per grid)
+print_datum_report(output, inspection, sweco_image_path)
 
-# secondary table data
-output.print_table(grids_data, 
-				columns = ["Grid Name", "Pinned (True or False)", "Monitored (True or False)"]
-				)
+# duplicate and overlapping grids
+print_conflicts(output, conflicts, GRIDS)
+perf.finish(output)
 script.exit()
\ No newline at end of file
@@ -1,44 +1,46 @@
-# import Revit & pyrevit libraries 
-from Autodesk.Revit.DB import FilteredElementCollector, Level
-from pyrevit import script
+# import pyrevit libraries
+from pyrevit import forms, script, EXEC_PARAMS
 import os
+# import pySWECO performance recorder and datum inspection
+from pysweco.perf import PerfRecorder
+from pysweco.datums import LEVELS, ORDER_NAME, ORDER_ELEVATION, print_datum_report
+from pysweco.overlaps import level_conflicts, print_conflicts
+from pysweco.levels import print_level_usage
+from pysweco.revitdb.datums import collect_level_usage, inspect_document_datums
+# start timing of the command phases
+perf = PerfRecorder("Inspect Levels")
+
+# levels table order: natural sort of the names, Shift+Click sorts by elevation
+order = ORDER_ELEVATION if EXEC_PARAMS.config_mode else ORDER_NAME
 
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
-# collect all levels in the current project
-levels_all = FilteredElementCollector(doc).\
-			OfClass(Level).\
-			WhereElementIsNotElementType().\
-			ToElements()
-
-# take levels names, check if pinned and check if is being monitored
-levels_data = sorted([[l1.Name, l1.Pinned, l1.IsMonitoringLinkElement()] for l1 in levels_all])
-
-# loop through all levels and count pinned, unpinned, monitored and nonmonitored levels
-count_pinned       = 0
-count_unpinned     = 0
-count_monitored    = 0
-count_nonmonitored = 0
-
-for lvl in levels_all:
-	if lvl.Pinned:
-		count_pinned += 1
-	else:
-		count_unpinned += 1 
-
-	if lvl.IsMonitoringLinkElement():
-		count_monitored += 1
-	else:
-		count_nonmonitored += 1
-
-# create primary table data
-count_data = [
-			[len(levels_all),
-			"{} / {}".format(count_pinned, count_unpinned),
-			"{} / {}".format(count_monitored, count_nonmonitored)]
-			]
-
+# collect all levels in the current project, read names, pinned and monitored state once per element
+# and count them in the same pass
+levels_all, inspection = inspect_document_datums(doc, LEVELS, perf)
+
+# create a scenario where there are no levels in the model
+if inspection is None:
+	forms.alert(
+	'Active Revit document does not contain levels',
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+perf.phase("overlap detection")
+# levels at the same elevation from a sorted sweep over the elevations
+conflicts = level_conflicts(inspection.records)
+perf.count("level conflicts", len(conflicts))
+
+perf.phase("level usage")
+# all elements and plan views are collected once and grouped by their level
+usage = collect_level_usage(doc)
+perf.count("level references", sum(usage.elements.values()) + sum(len(v) for v in usage.views.values()))
+
+perf.phase("output")
 # get current working directory where current Python script is located
 # specify the relative path to the file image
 # join the current directory with the relative path to create the full path
@@ -49,20 +51,13 @@ sweco_image_path = os.path.join(current_dir, relative_path)
 # output module 
 output = script.get_output()
 
-# set output window style
-output.add_style('body { color: black; font-size: 14px; background-color: white; font-family: Arial }')
-
-# import SWECO logo
-output.print_image(sweco_image_path)
+# SWECO styled output: primary table (counts) and secondary table (one row per level)
+print_datum_report(output, inspection, sweco_image_path, order)
 
-# primary table data
-output.print_table(count_data, 
-				columns = ["Total Count", "Pinned / Un-Pinned Count", "Monitored / Non-monitored Count"],
-				title = "LEVELS INSPECTION RESULTS"
-				)
+# duplicate levels
+print_conflicts(output, conflicts, LEVELS)
 
-# secondary table data
-output.print_table(levels_data, 
-				columns = ["Level Name", "Pinned (True or False)", "Monitored (True or False)"]
-				)
+# elements and views of every level, levels without any reference are flagged
+print_level_usage(output, usage, inspection.sorted_records(order))
+perf.finish(output)
 script.exit()
\ No newline at end of file
@@ -0,0 +1,42 @@
+# import pyrevit libraries
+from pyrevit import forms, script
+import os
+# import pySWECO performance recorder and datum inspection
+from pysweco.perf import PerfRecorder
+from pysweco.datums import REFERENCE_PLANES, print_datum_report
+from pysweco.revitdb.datums import inspect_document_datums
+# start timing of the command phases
+perf = PerfRecorder("Inspect Reference Planes")
+
+# get current Revit document
+doc = __revit__.ActiveUIDocument.Document
+
+# collect all reference planes in the current project, read names, pinned and monitored state once per element
+# and count them in the same pass
+reference_planes_all, inspection = inspect_document_datums(doc, REFERENCE_PLANES, perf)
+
+# create a scenario where there are no reference planes in the model
+if inspection is None:
+	forms.alert(
+	'Active Revit document does not contain reference planes',
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+perf.phase("output")
+# get current working directory where current Python script is located
+# specify the relative path to the file image
+# join the current directory with the relative path to create the full path
+current_dir      = os.path.dirname(os.path.realpath(__file__))
+relative_path    = 'pySWECOLogo.png'
+sweco_image_path = os.path.join(current_dir, relative_path)
+
+# output module 
+output = script.get_output()
+
+# SWECO styled output: primary table (counts) and secondary table (one row per reference plane)
+print_datum_report(output, inspection, sweco_image_path)
+perf.finish(output)
+script.exit()
\ No newline at end of file
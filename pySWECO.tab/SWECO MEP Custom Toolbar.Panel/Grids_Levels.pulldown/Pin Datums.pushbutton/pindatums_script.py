@@ -0,0 +1,157 @@
+# IMPORTS
+# import pyrevit libraries
+from pyrevit import forms, script
+import os
+# import pySWECO performance recorder and pin engine
+from pysweco.perf import PerfRecorder
+from pysweco.datums import PIN_SPECS
+from pysweco.pinning import STATUS_FAILED, SUMMARY_COLUMNS, summary_rows
+from pysweco.revitdb.datums import collect_datum_groups
+from pysweco.revitdb.pinning import pin_datum_groups
+from pysweco.revitdb.worksharing import BLOCKED_COLUMNS, blocked_rows
+
+# start timing of the command phases
+perf = PerfRecorder("Pin Datums")
+
+# get current Revit document
+doc = __revit__.ActiveUIDocument.Document
+
+# categories selected in the last run, separated by ";" (all categories the first time)
+config        = script.get_config()
+selected_keys = config.get_option("pin_categories", ";".join(spec.key for spec in PIN_SPECS)).split(";")
+
+# FUNCTIONS
+# 1) create a function to return pyrevit forms
+def sweco_alert(message):
+	forms.alert(
+	message,
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+# messages for 1) function
+msg_1 = "No category was selected"
+msg_2 = "Active Revit document does not contain un-pinned elements of the selected categories"
+
+# 2) create a function that lists the elements which cannot be pinned in the output window, one table per category
+def print_blocked(blocked_by_kind):
+	output = script.get_output()
+	for spec in specs:
+		if blocked_by_kind[spec.key]:
+			output.print_table(
+							   blocked_rows(output, blocked_by_kind[spec.key]),
+							   title = "{} WHICH CANNOT BE PINNED".format(spec.label.upper()),
+							   columns = BLOCKED_COLUMNS
+							   )
+
+# blocked elements already listed before the confirmation
+previewed = set()
+
+# 3) create a function that lists the blocked elements and asks for confirmation before anything is checked out or pinned
+def confirm_pin(ready_count, blocked_by_kind):
+	blocked_count = sum(len(blocked) for blocked in blocked_by_kind.values())
+	if blocked_count:
+		print_blocked(blocked_by_kind)
+		previewed.update(item for blocked in blocked_by_kind.values() for item in blocked)
+		question = ('{} of {} un-pinned elements can be pinned. {} element(s) listed in the output window cannot be pinned '
+					'and will be skipped. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel').format(ready_count, ready_count + blocked_count, blocked_count)
+	else:
+		question = ('All un-pinned elements of the selected categories will be pinned. Would you like to proceed?\n\n'
+					'Click "Yes" to proceed or "No" to cancel')
+	yes_outcome = forms.alert(
+	question,
+	ok = False,
+	yes = True,
+	no = True,
+	warn_icon = False,
+	exitscript = True
+	)
+	return yes_outcome == True
+
+# create a simple class with name to feed pyrevit form with categories
+class CategoryItem:
+	def __init__(self, spec):
+		self.spec = spec
+		self.name = spec.label
+
+# FORMS / USER INTERACTION
+perf.phase("user input")
+category_selection = forms.SelectFromList.show(
+					 [forms.TemplateListItem(CategoryItem(spec), checked = spec.key in selected_keys) for spec in PIN_SPECS],
+					 title = "Pin Datums",
+					 width = 400,
+					 height = 400,
+					 button_name = "Pin",
+					 multiselect = True
+					 )
+if not category_selection:
+	sweco_alert(msg_1)
+
+specs = [item.spec for item in category_selection]
+config.pin_categories = ";".join(spec.key for spec in specs)
+script.save_config()
+
+# DATA COLLECTION
+perf.phase("collection")
+# all selected categories are collected with one collector
+groups = collect_datum_groups(doc, specs)
+for spec in specs:
+	perf.count(spec.key, len(groups[spec.key]))
+
+# COMPLETE ACTION
+# pinned state is read once per element, one worksharing precheck over all categories and one transaction
+# after the confirmation
+result = pin_datum_groups(doc, groups, specs, "Pin Datums", perf, confirm_pin)
+perf.count("unpinned elements", sum(result.unpinned.values()))
+perf.count("blocked elements", result.blocked_count)
+perf.count("pinned elements", result.pinned_count)
+
+if not sum(result.unpinned.values()):
+	sweco_alert(msg_2)
+
+# OUTPUT FOR USER
+perf.phase("output")
+# get current working directory where current Python script is located
+# specify the relative path to the file image
+# join the current directory with the relative path to create the full path
+current_dir      = os.path.dirname(os.path.realpath(__file__))
+relative_path    = 'pySWECOLogo.png'
+sweco_image_path = os.path.join(current_dir, relative_path)
+
+# output module
+output = script.get_output()
+
+# set output window style
+output.add_style('body { color: black; font-size: 14px; background-color: white; font-family: Arial }')
+
+# import SWECO logo
+output.print_image(sweco_image_path)
+
+# summary table: one row per category
+output.print_table(
+				   summary_rows([result]),
+				   title = "PIN DATUMS RESULTS",
+				   columns = SUMMARY_COLUMNS
+				   )
+
+# elements which cannot be pinned and were not listed before the confirmation (e.g. checkout failed)
+print_blocked(dict((key, [item for item in blocked if item not in previewed]) for key, blocked in result.blocked_by_kind.items()))
+
+# final user message
+if result.status == STATUS_FAILED:
+	forms.alert(
+				'Elements could not be pinned due to: {}'.format(result.message),
+				title = "Error",
+				ok = False
+				)
+else:
+	msg = "{} element(s) have been pinned, {} skipped. See the output window for details.".format(result.pinned_count, result.blocked_count)
+	forms.alert(
+				msg,
+				title = "Script is successfully completed",
+				ok = False,
+				warn_icon = False
+				)
+perf.finish(output)
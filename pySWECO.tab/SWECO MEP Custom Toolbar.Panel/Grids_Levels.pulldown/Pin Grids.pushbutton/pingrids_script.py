@@ -1,106 +1,120 @@
 # IMPORTS
-# import specific Revit libraries which are needed for this script
-from Autodesk.Revit.DB import (
-	FilteredElementCollector, 
-	Grid, 
-	WorksharingUtils, 
-	CheckoutStatus, 
-	ModelUpdatesStatus, 
-	Transaction, 
-	TransactionStatus
-	)
-
 # import pyrevit libraries
 from pyrevit import forms, script
 
+# import pySWECO performance recorder, pin engine and worksharing precheck
+from pysweco.perf import PerfRecorder
+from pysweco.datums import GRIDS
+from pysweco.pinning import STATUS_BLOCKED, STATUS_FAILED
+from pysweco.revitdb.datums import collect_datum_groups
+from pysweco.revitdb.pinning import pin_datum_groups
+from pysweco.revitdb.worksharing import BLOCKED_COLUMNS, blocked_rows
+
+# start timing of the command phases
+perf = PerfRecorder("Pin Grids")
+
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
 # DATA COLLECTION
+perf.phase("collection")
 # collect all grids in the model
-grids_all = FilteredElementCollector(doc).\
-			OfClass(Grid).\
-			WhereElementIsNotElementType().\
-			ToElements()
+grids_all = collect_datum_groups(doc, [GRIDS])[GRIDS.key]
 
-# get a list of un-pinned grids
-unpinned_grids = [grd for grd in grids_all if not grd.Pinned]
+perf.count("grids", len(grids_all))
 
 # FUNCTIONS
-# 1) create a function that sets Pinned property to True or in other words pins grids
-def pin_grid(g):
-	g.Pinned = True
-
-# 2) create a function that checks ownership and status of grids
-def ownership_status(d, grids_list):
-	boolean_list = [
-				   [WorksharingUtils.GetCheckoutStatus(d, grid.Id)		!= CheckoutStatus.OwnedByOtherUser, 
-					WorksharingUtils.GetModelUpdatesStatus(d, grid.Id)  != ModelUpdatesStatus.DeletedInCentral,
-					WorksharingUtils.GetModelUpdatesStatus(d, grid.Id)  != ModelUpdatesStatus.UpdatedInCentral]
-					for grid in grids_list
-					]
-	bool_val = any(False in row for row in boolean_list)
-	return bool_val
-
-# 3) create a function to return pyrevit forms
+# 1) create a function to return pyrevit forms
 def sweco_alert(message):
 	forms.alert(
 	message,
 	title = "Script is cancelled",
 	ok = False
 	)
+	perf.finish(script.get_output())
 	script.exit()
 
-# messages for 3) function
+# messages for 1) function
 msg_1 = "Active Revit document does not contain grids"
 msg_2 = "Active Revit document does not contain un-pinned grids"
-msg_3 = "Some grids cannot be pinned. They are either owned by other user or they have been deleted / updated in the central model."
-
-# FORMS / USER INTERACTION
-# create scenarios where no grids in the model, grids are pinned and check for status
-if not grids_all:
-	sweco_alert(msg_1)
+msg_3 = "Un-pinned grids cannot be pinned. They are either owned by other user or they have been deleted / updated in the central model. See the output window for details."
 
-elif not unpinned_grids:
-	sweco_alert(msg_2)
+# 2) create a function that lists the grids which cannot be pinned in the output window
+def print_blocked(blocked):
+	output = script.get_output()
+	output.print_table(
+					   blocked_rows(output, blocked),
+					   title = "GRIDS WHICH CANNOT BE PINNED",
+					   columns = BLOCKED_COLUMNS
+					   )
 
-elif doc.IsWorkshared and ownership_status(doc, unpinned_grids) == True:
-	sweco_alert(msg_3)
+# blocked grids already listed before the confirmation
+previewed = set()
 
-# COMPLETE ACTION
-else:
+# 3) create a function that lists the blocked grids and asks for confirmation before anything is checked out or pinned
+def confirm_pin(ready_count, blocked_by_kind):
+	blocked = blocked_by_kind[GRIDS.key]
+	# blocked grids are listed in the output window and skipped, all other grids can be pinned
+	if blocked:
+		print_blocked(blocked)
+		previewed.update(blocked)
+		question = ('{} of {} un-pinned grids can be pinned. {} grid(s) listed in the output window cannot be pinned '
+					'and will be skipped. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel').format(ready_count, ready_count + len(blocked), len(blocked))
+	else:
+		question = 'All grids will be pinned. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel'
 	yes_outcome = forms.alert(
-	'All grids will be pinned. Would you like to proceed?\n\nClick "Yes" to proceed \
-	or "No" to cancel',
+	question,
 	ok = False,
 	yes = True,
 	no = True,
 	warn_icon = False,
 	exitscript = True
 	)
-	if yes_outcome == True:
-		pinned_grids_count = 0
-		t = Transaction(doc, "Pin All Grids")
-		try:
-			t.Start()
-			for gr in unpinned_grids:
-				pin_grid(gr)
-				pinned_grids_count += 1
-			t.Commit()
-			# final user message
-			if t.GetStatus() == TransactionStatus.Committed and len(unpinned_grids) == pinned_grids_count:
-				msg = "{} grid(s) have been successfully pinned.\n\n\
-				Transaction status is: {}".format(pinned_grids_count, t.GetStatus())
-				forms.alert(
-							msg,
-							title = "Script is successfully completed", 
-							ok = False, 
-							warn_icon = False
-							)
-		except Exception as e:
-			t.RollBack()
-			forms.alert(
-						'Transaction status is: {}. Some grids could not be pinned due to: {}'.format(t.GetStatus(), e),
-						title = "Error", 
-						ok = False
-						)
\ No newline at end of file
+	return yes_outcome == True
+
+# COMPLETE ACTION
+# create a scenario where there are no grids in the model
+if not grids_all:
+	sweco_alert(msg_1)
+
+# pinned state is read once per grid, checkout and model updates status once per un-pinned grid; after the
+# confirmation the grids which are not owned by current user are checked out in one call and pinned in one transaction
+result = pin_datum_groups(doc, {GRIDS.key: grids_all}, [GRIDS], "Pin All Grids", perf, confirm_pin)
+perf.count("unpinned grids", sum(result.unpinned.values()))
+perf.count("blocked grids", result.blocked_count)
+perf.count("pinned grids", result.pinned_count)
+
+# FORMS / USER INTERACTION
+perf.phase("user input")
+# grids which could not be checked out after the confirmation
+not_checked_out = [item for item in result.blocked_elements if item not in previewed]
+
+# create scenarios where grids are pinned and check for status
+if not sum(result.unpinned.values()):
+	sweco_alert(msg_2)
+
+elif result.status == STATUS_BLOCKED:
+	print_blocked(not_checked_out)
+	sweco_alert(msg_3)
+
+elif result.status == STATUS_FAILED:
+	if not_checked_out:
+		print_blocked(not_checked_out)
+	forms.alert(
+				'Some grids could not be pinned due to: {}'.format(result.message),
+				title = "Error",
+				ok = False
+				)
+
+else:
+	if not_checked_out:
+		print_blocked(not_checked_out)
+	# final user message
+	msg = "{} grid(s) have been successfully pinned, {} skipped.".format(result.pinned_count, result.blocked_count)
+	forms.alert(
+				msg,
+				title = "Script is successfully completed",
+				ok = False,
+				warn_icon = False
+				)
+perf.finish(script.get_output())
\ No newline at end of file
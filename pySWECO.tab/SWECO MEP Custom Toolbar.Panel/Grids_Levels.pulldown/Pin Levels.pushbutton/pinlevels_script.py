@@ -1,102 +1,115 @@
 # IMPORTS
-# import specific Revit libraries which are needed for this script
-from Autodesk.Revit.DB import (
-	FilteredElementCollector,
-	Level,
-	WorksharingUtils,
-	CheckoutStatus,
-	ModelUpdatesStatus,
-	Transaction, 
-	TransactionStatus
-	)
-
 # import pyrevit libraries
 from pyrevit import forms, script
 
+# import pySWECO performance recorder, pin engine and worksharing precheck
+from pysweco.perf import PerfRecorder
+from pysweco.datums import LEVELS
+from pysweco.pinning import STATUS_BLOCKED, STATUS_FAILED
+from pysweco.revitdb.datums import collect_datum_groups
+from pysweco.revitdb.pinning import pin_datum_groups
+from pysweco.revitdb.worksharing import BLOCKED_COLUMNS, blocked_rows
+
+# start timing of the command phases
+perf = PerfRecorder("Pin Levels")
+
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
 # DATA COLLECTION
+perf.phase("collection")
 # collect all levels in the model
-levels_all = FilteredElementCollector(doc).\
-			OfClass(Level).\
-			WhereElementIsNotElementType().\
-			ToElements()
+levels_all = collect_datum_groups(doc, [LEVELS])[LEVELS.key]
 
-# get a list of un-pinned levels
-unpinned_levels = [lvl for lvl in levels_all if not lvl.Pinned]
+perf.count("levels", len(levels_all))
 
 # FUNCTIONS
-# 1) create a function that sets Pinned property to True or in other words pins levels
-def pin_level(l):
-	l.Pinned = True
-
-# 2) create a function that checks ownership and status of levels
-def ownership_status(d, levels_list):
-	boolean_list = [
-				   [WorksharingUtils.GetCheckoutStatus(d, level.Id)		!= CheckoutStatus.OwnedByOtherUser,
-					WorksharingUtils.GetModelUpdatesStatus(d, level.Id) != ModelUpdatesStatus.DeletedInCentral,
-					WorksharingUtils.GetModelUpdatesStatus(d, level.Id) != ModelUpdatesStatus.UpdatedInCentral]
-					for level in levels_list
-					]
-	bool_val = any(False in row for row in boolean_list)
-	return bool_val
-
-# 3) create a function to return pyrevit forms
+# 1) create a function to return pyrevit forms
 def sweco_alert(message):
 	forms.alert(
 	message,
 	title = "Script is cancelled",
 	ok = False
 	)
+	perf.finish(script.get_output())
 	script.exit()
 
-# messages for 3) function
+# messages for 1) function
 msg_1 = "Active Revit document does not contain un-pinned levels"
-msg_2 = "Some levels cannot be pinned. They are either owned by other user or they have been deleted / updated in the central model."
+msg_2 = "Un-pinned levels cannot be pinned. They are either owned by other user or they have been deleted / updated in the central model. See the output window for details."
 
-# FORMS / USER INTERACTION
-# create scenarios where levels are pinned and check for status
-if not unpinned_levels:
-	sweco_alert(msg_1)
+# 2) create a function that lists the levels which cannot be pinned in the output window
+def print_blocked(blocked):
+	output = script.get_output()
+	output.print_table(
+					   blocked_rows(output, blocked),
+					   title = "LEVELS WHICH CANNOT BE PINNED",
+					   columns = BLOCKED_COLUMNS
+					   )
 
-elif doc.IsWorkshared and ownership_status(doc, unpinned_levels) == True:
-	sweco_alert(msg_2)
+# blocked levels already listed before the confirmation
+previewed = set()
 
-# COMPLETE ACTION
-else:
+# 3) create a function that lists the blocked levels and asks for confirmation before anything is checked out or pinned
+def confirm_pin(ready_count, blocked_by_kind):
+	blocked = blocked_by_kind[LEVELS.key]
+	# blocked levels are listed in the output window and skipped, all other levels can be pinned
+	if blocked:
+		print_blocked(blocked)
+		previewed.update(blocked)
+		question = ('{} of {} un-pinned levels can be pinned. {} level(s) listed in the output window cannot be pinned '
+					'and will be skipped. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel').format(ready_count, ready_count + len(blocked), len(blocked))
+	else:
+		question = 'All levels will be pinned. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel'
 	yes_outcome = forms.alert(
-	'All levels will be pinned. Would you like to proceed?\n\nClick "Yes" to proceed \
-	or "No" to cancel',
+	question,
 	ok = False,
 	yes = True,
 	no = True,
 	warn_icon = False,
 	exitscript = True
 	)
-	if yes_outcome == True:
-		pinned_levels_counter = 0
-		t = Transaction(doc, "Pin All Levels")
-		try:
-			t.Start()
-			for lv in unpinned_levels:
-				pin_level(lv)
-				pinned_levels_counter += 1
-			t.Commit()
-			# final user message
-			if t.GetStatus() == TransactionStatus.Committed and len(unpinned_levels) == pinned_levels_counter:
-				msg = "{} level(s) have been successfully pinned.\n\n\
-				Transaction status: {}".format(pinned_levels_counter, t.GetStatus())
-				forms.alert(
-							msg,
-							title = "Script is successfully completed", 
-							ok = False, 
-							warn_icon = False
-							)
-		except Exception as e:
-			t.RollBack()
-			forms.alert(
-						'Transaction status is: {}. Some levels could not be pinned due to: {}'.format(t.GetStatus(), e),
-						title = "Error", 
-						ok = False
-						)
\ No newline at end of file
+	return yes_outcome == True
+
+# COMPLETE ACTION
+# pinned state is read once per level, checkout and model updates status once per un-pinned level; after the
+# confirmation the levels which are not owned by current user are checked out in one call and pinned in one transaction
+result = pin_datum_groups(doc, {LEVELS.key: levels_all}, [LEVELS], "Pin All Levels", perf, confirm_pin)
+perf.count("unpinned levels", sum(result.unpinned.values()))
+perf.count("blocked levels", result.blocked_count)
+perf.count("pinned levels", result.pinned_count)
+
+# FORMS / USER INTERACTION
+perf.phase("user input")
+# levels which could not be checked out after the confirmation
+not_checked_out = [item for item in result.blocked_elements if item not in previewed]
+
+# create scenarios where levels are pinned and check for status
+if not sum(result.unpinned.values()):
+	sweco_alert(msg_1)
+
+elif result.status == STATUS_BLOCKED:
+	print_blocked(not_checked_out)
+	sweco_alert(msg_2)
+
+elif result.status == STATUS_FAILED:
+	if not_checked_out:
+		print_blocked(not_checked_out)
+	forms.alert(
+				'Some levels could not be pinned due to: {}'.format(result.message),
+				title = "Error",
+				ok = False
+				)
+
+else:
+	if not_checked_out:
+		print_blocked(not_checked_out)
+	# final user message
+	msg = "{} level(s) have been successfully pinned, {} skipped.".format(result.pinned_count, result.blocked_count)
+	forms.alert(
+				msg,
+				title = "Script is successfully completed",
+				ok = False,
+				warn_icon = False
+				)
+perf.finish(script.get_output())
\ No newline at end of file
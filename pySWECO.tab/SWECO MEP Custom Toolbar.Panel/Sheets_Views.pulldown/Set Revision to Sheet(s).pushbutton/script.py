@@ -1,5 +1,300 @@
-# import pyrevit libraries
+# IMPORTS
+# import Revit & pyrevit libraries
+from Autodesk.Revit.DB import Transaction
+
 from pyrevit import forms, script
 
-forms.inform_wip()
+import os
+
+# import pySWECO library
+from pysweco.perf import PerfRecorder
+from pysweco.revitdb.worksharing import BLOCKED_COLUMNS, precheck_elements, checkout_elements, blocked_rows
+from pysweco.revisions import ACTION_ADD, ACTION_REMOVE, select_by_pattern, select_by_ids, select_by_values, plan_changes, summarize
+from pysweco.revitdb import id_value
+from pysweco.revitdb.revisions import collect_sheets, read_sheet, collect_revisions, revision_label, sheet_sets, title_block_values, apply_changes
+
+# start timing of the command phases
+perf = PerfRecorder("Set Revision to Sheet(s)")
+
+# get current Revit document
+doc = __revit__.ActiveUIDocument.Document
+
+# get current working directory where current Python script is located
+# specify the relative path to the file image
+# join the current directory with the relative path to create the full path
+current_dir      = os.path.dirname(os.path.realpath(__file__))
+relative_path    = 'pySWECOLogo.png'
+sweco_image_path = os.path.join(current_dir, relative_path)
+
+# DATA COLLECTION
+perf.phase("collection")
+# collect all sheets and read each sheet once: number, name, additional revisions and approver
+sheet_elements = collect_sheets(doc)
+sheets_by_id   = {id_value(sheet.Id): sheet for sheet in sheet_elements}
+sheet_records  = [read_sheet(sheet) for sheet in sheet_elements]
+
+# collect all revisions in sequence order
+revisions      = collect_revisions(doc)
+revision_ids   = {id_value(revision.Id): revision.Id for revision in revisions}
+
+perf.count("sheets", len(sheet_records))
+perf.count("revisions", len(revisions))
+
+# FUNCTIONS
+# 1) create a function to display alert form
+def sweco_alert(message):
+	forms.alert(
+	message,
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+# messages for 1) function
+msg_1 = "Active Revit document does not contain sheets."
+msg_2 = "Active Revit document does not contain revisions."
+msg_3 = "No option selected."
+msg_4 = "No sheets match the selection."
+msg_5 = "No revisions selected."
+msg_6 = "Selected sheets are already up to date. Nothing to change."
+msg_7 = "Sheets to change cannot be changed. They are either owned by other user or they have been deleted / updated in the central model. See the output window for details."
+
+# 2) create a function that lists the sheets which cannot be changed in the output window
+def print_blocked(blocked):
+	output = script.get_output()
+	output.print_table(
+					   blocked_rows(output, blocked),
+					   title = "SHEETS WHICH CANNOT BE CHANGED",
+					   columns = BLOCKED_COLUMNS
+					   )
+
+# create a simple class with name to feed pyrevit form with revisions
+class RevisionItem:
+	def __init__(self, revision):
+		self.revision_id = id_value(revision.Id)
+		self.name = revision_label(revision)
+
+# options of the user forms
+ADD_REVISIONS    = "Add Revision(s) to Sheet(s)"
+REMOVE_REVISIONS = "Remove Revision(s) from Sheet(s)"
+ALL_SHEETS       = "All Sheets"
+BY_PATTERN       = "Sheet Number / Name Pattern"
+BY_SHEET_SET     = "Sheet Set"
+BY_TITLE_BLOCK   = "Title Block Parameter"
+APPLY            = "Apply Changes"
+DRY_RUN          = "Dry Run (summary only)"
+
+# USER INTERACTION
+perf.phase("user input")
+if not sheet_records:
+	sweco_alert(msg_1)
+
+if not revisions:
+	sweco_alert(msg_2)
+
+# select action
+action_option = forms.ask_for_one_item(
+				[ADD_REVISIONS, REMOVE_REVISIONS],
+				default = ADD_REVISIONS,
+				prompt = "Select action",
+				title = "Set Revision to Sheet(s)"
+				)
+if not action_option:
+	sweco_alert(msg_3)
+action = ACTION_ADD if action_option == ADD_REVISIONS else ACTION_REMOVE
+
+# select sheets: all, by number / name pattern, by sheet set or by title block parameter
+selection_option = forms.ask_for_one_item(
+				   [ALL_SHEETS, BY_PATTERN, BY_SHEET_SET, BY_TITLE_BLOCK],
+				   default = BY_PATTERN,
+				   prompt = "Select sheets by",
+				   title = "Set Revision to Sheet(s)"
+				   )
+if not selection_option:
+	sweco_alert(msg_3)
+
+if selection_option == ALL_SHEETS:
+	selected_sheets = sheet_records
+
+elif selection_option == BY_PATTERN:
+	pattern = forms.ask_for_string(
+			  default = "*",
+			  prompt = 'Sheet number or name pattern, e.g. "M-1*" or "M-1*; M-2*" ("*" any text, "?" one character)',
+			  title = "Set Revision to Sheet(s)"
+			  )
+	selected_sheets = select_by_pattern(sheet_records, pattern)
+
+elif selection_option == BY_SHEET_SET:
+	sets = sheet_sets(doc)
+	if not sets:
+		sweco_alert("Active Revit document does not contain sheet sets.")
+	set_name = forms.ask_for_one_item(
+			   sorted(sets.keys()),
+			   default = sorted(sets.keys())[0],
+			   prompt = "Select sheet set",
+			   title = "Set Revision to Sheet(s)"
+			   )
+	if not set_name:
+		sweco_alert(msg_3)
+	selected_sheets = select_by_ids(sheet_records, sets[set_name])
+
+else:
+	parameter_name = forms.ask_for_string(
+					 prompt = "Title block parameter name",
+					 title = "Set Revision to Sheet(s)"
+					 )
+	if not parameter_name:
+		sweco_alert(msg_3)
+	parameter_pattern = forms.ask_for_string(
+						default = "*",
+						prompt = 'Value pattern of "{}" ("*" any text, "?" one character)'.format(parameter_name),
+						title = "Set Revision to Sheet(s)"
+						)
+	selected_sheets = select_by_values(sheet_records, title_block_values(doc, parameter_name), parameter_pattern)
+
+if not selected_sheets:
+	sweco_alert(msg_4)
+
+# select revisions
+revision_selection = forms.SelectFromList.show(
+					 [RevisionItem(revision) for revision in revisions],
+					 title = "{} ({} sheets selected)".format(action_option, len(selected_sheets)),
+					 width = 600,
+					 height = 500,
+					 button_name = "Select",
+					 multiselect = True
+					 )
+if not revision_selection:
+	sweco_alert(msg_5)
+
+# approver field: set it when adding revisions (empty = leave as it is), optionally clear it when removing
+if action == ACTION_ADD:
+	approver = forms.ask_for_string(
+			   prompt = "Approver (leave empty to keep the current approver field)",
+			   title = "Set Revision to Sheet(s)"
+			   ) or None
+else:
+	clear_approver = forms.alert(
+					 "Clear approver field of the changed sheets?",
+					 ok = False,
+					 yes = True,
+					 no = True,
+					 warn_icon = False
+					 )
+	approver = "" if clear_approver else None
+
+# DIFF
+perf.phase("diff")
+# only sheets which actually change are kept
+changes = plan_changes(selected_sheets, [item.revision_id for item in revision_selection], action, approver)
+summary = summarize(selected_sheets, changes)
+perf.count("selected sheets", summary["selected"])
+perf.count("changed sheets", summary["changed"])
+
+if not changes:
+	sweco_alert(msg_6)
+
+# WORKSHARING CHECKS
+perf.phase("worksharing checks")
+# checkout and model updates status are read once per sheet to change, blocked sheets are listed with their owners
+# and skipped, so one sheet owned by other user does not roll back the whole issue
+precheck = precheck_elements(doc, [sheets_by_id[change.sheet.sheet_id] for change in changes])
+perf.count("blocked sheets", len(precheck.blocked))
+summary["blocked"] = len(precheck.blocked)
+if not precheck.ready:
+	print_blocked(precheck.blocked)
+	sweco_alert(msg_7)
+
+# select run mode: apply or dry run
+perf.phase("user input")
+if precheck.blocked:
+	print_blocked(precheck.blocked)
+	prompt = "{} of {} selected sheets will change, {} sheet(s) listed in the output window cannot be changed and will be skipped. Select run mode".format(
+		len(precheck.ready), summary["selected"], len(precheck.blocked))
+else:
+	prompt = "{} of {} selected sheets will change. Select run mode".format(summary["changed"], summary["selected"])
+run_mode = forms.ask_for_one_item(
+		   [APPLY, DRY_RUN],
+		   default = DRY_RUN,
+		   prompt = prompt,
+		   title = "Set Revision to Sheet(s)"
+		   )
+if not run_mode:
+	sweco_alert(msg_3)
+
+# APPLY
+# the sheets which are not owned by current user are checked out in one call, the ones which cannot be checked out
+# are skipped; all changes of the ready sheets are written in one transaction
+status = None
+if run_mode == APPLY:
+	t = Transaction(doc, 'Set Revision to Sheet(s)')
+	try:
+		perf.phase("checkout")
+		not_checked_out = checkout_elements(doc, precheck)
+		if not_checked_out:
+			print_blocked(precheck.blocked[-not_checked_out:])
+		ready_ids = set(id_value(sheet.Id) for sheet in precheck.ready)
+		changes   = [change for change in changes if change.sheet.sheet_id in ready_ids]
+		summary   = summarize(selected_sheets, changes)
+		summary["blocked"] = len(precheck.blocked)
+		perf.count("updated sheets", len(changes))
+		perf.phase("transaction")
+		t.Start()
+		apply_changes(changes, sheets_by_id, revision_ids)
+		t.Commit()
+		status = t.GetStatus()
+	except Exception as e:
+		if t.HasStarted() and not t.HasEnded():
+			t.RollBack()
+		forms.alert(
+					'Transaction status is: {}. Revisions could not be updated due to: {}'.format(t.GetStatus(), e),
+					title = "Error",
+					ok = False
+					)
+		perf.finish(script.get_output())
+		script.exit()
+
+# OUTPUT FOR USER
+perf.phase("output")
+# import output module
+output = script.get_output()
+
+# set output style and window height
+output.add_style('body { color: black; background-color: white; font-size: 14px; font-family: Arial }')
+output.set_height(700)
+
+# import SWECO logo
+output.print_image(sweco_image_path)
+
+# revision id -> revision label
+labels = {id_value(revision.Id): revision_label(revision) for revision in revisions}
+
+# summary table
+output.print_table(
+				   [[key.capitalize(), value] for key, value in summary.items()],
+				   title = "{} - {}".format(action_option.upper(), "TRANSACTION STATUS: {}".format(status) if status is not None else "DRY RUN, NOTHING CHANGED"),
+				   columns = ["SUMMARY", "COUNT"]
+				   )
+
+# changed sheets table
+data = [
+		[
+		"<b>{}</b>".format(change.sheet.number),
+		change.sheet.name,
+		"<br>".join(labels[r] for r in change.added) or "-",
+		"<br>".join(labels[r] for r in change.removed) or "-",
+		change.approver if change.approver_changed else "-"
+		]
+		for change in changes
+		]
+output.print_table(
+				   data,
+				   title = "CHANGED SHEETS",
+				   columns = ["SHEET NUMBER", "SHEET NAME", "REVISIONS ADDED", "REVISIONS REMOVED", "APPROVER"]
+				   )
+if action == ACTION_REMOVE:
+	output.print_md("Revisions shown on a sheet by revision clouds are not additional revisions and stay on the sheet.")
+
+perf.finish(output)
 script.exit()
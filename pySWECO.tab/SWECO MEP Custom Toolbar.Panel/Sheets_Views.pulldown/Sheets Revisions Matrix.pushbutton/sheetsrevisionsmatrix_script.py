@@ -0,0 +1,157 @@
+# IMPORTS
+# import pyrevit libraries
+from pyrevit import forms, script
+
+import os
+
+# import pySWECO library
+from pysweco.perf import PerfRecorder
+from pysweco.export import RowExport
+from pysweco.revisions import build_revision_matrix
+from pysweco.revitdb import id_value
+from pysweco.revitdb.revisions import collect_revision_elements, iter_cloud_revisions, read_sheet, revision_label
+
+# start timing of the command phases
+perf = PerfRecorder("Sheets Revisions Matrix")
+
+# get current Revit document
+doc = __revit__.ActiveUIDocument.Document
+
+# get current working directory where current Python script is located
+# specify the relative path to the file image
+# join the current directory with the relative path to create the full path
+current_dir      = os.path.dirname(os.path.realpath(__file__))
+relative_path    = 'pySWECOLogo.png'
+sweco_image_path = os.path.join(current_dir, relative_path)
+
+# DATA COLLECTION
+perf.phase("collection")
+# collect sheets, revisions and revision clouds in one collector pass
+sheet_elements, revisions, clouds = collect_revision_elements(doc)
+
+# read each sheet once: number, name and additional revisions
+sheet_records = sorted([read_sheet(sheet) for sheet in sheet_elements], key=lambda s: s.number)
+
+perf.count("sheets", len(sheet_records))
+perf.count("revisions", len(revisions))
+perf.count("revision clouds", len(clouds))
+
+# build the sheet <-> revision index: additional revisions and revisions shown by clouds
+perf.phase("index")
+matrix        = build_revision_matrix(sheet_records, iter_cloud_revisions(clouds))
+revision_ids  = [id_value(revision.Id) for revision in revisions]
+sheets_by_id  = {sheet.sheet_id: sheet for sheet in sheet_records}
+
+# FUNCTIONS
+# 1) create a function to display alert form
+def sweco_alert(message):
+	forms.alert(
+	message,
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+# messages for 1) function
+msg_1 = "Active Revit document does not contain sheets."
+msg_2 = "Active Revit document does not contain revisions."
+msg_3 = "No option selected."
+msg_4 = "No revisions selected."
+
+# 2) create a function that returns the matrix column header of a revision
+def revision_column(revision):
+	return "Seq. {} - {}".format(revision.SequenceNumber, revision.RevisionNumber)
+
+# create a simple class with name to feed pyrevit form with revisions
+class RevisionItem:
+	def __init__(self, revision):
+		self.revision_id = id_value(revision.Id)
+		self.name = "{} ({} sheets)".format(revision_label(revision), len(matrix.sheets(self.revision_id)))
+
+# options of the user form
+MATRIX    = "Sheet x Revision Matrix"
+SHEETS_OF = "Sheets Carrying Revision(s)"
+EXPORT    = "Export Matrix to CSV"
+
+# USER INTERACTION
+perf.phase("user input")
+if not sheet_records:
+	sweco_alert(msg_1)
+
+if not revisions:
+	sweco_alert(msg_2)
+
+report_option = forms.ask_for_one_item(
+				[MATRIX, SHEETS_OF, EXPORT],
+				default = MATRIX,
+				prompt = "Select report",
+				title = "Sheets Revisions Matrix"
+				)
+if not report_option:
+	sweco_alert(msg_3)
+
+# export mode: ask for the export file before any output is written
+if report_option == EXPORT:
+	export_path = forms.save_file(
+				  files_filter = "CSV (*.csv)|*.csv",
+				  default_name = "{} - Sheets Revisions Matrix".format(doc.Title)
+				  )
+	if not export_path:
+		sweco_alert("No export file selected")
+
+# sheets of revisions mode: select the revisions to look up
+if report_option == SHEETS_OF:
+	revision_selection = forms.SelectFromList.show(
+						 [RevisionItem(revision) for revision in revisions],
+						 title = "Sheets Carrying Revision(s)",
+						 width = 600,
+						 height = 500,
+						 button_name = "Show Sheets",
+						 multiselect = True
+						 )
+	if not revision_selection:
+		sweco_alert(msg_4)
+
+# OUTPUT FOR USER
+perf.phase("output")
+# import output module
+output = script.get_output()
+
+# set output style and window height
+output.add_style('body { color: black; background-color: white; font-size: 14px; font-family: Arial }')
+output.set_height(700)
+
+# import SWECO logo
+output.print_image(sweco_image_path)
+
+# summary table: number of sheets carrying each revision
+output.print_table(
+				   [[revision_label(revision), len(matrix.sheets(id_value(revision.Id)))] for revision in revisions],
+				   title = "REVISIONS ON SHEETS ({} SHEETS)".format(len(sheet_records)),
+				   columns = ["REVISION", "Number of Sheets"]
+				   )
+
+if report_option == MATRIX:
+	output.print_table(
+					   list(matrix.rows(sheet_records, revision_ids)),
+					   title = "TABLE OF SHEETS & REVISIONS (A = ADDITIONAL, C = REVISION CLOUD)",
+					   columns = ["SHEET NUMBER", "SHEET NAME"] + [revision_column(revision) for revision in revisions]
+					   )
+
+elif report_option == SHEETS_OF:
+	for item in revision_selection:
+		sheets = sorted([sheets_by_id[sheet_id] for sheet_id in matrix.sheets(item.revision_id) if sheet_id in sheets_by_id], key=lambda s: s.number)
+		output.print_table(
+						   [[sheet.number, sheet.name, matrix.mark(sheet.sheet_id, item.revision_id)] for sheet in sheets],
+						   title = item.name.upper(),
+						   columns = ["SHEET NUMBER", "SHEET NAME", "SOURCE"]
+						   )
+
+else:
+	with RowExport(export_path, ["Sheet Number", "Sheet Name"] + [revision_column(revision) for revision in revisions]) as export:
+		export.write_rows(matrix.rows(sheet_records, revision_ids))
+	output.print_md("{} sheets exported to {}".format(export.rows, export_path))
+
+perf.finish(output)
+script.exit()
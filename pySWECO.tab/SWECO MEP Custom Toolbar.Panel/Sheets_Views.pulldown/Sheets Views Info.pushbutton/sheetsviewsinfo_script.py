@@ -2,14 +2,23 @@
 # import Revit & pyrevit libraries
 from Autodesk.Revit.DB import (
 	FilteredElementCollector, 
-	View, 
-	BuiltInParameter
+	View
 	)
 
 from pyrevit import script
 
 import os
 
+# import pySWECO performance recorder
+from pysweco.perf import PerfRecorder
+
+# import pySWECO view histogram
+from pysweco.views import build_view_histogram
+from pysweco.revitdb.views import RevitViewReader, sheet_placement_index
+
+# start timing of the command phases
+perf = PerfRecorder("Sheets Views Info")
+
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
@@ -21,86 +30,58 @@ relative_path    = 'pySWECOLogo.png'
 sweco_image_path = os.path.join(current_dir, relative_path)
 
 # DATA COLLECTION
+perf.phase("collection")
 # get all view types in the model
 all_views = FilteredElementCollector(doc).\
 			OfClass(View).\
 			WhereElementIsNotElementType().\
 			ToElements()
 
-# create a list of most used views
-view_list = [
-			"3D Views",
-			"Area Plans",
-			"Ceiling Plans",
-			"Drafting Views",
-			"Elevations",
-			"Floor Plans", 
-			"Legends",
-			"Renderings",
-			"Sections",
-			"Schedules",
-			"Sheets", 
-			"Structural Plans",
-			"Walkthroughs"
-			]
-
-# filter views / remove view templates
-all_views_types = [av for av in all_views if not av.IsTemplate and av.get_Parameter(BuiltInParameter.VIEW_FAMILY).AsString() in view_list]
-
-# FUNCTION
-# create a function to count views
-def views_count(view_name):
-	try:
-		if view_name in ["Legends", "Sheets"]:
-			l_s	 	 	= len([ls for ls in all_views_types if ls.get_Parameter(BuiltInParameter.VIEW_FAMILY).AsString() == view_name])
-			result_1 	= ['<b>{}</b>'.format(view_name), l_s, "N/A", "N/A"]
-			return result_1
-		elif view_name  == "Schedules":
-			schedule	= len([sc for sc in all_views_types if sc.get_Parameter(BuiltInParameter.VIEW_FAMILY).AsString() == view_name and not "Revision Schedule" in sc.get_Parameter(BuiltInParameter.VIEW_NAME).AsString()])
-			result_2 	= ['<b>{}</b>'.format(view_name), schedule, "N/A", "N/A"]
-			return result_2
-		else:
-			view		= [v for v in all_views_types if v.get_Parameter(BuiltInParameter.VIEW_FAMILY).AsString() == view_name]
-			v_sh		= len([vs for vs in view if vs.get_Parameter(BuiltInParameter.VIEWER_SHEET_NUMBER).AsString() != "---"])
-			v_not_sh	= len([vns for vns in view if vns.get_Parameter(BuiltInParameter.VIEWER_SHEET_NUMBER).AsString() == "---"])
-			result_3 	= ['<b>{}</b>'.format(view_name), len(view), v_sh, v_not_sh]
-			return result_3
-	except:
-		pass
+perf.count("views", len(all_views))
+
+# map every view to the sheets it is placed on from the viewports and schedules on sheets
+placement = sheet_placement_index(doc)
+
+perf.count("placed views", len(placement.sheets_by_view))
+
+perf.phase("classification")
+# count views per view type and placement in one pass
+histogram = build_view_histogram(all_views, RevitViewReader(), placement)
 
 # OUTPUT FOR USER
 # table data
 data = [
 		[""],
-		views_count("3D Views"),
+		histogram.row("3D Views"),
 		[""],
-		views_count("Ceiling Plans"),
+		histogram.row("Ceiling Plans"),
 		[""],
-		views_count("Elevations"),
+		histogram.row("Elevations"),
 		[""],
-		views_count("Floor Plans"),
+		histogram.row("Floor Plans"),
 		[""],
-		views_count("Legends"),
+		histogram.row("Legends"),
 		[""],
-		views_count("Sections"),
+		histogram.row("Sections"),
 		[""],
-		views_count("Schedules"),
+		histogram.row("Schedules"),
 		[""],
-		views_count("Sheets"),
+		histogram.row("Sheets"),
 		[""],
 		[""],
 		[""],
-		views_count("Area Plans"),
+		histogram.row("Area Plans"),
 		[""],
-		views_count("Drafting Views"),
+		histogram.row("Drafting Views"),
 		[""],
-		views_count("Renderings"),
+		histogram.row("Renderings"),
 		[""],
-		views_count("Structural Plans"),
+		histogram.row("Structural Plans"),
 		[""],
-		views_count("Walkthroughs")
+		histogram.row("Walkthroughs")
 		]
 
+perf.phase("output")
 # import output module
 output = script.get_output()
 
@@ -116,4 +97,5 @@ output.print_table(
 					title = "TABLE OF SHEETS & VIEWS COUNT",
 					columns = ["VIEW TYPE", "Total Number of Views", "Views on Sheets", "Views not on Sheets"]
 					)
+perf.finish(output)
 script.exit()
\ No newline at end of file
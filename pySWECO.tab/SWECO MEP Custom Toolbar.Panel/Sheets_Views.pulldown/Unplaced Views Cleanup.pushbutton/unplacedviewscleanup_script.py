@@ -0,0 +1,166 @@
+# IMPORTS
+# import pyrevit libraries
+from pyrevit import forms, script
+
+import os
+from collections import Counter
+
+# import pySWECO library
+from pysweco.perf import PerfRecorder
+from pysweco.revitdb import id_value, element_id
+from pysweco.revitdb.views import collect_view_records, sheet_placement_index, delete_in_chunks
+from pysweco.views import unplaced_views
+
+# start timing of the command phases
+perf = PerfRecorder("Unplaced Views Cleanup")
+
+# get current Revit document and open views, open views are never deleted
+uidoc = __revit__.ActiveUIDocument
+doc   = uidoc.Document
+
+# get current working directory where current Python script is located
+# specify the relative path to the file image
+# join the current directory with the relative path to create the full path
+current_dir      = os.path.dirname(os.path.realpath(__file__))
+relative_path    = 'pySWECOLogo.png'
+sweco_image_path = os.path.join(current_dir, relative_path)
+
+# keep-list of view name patterns saved in pyRevit settings
+config    = script.get_config()
+keep_list = config.get_option("keep_list", "")
+
+# number of views deleted per transaction (one regeneration per chunk)
+CHUNK_SIZE = 250
+
+# DATA COLLECTION
+perf.phase("collection")
+# read every view once and map every view to the sheets it is placed on
+view_records = collect_view_records(doc)
+placement    = sheet_placement_index(doc)
+open_views   = [id_value(ui_view.ViewId) for ui_view in uidoc.GetOpenUIViews()]
+
+perf.count("views", len(view_records))
+
+# FUNCTIONS
+# 1) create a function to display alert form
+def sweco_alert(message):
+	forms.alert(
+	message,
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(script.get_output())
+	script.exit()
+
+# messages for 1) function
+msg_1 = "No option selected."
+msg_2 = "Active Revit document does not contain unplaced views that can be deleted."
+msg_3 = "No views selected."
+
+# create a simple class with name to feed pyrevit form with views, grouped by view family in the name
+class ViewItem:
+	def __init__(self, record):
+		self.record = record
+		self.name = "{}: {}".format(record.family, record.name)
+
+# options of the user form
+DELETE_VIEWS = "Delete Unplaced Views"
+EDIT_KEEP    = "Edit Keep-List"
+
+# USER INTERACTION
+perf.phase("user input")
+cleanup_option = forms.ask_for_one_item(
+				 [DELETE_VIEWS, EDIT_KEEP],
+				 default = DELETE_VIEWS,
+				 prompt = "Select option (keep-list: {})".format(keep_list or "empty"),
+				 title = "Unplaced Views Cleanup"
+				 )
+if not cleanup_option:
+	sweco_alert(msg_1)
+
+# edit keep-list: view name patterns separated by ";"
+if cleanup_option == EDIT_KEEP:
+	new_keep_list = forms.ask_for_string(
+					default = keep_list,
+					prompt = 'View name patterns never deleted, separated by ";" e.g. "WORKING*; *_KEEP" ("*" any text, "?" one character)',
+					title = "Unplaced Views Cleanup"
+					)
+	if new_keep_list is not None:
+		config.keep_list = new_keep_list
+		script.save_config()
+		keep_list = new_keep_list
+
+# list unplaced views that can be deleted
+perf.phase("classification")
+candidates = sorted(unplaced_views(view_records, placement, keep_list, open_views), key=lambda r: (r.family, r.name))
+perf.count("unplaced views", len(candidates))
+
+if not candidates:
+	sweco_alert(msg_2)
+
+perf.phase("user input")
+view_selection = forms.SelectFromList.show(
+				 [ViewItem(record) for record in candidates],
+				 title = "Unplaced Views ({})".format(len(candidates)),
+				 width = 600,
+				 height = 750,
+				 button_name = "Delete Views",
+				 multiselect = True
+				 )
+if not view_selection:
+	sweco_alert(msg_3)
+
+# double check if user wishes to proceed
+forms.alert(
+	'{} view(s) will be deleted in chunks of {}. Would you like to proceed?\n\n\
+	Click "Yes" to proceed or "No" to cancel.'.format(len(view_selection), CHUNK_SIZE),
+	ok = False,
+	yes = True,
+	no = True,
+	warn_icon = True,
+	exitscript = True
+	)
+
+# DELETION
+# views are deleted chunk by chunk inside one transaction group, the progress bar can stop after any chunk
+perf.phase("transaction")
+family_of = {item.record.view_id: item.record.family for item in view_selection}
+with forms.ProgressBar(title = "Deleting views ({value} of {max_value})", cancellable = True) as progress:
+	def on_chunk(done, total):
+		progress.update_progress(done, total)
+		return progress.cancelled
+	deleted, failed = delete_in_chunks(
+					  doc,
+					  [element_id(item.record.view_id) for item in view_selection],
+					  "Delete Unplaced Views",
+					  chunk_size = CHUNK_SIZE,
+					  on_chunk = on_chunk
+					  )
+perf.count("deleted views", len(deleted))
+perf.count("failed views", len(failed))
+
+# OUTPUT FOR USER
+perf.phase("output")
+# import output module
+output = script.get_output()
+
+# set output style and window height
+output.add_style('body { color: black; background-color: white; font-size: 14px; font-family: Arial }')
+output.set_height(700)
+
+# import SWECO logo
+output.print_image(sweco_image_path)
+
+# deleted / failed views per view family
+deleted_count = Counter(family_of[view_id] for view_id in deleted)
+failed_count  = Counter(family_of[view_id] for view_id in failed)
+selected      = Counter(family_of.values())
+data = [["<b>{}</b>".format(family), count, deleted_count[family], failed_count[family], count - deleted_count[family] - failed_count[family]] for family, count in sorted(selected.items())]
+output.print_table(
+				   data,
+				   title = "UNPLACED VIEWS CLEANUP",
+				   columns = ["VIEW TYPE", "Views Selected", "Views Deleted", "Views not Deleted", "Views Skipped (cancelled)"]
+				   )
+
+perf.finish(output)
+script.exit()
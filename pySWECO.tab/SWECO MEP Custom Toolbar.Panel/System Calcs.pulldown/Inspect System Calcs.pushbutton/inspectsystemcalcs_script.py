@@ -3,13 +3,42 @@
 from Autodesk.Revit.DB import FilteredElementCollector, BuiltInParameter
 from Autodesk.Revit.DB.Mechanical import MechanicalSystemType
 from Autodesk.Revit.DB.Plumbing import PipingSystemType
-from pyrevit import script
+from pyrevit import forms, script, EXEC_PARAMS
 import os
 
+# import pySWECO performance recorder and network size analysis
+from pysweco.perf import PerfRecorder
+from pysweco.calcs import MODE_PERFORMANCE
+from pysweco.networks import DEFAULT_THRESHOLD, NETWORK_KINDS, type_rows, system_rows
+from pysweco.revitdb import id_value
+from pysweco.revitdb.calcs import mode_values
+from pysweco.revitdb.networks import collect_network_index
+
+# start timing of the command phases
+perf = PerfRecorder("Inspect System Calcs")
+
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
+# number of elements from which a system type is a Performance mode candidate, Shift+Click changes it
+config    = script.get_config()
+threshold = int(config.get_option("performance_threshold", DEFAULT_THRESHOLD))
+if EXEC_PARAMS.config_mode:
+	new_threshold = forms.ask_for_string(
+					default = str(threshold),
+					prompt = "Number of curves, fittings and accessories from which a system type is a Performance mode candidate",
+					title = "Inspect System Calcs"
+					)
+	if new_threshold and new_threshold.strip().isdigit():
+		threshold = int(new_threshold)
+		config.performance_threshold = threshold
+		script.save_config()
+
+# number of largest systems listed
+SYSTEMS_LIMIT = 25
+
 # DATA COLLECTION
+perf.phase("collection")
 # collect duct system types in current model / returns a list
 mep_duct_sys = FilteredElementCollector(doc).\
 				OfClass(MechanicalSystemType).\
@@ -22,20 +51,29 @@ mep_pipe_sys = FilteredElementCollector(doc).\
 				WhereElementIsElementType().\
 				ToElements()
 
-# create lists of system type names and their calcs modes
+perf.count("duct system types", len(mep_duct_sys))
+perf.count("pipe system types", len(mep_pipe_sys))
+perf.phase("parameter reads")
+
+# create lists of system type names and their calcs modes, and system type id -> (name, calcs mode, mode value)
 duct_calcs_sys, pipe_calcs_sys = [], []
+system_types = {}
 
 # append duct system types and calculation parameter modes to a list
 for dc in mep_duct_sys:
 	duct_sys	= dc.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
-	duct_calcs	= dc.get_Parameter(BuiltInParameter.RBS_DUCT_SYSTEM_CALCULATION_PARAM).AsValueString()
+	duct_param	= dc.get_Parameter(BuiltInParameter.RBS_DUCT_SYSTEM_CALCULATION_PARAM)
+	duct_calcs	= duct_param.AsValueString()
 	duct_calcs_sys.append((duct_sys, duct_calcs))
+	system_types[id_value(dc.Id)] = (duct_sys, duct_calcs, duct_param.AsInteger())
 
 # append pipe system types and calculation parameter modes to a list
 for pp in mep_pipe_sys:
 	pipe_sys	= pp.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString()
-	pipe_calcs	= pp.get_Parameter(BuiltInParameter.RBS_PIPE_SYSTEM_CALCULATION_PARAM).AsValueString()
+	pipe_param	= pp.get_Parameter(BuiltInParameter.RBS_PIPE_SYSTEM_CALCULATION_PARAM)
+	pipe_calcs	= pipe_param.AsValueString()
 	pipe_calcs_sys.append((pipe_sys, pipe_calcs))
+	system_types[id_value(pp.Id)] = (pipe_sys, pipe_calcs, pipe_param.AsInteger())
 
 # sort duct list in alphabetical order and count total number of duct system types
 duct_calcs_sys = sorted(duct_calcs_sys)
@@ -47,7 +85,18 @@ table_separator_1 = [("<b>1. DUCT SYSTEM TYPE ({})</b>".format(len(mep_duct_sys)
 table_separator_2 = [("<b>2. PIPE SYSTEM TYPE ({})</b>".format(len(mep_pipe_sys)), "")]
 combined_data = table_separator_1 + duct_calcs_sys + table_separator_2 + pipe_calcs_sys
 
+perf.phase("network collection")
+# curves, fittings and accessories are collected once and grouped by system type and by system
+network_index = collect_network_index(doc)
+perf.count("network elements", sum(size.total for size in network_index.by_type.values()))
+perf.count("systems", len(network_index.by_system))
+
+# system types ranked by network size, large types not in Performance mode are flagged
+ranking_data = type_rows(network_index, system_types, mode_values().get(MODE_PERFORMANCE), threshold)
+systems_data = system_rows(network_index, system_types, SYSTEMS_LIMIT)
+
 # OUTPUT FOR USER
+perf.phase("output")
 # get current working directory where current Python script is located
 # specify the relative path to the file image
 # join the current directory with the relative path to create the full path
@@ -66,4 +115,15 @@ output.print_table(combined_data,
 					columns = ["SYSTEM TYPE", "CALCULATION MODE"]
 					)
 
+# network size per system type and largest systems
+output.print_table(ranking_data,
+					columns = ["RANK", "SYSTEM TYPE"] + [kind.upper() for kind in NETWORK_KINDS] + ["TOTAL", "SYSTEMS", "CALCULATION MODE", "PERFORMANCE CANDIDATE"],
+					title = "NETWORK SIZE PER SYSTEM TYPE (CANDIDATE FROM {} ELEMENTS, SHIFT+CLICK TO CHANGE)".format(threshold)
+					)
+output.print_table(systems_data,
+					columns = ["SYSTEM", "SYSTEM TYPE"] + [kind.upper() for kind in NETWORK_KINDS] + ["TOTAL"],
+					title = "LARGEST SYSTEMS ({} OF {})".format(len(systems_data), len(network_index.by_system))
+					)
+
+perf.finish(output)
 script.exit()
\ No newline at end of file
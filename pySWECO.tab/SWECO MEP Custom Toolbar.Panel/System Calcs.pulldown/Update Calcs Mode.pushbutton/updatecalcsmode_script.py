@@ -1,123 +1,199 @@
 # IMPORTS
 # import Revit & pyrevit libraries
-from Autodesk.Revit.DB import (
-	 FilteredElementCollector, 
-	 BuiltInParameter, 
-	 WorksharingUtils,
-	 CheckoutStatus,
-	 ModelUpdatesStatus,
-	 Transaction,
-	 TransactionStatus
-	 )
-
-from Autodesk.Revit.DB.Mechanical import MechanicalSystemType
-from Autodesk.Revit.DB.Plumbing import PipingSystemType
-
+from Autodesk.Revit.DB import Transaction, TransactionStatus
 from pyrevit import forms, script
+import time
+
+# import pySWECO performance recorder, calculation mode engine and worksharing precheck
+from pysweco.perf import PerfRecorder
+from pysweco.calcs import MODE_NONE, MODE_ALL, MODE_PERFORMANCE, types_to_change, plan_mode_changes, verify_changes, mode_label, change_rows
+from pysweco.calcs import capture_profile, profile_changes, load_profiles, dump_profiles
+from pysweco.revitdb import id_value
+from pysweco.revitdb.calcs import mode_values, collect_system_types, read_system_type, read_mode, apply_mode_changes
+from pysweco.revitdb.calcs import read_profiles_text, write_profiles_text
+from pysweco.revitdb.worksharing import BLOCKED_COLUMNS, precheck_elements, checkout_elements, blocked_rows
+
+# start timing of the command phases (perf is the name of the Performance mode below)
+timings = PerfRecorder("Update Calcs Mode")
 
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
 
 # DATA COLLECTION
-# collect all duct system types in current model
-duct_system_type = FilteredElementCollector(doc).\
-				OfClass(MechanicalSystemType).\
-				WhereElementIsElementType().\
-				ToElements()
+timings.phase("collection")
+# collect all duct and pipe system types in current model with one collector
+system_types = collect_system_types(doc)
 
-# collect all pipe system types in current model
-pipe_system_type = FilteredElementCollector(doc).\
-				OfClass(PipingSystemType).\
-				WhereElementIsElementType().\
-				ToElements()
+timings.count("system types", len(system_types))
+timings.phase("parameter reads")
+# read name, kind (by class) and calculation mode once per system type
+records     = [read_system_type(st) for st in system_types]
+types_by_id = dict((r.type_id, st) for r, st in zip(records, system_types))
 
-# combined the above lists into one
-combined_system_type = list(duct_system_type) + list(pipe_system_type)
+# calculation mode values of this Revit version and their names
+values = mode_values()
+labels = dict((value, name) for name, value in values.items())
 
 # FUNCTIONS
-# 1) create a function that takes a list and splits it into 2 lists: duct/pipe with not None mode and duct/pipe with not Performance mode
-def check_system_types(combined_list):
-	# 1.1) create 2 lists to separate duct and pipe system types which calculation parameter modes are either not none or not performance
-	not_none_list, not_perf_list = [], []
-	for e in combined_list:
-		system_name = e.get_Parameter(BuiltInParameter.SYMBOL_FAMILY_NAME_PARAM)
-		if system_name and system_name.AsString() == "Duct System":
-			duct_param_mode = e.get_Parameter(BuiltInParameter.RBS_DUCT_SYSTEM_CALCULATION_PARAM).AsInteger()
-			if duct_param_mode != 0:
-				not_none_list.append(e)
-			if duct_param_mode != 4:
-				not_perf_list.append(e)
-		elif system_name and system_name.AsString() == "Piping System":
-			pipe_param_mode = e.get_Parameter(BuiltInParameter.RBS_PIPE_SYSTEM_CALCULATION_PARAM).AsInteger()
-			if pipe_param_mode != 0:
-				not_none_list.append(e)
-			if pipe_param_mode != 4:
-				not_perf_list.append(e)
-
-	# 1.2) count number of system types in not none list and not performance list
-	not_none_list_count = len(not_none_list)
-	not_perf_list_count = len(not_perf_list)
-	# prepare the result
-	result = [
-			  not_none_list_count,	# @ index 0
-			  not_perf_list_count,	# @ index 1
-			  not_none_list,		# @ index 2
-			  not_perf_list			# @ index 3
-			  ]
-	return result
-
-# 2) create a function that updates mode to either None or Performance
-def update_system_types(list_to_update, set_to_none = False, set_to_performance = False):
-	# if user decides to set everything to None
-	if set_to_none == True:
-		for m in list_to_update:
-			family_name = m.get_Parameter(BuiltInParameter.SYMBOL_FAMILY_NAME_PARAM)
-			if family_name and family_name.AsString() == "Duct System":
-				m.get_Parameter(BuiltInParameter.RBS_DUCT_SYSTEM_CALCULATION_PARAM).Set(0)
-			elif family_name and family_name.AsString() == "Piping System":
-				m.get_Parameter(BuiltInParameter.RBS_PIPE_SYSTEM_CALCULATION_PARAM).Set(0)
-	# if user decides to set everything to Performance
-	if set_to_performance == True:
-		for m in list_to_update:
-			family_name = m.get_Parameter(BuiltInParameter.SYMBOL_FAMILY_NAME_PARAM)
-			if family_name and family_name.AsString() == "Duct System":
-				m.get_Parameter(BuiltInParameter.RBS_DUCT_SYSTEM_CALCULATION_PARAM).Set(4)
-			elif family_name and family_name.AsString() == "Piping System":
-				m.get_Parameter(BuiltInParameter.RBS_PIPE_SYSTEM_CALCULATION_PARAM).Set(4)
-
-# 3) create a function that checks status and ownership of elements
-def ownership_status(d, system_list):
-	ownership_status_list = [
-					[WorksharingUtils.GetCheckoutStatus(d, system.Id)	   != CheckoutStatus.OwnedByOtherUser,
-					 WorksharingUtils.GetModelUpdatesStatus(d, system.Id)  != ModelUpdatesStatus.DeletedInCentral,
-					 WorksharingUtils.GetModelUpdatesStatus(d, system.Id)  != ModelUpdatesStatus.UpdatedInCentral]
-					 for system in system_list
-					 ]
-	bool_val = any(False in row for row in ownership_status_list)
-	return bool_val
-
-# 4) create a function to display alert form
+# 1) create a function to display alert form
 def sweco_alert(message):
 	forms.alert(
 	message, 
 	title = "Script is cancelled",
 	ok = False
 	)
+	timings.finish(script.get_output())
 	script.exit()
 
-# messages for 4) function
+# messages for 1) function
 msg_1 = "No calculation parameter mode selected."
-msg_2 = "Some calculation parameter modes cannot be updated. They are either owned by other user or they have been deleted / updated in the central model."
-msg_3 = 'All duct and piping systems calculation parameters are already set to "None" mode.'
-msg_4 = 'All duct and piping systems calculation parameters are already set to "Performance" mode.'
+msg_2 = "Selected system types cannot be updated. They are either owned by other user or they have been deleted / updated in the central model. See the output window for details."
+msg_3 = 'All duct and piping systems calculation parameters are already set to "{}" mode.'
+msg_4 = "No system type selected."
+msg_5 = "No profile name entered."
+msg_6 = "Calculation mode profile cannot be saved. Project information is either owned by other user or it has been deleted / updated in the central model. See the output window for details."
+msg_7 = "No calculation mode profile is saved in this document."
+msg_8 = "No profile selected."
+msg_9 = 'All duct and piping systems calculation parameters already have the modes of profile "{}".'
+
+# 2) create a function that lists the system types which cannot be updated in the output window
+def print_blocked(blocked):
+	output = script.get_output()
+	output.print_table(
+					   blocked_rows(output, blocked),
+					   title = "SYSTEM TYPES WHICH CANNOT BE UPDATED",
+					   columns = BLOCKED_COLUMNS
+					   )
+
+# 3) create a function that updates the planned changes: worksharing checks, confirmation, checkout,
+#    one transaction and the verification of the changed system types only; target is shown in the messages
+def update_system_types(changes, transaction_name, target):
+	timings.phase("worksharing checks")
+	# checkout and model updates status are read once per system type, blocked types are listed with their owners
+	precheck = precheck_elements(doc, [types_by_id[c.record.type_id] for c in changes])
+	timings.count("blocked system types", len(precheck.blocked))
+	if not precheck.ready:
+		print_blocked(precheck.blocked)
+		sweco_alert(msg_2)
+
+	# throw another user form to double check and if yes, then proceed to action
+	timings.phase("user input")
+	if precheck.blocked:
+		print_blocked(precheck.blocked)
+		question = '{} of {} system types will be set to {}. {} system type(s) listed in the output window cannot be updated \
+		and will be skipped. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel'.format(len(precheck.ready), len(changes), target, len(precheck.blocked))
+	else:
+		question = '{} system types will be set to {}. Would you like to proceed?\n\n\
+		Click "Yes" to proceed or "No" to cancel'.format(len(changes), target)
+	outcome = forms.alert(
+	msg = question,
+	sub_msg = 'Please note: BIM Managers only can perform this action',
+	ok = False,
+	yes = True,
+	no = True,
+	warn_icon = False,
+	exitscript = True
+	)
+	if outcome != True:
+		return
+	# check out the system types which are not owned by current user in one call, the ones which cannot be checked out are skipped
+	timings.phase("checkout")
+	not_checked_out = checkout_elements(doc, precheck)
+	if not_checked_out:
+		print_blocked(precheck.blocked[-not_checked_out:])
+	ready_ids = set(id_value(st.Id) for st in precheck.ready)
+	changes   = [c for c in changes if c.record.type_id in ready_ids]
+	timings.phase("transaction")
+	t = Transaction(doc, transaction_name)
+	try:
+		t.Start()
+		apply_mode_changes(changes, types_by_id)
+		t.Commit()
+		timings.count("updated system types", len(changes))
+		# verify the changed system types only
+		timings.phase("verification")
+		failed = verify_changes(changes, lambda type_id: read_mode(types_by_id[type_id]))
+		output = script.get_output()
+		output.print_table(
+						   change_rows(changes, labels),
+						   title = "UPDATED SYSTEM TYPES",
+						   columns = ["Kind", "System Type", "Mode Before", "Mode After"]
+						   )
+		# final user message
+		if t.GetStatus() == TransactionStatus.Committed and not failed:
+			msg = "Calculation parameter of {} system types has been successfully set to {}, {} skipped.\n\n\
+			Transaction status: {}".format(len(changes), target, len(precheck.blocked), t.GetStatus())
+			forms.alert(
+						msg, 
+						title = "Script is successfully completed", 
+						ok = False, 
+						warn_icon = False
+						)
+		else:
+			forms.alert(
+						'Transaction status is: {}. {} system type(s) are not set to {} after the update.'.format(t.GetStatus(), len(failed), target),
+						title = "Error", 
+						ok = False
+						)
+	except Exception as e:
+		t.RollBack()
+		forms.alert(
+					'Transaction status is: {}. Some modes could not be updated due to: {}'.format(t.GetStatus(), e),
+					title = "Error", 
+					ok = False
+					)
+
+# 4) create a function that saves the current modes of all system types as a named profile of the document
+def save_profile():
+	timings.phase("user input")
+	profile_name = forms.ask_for_string(
+				   default = "Before Performance {}".format(time.strftime("%Y-%m-%d")),
+				   prompt = "Profile name (a saved profile with the same name is replaced)",
+				   title = "Save Calculation Mode Profile"
+				   )
+	if not profile_name:
+		sweco_alert(msg_5)
+	profiles = load_profiles(read_profiles_text(doc))
+	profiles[profile_name] = capture_profile(records, time.strftime("%Y-%m-%d %H:%M"))
+	# profiles are stored in the project information which must be editable
+	timings.phase("worksharing checks")
+	precheck = precheck_elements(doc, [doc.ProjectInformation])
+	checkout_elements(doc, precheck)
+	if not precheck.ready:
+		print_blocked(precheck.blocked)
+		sweco_alert(msg_6)
+	timings.phase("transaction")
+	t = Transaction(doc, "Save Calcs Profile")
+	try:
+		t.Start()
+		write_profiles_text(doc, dump_profiles(profiles))
+		t.Commit()
+		forms.alert(
+					'Calculation modes of {} system types have been saved to profile "{}".\n\n\
+					Transaction status: {}'.format(len(records), profile_name, t.GetStatus()),
+					title = "Script is successfully completed", 
+					ok = False, 
+					warn_icon = False
+					)
+	except Exception as e:
+		t.RollBack()
+		forms.alert(
+					'Transaction status is: {}. Profile could not be saved due to: {}'.format(t.GetStatus(), e),
+					title = "Error", 
+					ok = False
+					)
 
 # create a simple class with name and description to feed pyrevit forms's info panel
 class Mode:
-	def __init__(self, name, description):
+	def __init__(self, name, mode, description):
 		self.name = name
+		self.mode = mode
 		self.description = description
+# actions of the profiles
+SAVE_PROFILE    = "Save Profile"
+RESTORE_PROFILE = "Restore Profile"
 # name and description of None mode
-none = Mode("None Mode", "***Prior updating, read the description below which is taken from the official Autodesk website.*** \n\n\
+none = Mode("None Mode", MODE_NONE, "***Prior updating, read the description below which is taken from the official Autodesk website.*** \n\n\
 System calculation is off. \n\n\
 1. Duct System Type: \n\
 None -> the Flow parameter is not computed. Revit still maintains \
@@ -126,7 +202,7 @@ the logical sections in the duct system.\n\n\
 None -> the Volume parameter is not computed. Revit still maintains \
 the logical sections in the pipe system.")
 # name and description of Performance mode
-perf = Mode("Performance Mode", "***Prior updating, read the description below which is taken from the official Autodesk website.*** \n\n\
+perf = Mode("Performance Mode", MODE_PERFORMANCE, "***Prior updating, read the description below which is taken from the official Autodesk website.*** \n\n\
 1. Duct System Type:\n\
 Performance -> the Flow parameter and system-level calculations are not computed. \n\
 Use the Performance mode to improve Revit's performance when editing large MEP duct \
@@ -137,15 +213,46 @@ Performance -> the Volume parameter and system-level calculations are not comput
 Use the Performance mode to improve Revit's performance when editing large MEP pipe system networks. \
 System propagation is disabled on every system in the project that uses the selected system type. \n\
 ***Note: The Pipe Sizing tools are not available for systems where the Calculations parameter is set to Performance.")
+# name and description of All mode
+all_mode = Mode("All Mode", MODE_ALL, "***Prior updating, read the description below.*** \n\n\
+System calculation is fully on. \n\n\
+1. Duct System Type:\n\
+All -> the Flow, Pressure Loss and system-level calculations are computed. \n\
+Use the All mode before sizing duct systems. Editing large duct system networks is slower in this mode.\n\n\
+2. Pipe System Type:\n\
+All -> the Flow, Volume, Pressure Loss and system-level calculations are computed. \n\
+Use the All mode before sizing pipe systems. Editing large pipe system networks is slower in this mode.")
+
+# name and description of profile actions
+save_mode = Mode("Save Calcs Profile", SAVE_PROFILE, "Saves the current calculation mode of every duct and pipe system type \
+as a named profile stored in this document.\n\n\
+Save a profile before switching system types to Performance mode for a heavy routing session.")
+restore_mode = Mode("Restore Calcs Profile", RESTORE_PROFILE, "Restores the calculation modes of a saved profile \
+in one transaction.\n\n\
+Restore the profile saved before the performance editing session to get the original modes back before sizing.")
+
+# create a simple class with name to feed pyrevit form with system types and their current mode
+class SystemTypeItem:
+	def __init__(self, record):
+		self.record = record
+		self.name = "{}: {} ({})".format(record.kind, record.name, mode_label(record.mode, labels))
+
+# create a simple class with name to feed pyrevit form with saved profiles
+class ProfileItem:
+	def __init__(self, name, profile):
+		self.profile_name = name
+		self.profile = profile
+		self.name = "{} (saved {}, {} system types)".format(name, profile.get("saved", "-"), len(profile.get("modes", {})))
 
 # USER INTERACTION
-# create a dialog window with 2 choices: None and Performance
-context 	= [none, perf]
+timings.phase("user input")
+# create a dialog window with the choices: None, Performance, All, save and restore profile
+context 	= [m for m in (none, perf, all_mode) if m.mode in values] + [save_mode, restore_mode]
 select_mode = forms.SelectFromList.show(
 			context,
 			title  = "Update Calculation Parameter Mode",
 			width  = 500,
-			height = 350,
+			height = 400,
 			button_name = "Update",
 			info_panel  = True
 			)
@@ -154,96 +261,49 @@ select_mode = forms.SelectFromList.show(
 if not select_mode:
 	sweco_alert(msg_1)
 
-# 1 scenario where Revit user decides to set everything to None mode
-if select_mode.name == "None Mode":
-	result = check_system_types(combined_system_type)
-	# scenario where all system types have already mode None
-	if result[0] == 0:
-		sweco_alert(msg_3)
-	# scenario where elements are owned by other user or have been deleted / updated in the central model
-	elif doc.IsWorkshared and ownership_status(doc, result[2]):
-		sweco_alert(msg_2)
-	# throw another user form to double check and if yes, then proceed to action
-	else:
-		none_outcome = forms.alert(
-		msg = 'All duct and piping systems calculation parameters will be set to \
-		"None" mode. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel',
-		sub_msg = 'Please note: BIM Managers only can perform this action',
-		ok = False,
-		yes = True,
-		no = True,
-		warn_icon = False,
-		exitscript = True
-		)
-		if none_outcome == True:
-			none_check_at_start = result[0]
-			t = Transaction(doc, 'None Mode')
-			try:
-				t.Start()
-				update_system_types(result[2], set_to_none = True)
-				t.Commit()
-				none_check_at_commit = check_system_types(combined_system_type)[0]
-				# final user message (None)
-				if t.GetStatus() == TransactionStatus.Committed and none_check_at_commit == 0:
-					msg_none = "Calculation parameter of {} system types has been successfully set to None mode.\n\n\
-					Transaction status: {}".format(none_check_at_start, t.GetStatus())
-					forms.alert(
-								msg_none, 
-								title = "Script is successfully completed", 
-								ok = False, 
-								warn_icon = False
-								)
-			except Exception as e:
-				t.RollBack()
-				forms.alert(
-							'Transaction status is: {}. Some modes could not be updated due to: {}'.format(t.GetStatus(), e),
-							title = "Error", 
-							ok = False
-							)
-
-# 2 scenario where Revit user decides to set everything to Performance mode
-if select_mode.name == "Performance Mode":
-	result = check_system_types(combined_system_type)
-	# scenario where all system types have already mode Performance
-	if result[1] == 0:
+# scenario where Revit user saves the current modes
+if select_mode.mode == SAVE_PROFILE:
+	save_profile()
+
+# scenario where Revit user restores the modes of a saved profile
+elif select_mode.mode == RESTORE_PROFILE:
+	profiles = load_profiles(read_profiles_text(doc))
+	if not profiles:
+		sweco_alert(msg_7)
+	profile_item = forms.SelectFromList.show(
+				   [ProfileItem(name, profile) for name, profile in reversed(list(profiles.items()))],
+				   title = "Restore Calculation Mode Profile",
+				   width = 500,
+				   height = 400,
+				   button_name = "Restore"
+				   )
+	if not profile_item:
+		sweco_alert(msg_8)
+	changes = profile_changes(records, profile_item.profile)
+	if not changes:
+		sweco_alert(msg_9.format(profile_item.profile_name))
+	update_system_types(changes, "Restore Calcs Profile", 'the modes of profile "{}"'.format(profile_item.profile_name))
+
+# scenario where Revit user sets selected system types to None, Performance or All mode
+else:
+	# list the system types which are not in the selected mode, all of them are selected by default
+	target     = values[select_mode.mode]
+	candidates = sorted(types_to_change(records, target), key=lambda r: (r.kind, r.name))
+	if not candidates:
+		sweco_alert(msg_3.format(select_mode.mode))
+
+	type_selection = forms.SelectFromList.show(
+					 [forms.TemplateListItem(SystemTypeItem(r), checked = True) for r in candidates],
+					 title = "System Types to set to {} ({})".format(select_mode.mode, len(candidates)),
+					 width = 500,
+					 height = 600,
+					 button_name = "Update",
+					 multiselect = True
+					 )
+	if not type_selection:
 		sweco_alert(msg_4)
-	# scenario where elements are owned by other user or have been deleted / updated in the central model
-	elif doc.IsWorkshared and ownership_status(doc, result[3]):
-		sweco_alert(msg_2)
-	# throw another user form to double check and if yes, then proceed to action
-	else:
-		performance_outcome = forms.alert(
-		msg = 'All duct and piping systems calculation parameters will be set to\
-		"Performance" mode. Would you like to proceed?\n\nClick "Yes" to proceed or "No" to cancel',
-		sub_msg = 'Please note: BIM Managers only can perform this action',
-		ok = False,
-		yes = True,
-		no = True,
-		warn_icon = False,
-		exitscript = True
-		)
-		if performance_outcome == True:
-			perf_check_at_start = result[1]
-			t = Transaction(doc, 'Performance Mode')
-			try:
-				t.Start()
-				update_system_types(result[3], set_to_performance = True)
-				t.Commit()
-				perf_check_at_commit = check_system_types(combined_system_type)[1]
-				# final user message (Performance)
-				if t.GetStatus() == TransactionStatus.Committed and perf_check_at_commit == 0:
-					msg_perf = "Calculation parameter of {} system types has been successfully set to Performance mode.\n\n\
-					Transaction status: {}".format(perf_check_at_start, t.GetStatus())
-					forms.alert(
-								msg_perf, 
-								title = "Script is successfully completed", 
-								ok = False, 
-								warn_icon = False
-								)
-			except Exception as e:
-				t.RollBack()
-				forms.alert(
-							'Transaction status is: {}. Some modes could not be updated due to: {}'.format(t.GetStatus(), e),
-							title = "Error", 
-							ok = False
-							)
\ No newline at end of file
+
+	changes = plan_mode_changes([item.record for item in type_selection], target)
+	update_system_types(changes, select_mode.name, '"{}" mode'.format(select_mode.mode))
+
+timings.finish(script.get_output())
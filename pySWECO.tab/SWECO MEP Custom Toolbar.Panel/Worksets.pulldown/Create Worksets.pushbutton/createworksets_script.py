@@ -2,10 +2,17 @@
 # import pyrevit libraries
 from pyrevit import revit, DB, forms, script
 
+# import pySWECO performance recorder
+from pysweco.perf import PerfRecorder
+
+# start timing of the command phases
+perf = PerfRecorder("Create Worksets")
+
 # get active Revit document
 doc = revit.doc
 
 # DATA COLLECTION
+perf.phase("collection")
 # get all user worksets as elements in an active Revit document
 existing_user_worksets = DB.FilteredWorksetCollector(doc).\
 						 OfKind(DB.WorksetKind.UserWorkset).\
@@ -14,6 +21,8 @@ existing_user_worksets = DB.FilteredWorksetCollector(doc).\
 # get user worksets names
 existing_user_worksets_names = [wn.Name for wn in existing_user_worksets]
 
+perf.count("user worksets", len(existing_user_worksets_names))
+
 # SWECO default list of worksets 
 default_sweco_worksets = sorted([
 						'SWE-A_Architectural Components',
@@ -71,6 +80,7 @@ def sweco_alert(message):
 	title = "Script is cancelled",
 	ok = False
 	)
+	perf.finish(script.get_output())
 	script.exit()
 
 msg_1 = "Active Revit document is not workshared. To create workset(s), worksharing must be enabled."
@@ -79,6 +89,7 @@ msg_3 = "No worksets have been selected."
 msg_4 = "Worksets you are trying to create already exist in an active Revit document."
 
 # USER INTERACTION
+perf.phase("user input")
 # check if active Revit document is workshared
 if not doc.IsWorkshared:
 	sweco_alert(msg_1)
@@ -120,11 +131,14 @@ if options_to_select == "Default Sweco Worksets":
 	exitscript = True
 	)
 	if yes_outcome_d == True:
+		perf.phase("transaction")
 		default_worksets_counter = 0
 		with revit.Transaction("Default Sweco Worksets"):
 			for default_wk in default_selection:
 				worksets_creation(doc, default_wk)
 				default_worksets_counter += 1
+		perf.count("created worksets", default_worksets_counter)
+		perf.phase("user input")
 		if len(default_selection) == default_worksets_counter:
 			m = "{} worksets(s) have been successfully created.".format(default_worksets_counter)
 			forms.alert(
@@ -161,11 +175,14 @@ if options_to_select == "Optional Sweco Worksets":
 	exitscript = True
 	)
 	if yes_outcome_o == True:
+		perf.phase("transaction")
 		optional_worksets_counter = 0
 		with revit.Transaction("Optional Sweco Worksets"):
 			for optional_wk in optional_selection:
 				worksets_creation(doc, optional_wk)
 				optional_worksets_counter += 1
+		perf.count("created worksets", optional_worksets_counter)
+		perf.phase("user input")
 		if len(optional_selection) == optional_worksets_counter:
 			m = "{} worksets(s) have been successfully created.".format(optional_worksets_counter)
 			forms.alert(
@@ -173,4 +190,6 @@ if options_to_select == "Optional Sweco Worksets":
 						title = "Script is successfully completed", 
 						ok = False, 
 						warn_icon = False
-						)
\ No newline at end of file
+						)
+
+perf.finish(script.get_output())
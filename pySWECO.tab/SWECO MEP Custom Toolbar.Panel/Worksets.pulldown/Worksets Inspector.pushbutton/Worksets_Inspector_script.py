@@ -4,8 +4,18 @@ from pyrevit import revit, DB, forms, script
 # import module to get directory path
 import os 
 
-# import Counter class to count occurances
-from collections import Counter
+# import pySWECO library to bucket workset elements
+from pysweco.worksets import EXPORT_COLUMNS, bucket_elements, bucket_by_workset, tally_workset_counts, inventory_rows
+from pysweco.export import RowExport
+from pysweco.snapshot import Snapshot
+from pysweco.report import ReportBuilder
+from pysweco.perf import PerfRecorder
+from pysweco.revitdb import id_value
+from pysweco.revitdb.snapshot import refresh_snapshot, reference_resolver
+from pysweco.revitdb.worksets import RevitElementReader, category_kinds, collect_workset_element_ids, collect_worksets_element_ids, count_elements_by_workset, iter_reportable_elements, iter_workset_category_pairs, category_names
+
+# start timing of the command phases
+perf = PerfRecorder("Worksets Inspector")
 
 # get current Revit document
 doc = __revit__.ActiveUIDocument.Document
@@ -13,7 +23,18 @@ doc = __revit__.ActiveUIDocument.Document
 # import output module
 output = script.get_output()
 
+# reader of the element parameters used by the inspector and lookup table of category id -> handler kind
+reader = RevitElementReader()
+kinds  = category_kinds()
+
+# inspection modes
+FULL_INSPECTION = "Full Inspection"
+QUICK_SCAN      = "Quick Scan (element counts only)"
+INCREMENTAL     = "Incremental Inspection (reuses last run snapshot)"
+EXPORT          = "Export Inventory (CSV / JSON Lines)"
+
 # collect all user worksets in current Revit model
+perf.phase("collection")
 user_workset_list	  = DB.FilteredWorksetCollector(doc).\
 						OfKind(DB.WorksetKind.\
 						UserWorkset).\
@@ -21,16 +42,48 @@ user_workset_list	  = DB.FilteredWorksetCollector(doc).\
 # create a dictionary with workset names and ids
 user_workset_dict 	  = {workset.Name: workset.Id for workset in user_workset_list}
 
+# select inspection mode: full inspection or counts-only quick scan
+perf.phase("user input")
+inspection_mode       = forms.ask_for_one_item(
+						[FULL_INSPECTION, INCREMENTAL, QUICK_SCAN, EXPORT],
+						default = FULL_INSPECTION,
+						prompt = "Select inspection mode",
+						title = "Workset(s) Inspection"
+						)
+if not inspection_mode:
+	forms.alert(
+	"No inspection mode selected",
+	title = "Script is cancelled",
+	ok = False
+	)
+	perf.finish(output)
+	script.exit()
+
+# count model elements of all worksets with one id collector, without materializing elements
+perf.phase("workset counts")
+element_counts        = count_elements_by_workset(doc)
+workset_totals        = dict((name, element_counts[id_value(workset_id)]) for name, workset_id in user_workset_dict.items())
+perf.count("model elements", sum(workset_totals.values()))
+
+# create a simple class with name to feed pyrevit form with workset names and their element counts
+class WorksetItem:
+	def __init__(self, workset_name, element_count):
+		self.workset_name = workset_name
+		self.name = "{} ({})".format(workset_name, element_count)
+
 # sort worksets keys in alphabetical order and select worksets for inspection by using pyrevit form
+perf.phase("user input")
 sorted_user_workset   = sorted(user_workset_dict.keys())
-workset_inspect       = forms.SelectFromList.show(
-						sorted_user_workset,
+workset_items         = [WorksetItem(name, workset_totals[name]) for name in sorted_user_workset]
+workset_selection     = forms.SelectFromList.show(
+						workset_items,
 						title="Workset(s) Inspection",
 						width = 450,
 						height = 750,
 						button_name="Inspect Workset(s)",
 						multiselect=True
 						)
+workset_inspect       = [item.workset_name for item in workset_selection or []]
 # create a scenario where Revit user does not select anything and cancels
 if not workset_inspect:
 	forms.alert(
@@ -38,8 +91,25 @@ if not workset_inspect:
 	title = "Script is cancelled",
 	ok = False
 	)
+	perf.finish(output)
 	script.exit()
 else:
+	# export mode: ask for the export file before any output is written
+	if inspection_mode == EXPORT:
+		export_path = forms.save_file(
+						files_filter = "CSV (*.csv)|*.csv|JSON Lines (*.jsonl)|*.jsonl",
+						default_name = "{} - Workset Inventory".format(doc.Title)
+						)
+		if not export_path:
+			forms.alert(
+			"No export file selected",
+			title = "Script is cancelled",
+			ok = False
+			)
+			perf.finish(output)
+			script.exit()
+	perf.count("selected worksets", len(workset_inspect))
+	perf.phase("output")
 	# get current working directory where your Python script is located
 	current_dir = os.path.dirname(os.path.realpath(__file__))
 	# specify the relative path to your file image
@@ -60,331 +130,88 @@ else:
 						table_data,
 						columns = ["Total Number of User Worksets in the Revit Model", "User Worksets Selected for Inspection"]
 						)
+	# buffered report: the whole report is written to the output window in a few chunks
+	report = ReportBuilder(output)
+	selected_workset_ids = [user_workset_dict[name] for name in workset_inspect if name in user_workset_dict]
+	# quick scan: element counts per workset and category only
+	if inspection_mode == QUICK_SCAN:
+		# count model elements of the selected worksets per category from id collectors, without materializing elements
+		perf.phase("quick scan counts")
+		workset_counts = tally_workset_counts(iter_workset_category_pairs(doc, selected_workset_ids))
+		perf.phase("output")
+		names = category_names(doc)
+		for idx, workset_name in enumerate(workset_inspect, 1):
+			report.start_section("{}. {} Workset:".format(idx, workset_name))
+			counts = workset_counts.get(id_value(user_workset_dict[workset_name]))
+			if counts:
+				report.line("Model Categories (total elements count - {}):".format(sum(counts.values())), 1)
+				for category_name, category_count in sorted((names.get(cid, str(cid)), n) for cid, n in counts.items()):
+					report.line("{} Category ({})".format(category_name, category_count), 2)
+			else:
+				report.note("No model categories found on this workset")
+			report.end_section()
+			report.rule()
+		report.note("Quick scan counts include nested family components")
+		report.flush()
+		perf.finish(output)
+		script.exit()
+	# export mode: rows are streamed to the file one workset at a time, so only one workset inventory is held in memory
+	if inspection_mode == EXPORT:
+		perf.phase("classification")
+		with RowExport(export_path, EXPORT_COLUMNS) as export:
+			for workset_name in workset_inspect:
+				inventory = bucket_elements(iter_reportable_elements(doc, collect_workset_element_ids(doc, user_workset_dict[workset_name])), reader, kinds)
+				export.write_rows(inventory_rows(workset_name, inventory))
+		perf.count("exported rows", export.rows)
+		perf.phase("output")
+		report.note("{} rows exported to {}".format(export.rows, export_path))
+		report.note("Type parameter cache: {}".format(reader.cache.summary()))
+		report.flush()
+		perf.finish(output)
+		script.exit()
+	perf.phase("classification")
+	# batched mode: when several worksets are selected, collect the elements of the selected worksets once
+	# and partition them by workset id instead of running one collector per workset
+	# incremental mode: only elements added, deleted or changed since the last snapshot of this document are reclassified
+	if inspection_mode == INCREMENTAL:
+		snapshot_path = script.get_document_data_file("WorksetInventory", "snapshot")
+		snapshot, strategy, reclassified = refresh_snapshot(doc, Snapshot.load(snapshot_path), reader, kinds)
+		snapshot.save(snapshot_path)
+		batched_inventories = snapshot.inventories([id_value(wid) for wid in selected_workset_ids], kinds, category_names(doc), reference_resolver(doc, reader.cache))
+	elif len(selected_workset_ids) > 1:
+		batched_inventories = bucket_by_workset(iter_reportable_elements(doc, collect_worksets_element_ids(doc, selected_workset_ids)), reader, [id_value(wid) for wid in selected_workset_ids], kinds)
+	else:
+		batched_inventories = None
+	perf.phase("output")
 	# Iterate through selected worksets
 	for idx, workset_name in enumerate(workset_inspect, 1):
 		workset_id = user_workset_dict.get(workset_name)
 		if workset_id:
-			output.print_md("<span style='color: black; font-weight: bold; font-size: 15px; font-family: Arial'>{}. {} Workset:</span>".format(idx, workset_name))
-			element_workset_filter = DB.ElementWorksetFilter(workset_id, False)
-			user_workset_elements  = DB.FilteredElementCollector(doc).\
-									 WherePasses(element_workset_filter).\
-									 ToElements()
-			# find elements that have supercomponent properties and remove elements with supercomponent properties 
-			workset_elements = [el for el in user_workset_elements if not (isinstance(el, DB.FamilyInstance) and el.SuperComponent is not None)]
-			# create a set with mep model categories 
-			set_0 = set([
-					"Abutments",
-					"Air Terminals",
-					"Areas",
-					"Audio Visual Devices",
-					"Bearings",
-					"Bridge Cables",
-					"Bridge Decks",
-					"Bridge Framing",
-					"Cable Tray Fittings",
-					"Cable Trays",
-					"Casework",
-					"Ceilings",
-					"Columns",
-					"Communication Devices",
-					"Conduit Fittings",
-					"Conduits",
-					"Curtain Panels",
-					"Curtain Systems",
-					"Curtain Wall Mullions",
-					"Data Devices",
-					"Doors",
-					"Duct Accessories",
-					"Duct Fittings",
-					"Duct Insulations",
-					"Duct Linings",
-					"Duct Placeholders",
-					"Ducts",
-					"Electrical Equipment",
-					"Electrical Fixtures",
-					"Entourage",
-					"Expansion Joints",
-					"Fire Alarm Devices",
-					"Fire Protection", 
-					"Flex Ducts",
-					"Flex Pipes",
-					"Floors",
-					"Food Service Equipment",
-					"Furniture",
-					"Furniture Systems",
-					"Generic Models",
-					"Grids",
-					"Hardscape", 
-					"HVAC Zones",
-					"Levels",
-					"Lighting Devices",
-					"Lighting Fixtures",
-					"Lines",
-					"Mass",
-					"Matchline",
-					"Mechanical Control Devices",
-					"Mechanical Equipment",
-					"Medical Equipment", 
-					"MEP Ancillary Framing", 
-					"MEP Fabrication Containment",
-					"MEP Fabrication Ductwork",
-					"MEP Fabrication Ductwork Stiffeners",
-					"MEP Fabrication Hangers",
-					"MEP Fabrication Pipework",
-					"Nurse Call Devices",
-					"Parking",
-					"Parts",
-					"Piers",
-					"Pipe Accessories",
-					"Pipe Fittings",
-					"Pipe Insulations",
-					"Pipe Placeholders",
-					"Pipes",
-					"Planting",
-					"Plumbing Equipment",
-					"Plumbing Fixtures",
-					"Railings",
-					"Ramps",
-					"Reference Planes",
-					"Roads",
-					"Roofs",
-					"Rooms",
-					"Scope Boxes", 
-					"Security Devices",
-					"Shaft Openings",
-					"Signage", 
-					"Site",
-					"Spaces",
-					"Specialty Equipment",
-					"Sprinklers",
-					"Stairs",
-					"Structural Area Reinforcement",
-					"Structural Beam Systems",
-					"Structural Columns",
-					"Structural Connections",
-					"Structural Fabric Areas",
-					"Structural Fabric Reinforcement",
-					"Structural Foundations",
-					"Structural Framing",
-					"Structural Path Reinforcement",
-					"Structural Rebar",
-					"Structural Rebar Couplers",
-					"Structural Stiffeners",
-					"Structural Tendons",
-					"Structural Trusses",
-					"Telephone Devices",
-					"Temporary Structures",
-					"Topography",
-					"Toposolid",
-					"Vertical Circulation",
-					"Vibration Management",
-					"Walls",
-					"Windows"
-					])
-			# get elements category names and filter mep categories only
-			desired_category = [element.Category.Name for element in workset_elements if element.Category and element.Category.Name in set_0]
-
-			# create categories set that can have family names / types
-			set_1 = set([
-					"Abutments",
-					"Air Terminals",
-					"Areas",
-					"Audio Visual Devices",
-					"Bearings",
-					"Bridge Cables",
-					"Bridge Decks",
-					"Bridge Framing",
-					"Casework",
-					"Ceilings",
-					"Columns",
-					"Communication Devices", 
-					"Curtain Panels",
-					"Curtain Systems",
-					"Curtain Wall Mullions",
-					"Data Devices", 
-					"Doors",
-					"Duct Accessories",
-					"Electrical Equipment",
-					"Electrical Fixtures", 
-					"Entourage",
-					"Expansion Joints",
-					"Fire Alarm Devices", 
-					"Fire Protection", 
-					"Floors",
-					"Food Service Equipment",
-					"Furniture",
-					"Furniture Systems",
-					"Generic Models",
-					"Grids",
-					"Hardscape", 
-					"HVAC Zones",
-					"Levels",
-					"Lighting Devices", 
-					"Lighting Fixtures", 
-					"Lines",
-					"Mass",
-					"Matchline",
-					"Mechanical Control Devices",
-					"Mechanical Equipment",
-					"Medical Equipment", 
-					"MEP Ancillary Framing", 
-					"MEP Fabrication Ductwork Stiffeners",
-					"Nurse Call Devices",
-					"Parking",
-					"Parts",
-					"Piers",
-					"Planting",
-					"Plumbing Equipment",
-					"Railings",
-					"Ramps",
-					"Reference Planes",
-					"Roads",
-					"Roofs",
-					"Rooms",
-					"Scope Boxes",
-					"Security Devices", 
-					"Shaft Openings",
-					"Signage", 
-					"Site",
-					"Spaces",
-					"Specialty Equipment",
-					"Stairs",
-					"Structural Area Reinforcement",
-					"Structural Beam Systems",
-					"Structural Columns",
-					"Structural Connections",
-					"Structural Fabric Areas",
-					"Structural Fabric Reinforcement",
-					"Structural Foundations",
-					"Structural Framing",
-					"Structural Path Reinforcement",
-					"Structural Rebar",
-					"Structural Rebar Couplers",
-					"Structural Stiffeners",
-					"Structural Tendons",
-					"Structural Trusses",
-					"Telephone Devices",
-					"Temporary Structures",
-					"Topography",
-					"Toposolid",
-					"Vertical Circulation",
-					"Vibration Management",
-					"Walls",
-					"Windows"
-					])
-
-			# create categories set that can have system types
-			set_2 = set([
-					"Duct Fittings", 
-					"Duct Insulations",
-					"Duct Linings",
-					"Duct Placeholders",
-					"Ducts",
-					"Flex Ducts",
-					"Flex Pipes",
-					"Pipe Accessories", 
-					"Pipe Fittings", 
-					"Pipe Insulations", 
-					"Pipe Placeholders",
-					"Plumbing Fixtures", 
-					"Sprinklers"
-					])
-
-			# create categories set for MEP Fabrication Parts
-			set_3 = set([
-					"MEP Fabrication Containment",
-					"MEP Fabrication Ductwork",
-					"MEP Fabrication Hangers",
-					"MEP Fabrication Pipework"
-					])
-
-			# count desired category unique names and overall counts with Counter
-			category_counter = Counter(desired_category)
-
-			if category_counter:
-				output.print_md("<pre>  &#9654; <span style='color: black; font-size: 15px; font-family: Arial'>Model Categories (total elements count - {}):</span><pre>".format(len(desired_category)))
-				for category_name, category_count in sorted(category_counter.items()):
-					output.print_md("<pre>    &#9658; <span style='color: black; font-size: 14.5px; font-family: Arial'>{} Category ({})</span><pre>".format(category_name, category_count))
-
-					# 1) filter through set_1 and collect family names and their counts
-					filtered_elements_1  = [elem1 for elem1 in workset_elements if elem1.Category and elem1.Category.Name == category_name and elem1.Category.Name in set_1]
-					family_types_counter = Counter()
-					for elem1 in filtered_elements_1:
-						try:
-							if elem1.Category.Name not in ["Areas", "HVAC Zones", "Lines", "Matchline", "Parts", "Reference Planes", "Rooms", "Scope Boxes", "Shaft Openings", "Spaces"]:
-								elem1_name_type = elem1.get_Parameter(DB.BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM)
-								family_types_counter[elem1_name_type.AsValueString()] += 1
-							else: 
-								elem1_cat_name  = elem1.get_Parameter(DB.BuiltInParameter.ELEM_CATEGORY_PARAM)
-								family_types_counter[elem1_cat_name.AsValueString()] += 1
-						except Exception as e:
-							pass
-
-					# 2) filter through set_2 and collect system types and their counts
-					filtered_elements_2  = [elem2 for elem2 in workset_elements if elem2.Category and elem2.Category.Name == category_name and elem2.Category.Name in set_2]
-					system_types_counter = Counter()
-					for elem2 in filtered_elements_2:
-						try:
-							mep_sys_type = elem2.LookupParameter("System Type").AsValueString()
-							system_types_counter[mep_sys_type] += 1
-						except Exception as e:
-							pass
-
-					# 3) filter through trays/conduits and collect service types and family names and their counts
-					filtered_elements_3  = [elem3 for elem3 in workset_elements if elem3.Category and elem3.Category.Name == category_name and elem3.Category.Name in ["Cable Tray Fittings", "Cable Trays", "Conduit Fittings", "Conduits"]]
-					service_type_counter = Counter()
-					for elem3 in filtered_elements_3:
-						try:
-							service_type = elem3.get_Parameter(DB.BuiltInParameter.RBS_CTC_SERVICE_TYPE).AsString()
-							tc_name_type = elem3.get_Parameter(DB.BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM).AsValueString()
-							if service_type and service_type.strip():
-								type_key = "Service Type: " + service_type
-							else:
-								type_key = "Family and Type: " + tc_name_type
-							service_type_counter[type_key] += 1
-						except Exception as e:
-							pass
-
-					# 4) filter through pipes and collect system types and family names and their counts
-					filtered_elements_4 = [elem4 for elem4 in workset_elements if elem4.Category and elem4.Category.Name == category_name and elem4.Category.Name == "Pipes"]
-					pipe_sys_counter    = Counter()
-					pipe_type_counter   = {}
-					for elem4 in filtered_elements_4:
-						try:
-							pipe_sys_type = elem4.LookupParameter("System Type").AsValueString()
-							pipe_type     = elem4.get_Parameter(DB.BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM).AsValueString()
-							pipe_sys_counter[pipe_sys_type] += 1
-							if pipe_type not in pipe_type_counter.setdefault(pipe_sys_type, Counter()):
-								pipe_type_counter[pipe_sys_type][pipe_type] = 1
-							else:
-								pipe_type_counter[pipe_sys_type][pipe_type] += 1
-						except Exception as e:
-							pass
-
-					# 5) filter through set_3 and collect fabrication service types and their counts
-					filtered_elements_5 = [elem5 for elem5 in workset_elements if elem5.Category and elem5.Category.Name == category_name and elem5.Category.Name in set_3]
-					fabrication_types_counter = Counter()
-					for elem5 in filtered_elements_5:
-						try:
-							fab_ser_type = elem5.get_Parameter(DB.BuiltInParameter.FABRICATION_SERVICE_PARAM).AsValueString()
-							fabrication_types_counter[fab_ser_type] += 1
-						except Exception as e:
-							pass
-
+			if batched_inventories is not None:
+				inventory = batched_inventories[id_value(workset_id)]
+			else:
+				# walk workset elements once and bucket them by category and handler kind
+				inventory = bucket_elements(iter_reportable_elements(doc, collect_workset_element_ids(doc, workset_id)), reader, kinds)
+			# each workset and category is a collapsible section of the report
+			report.start_section("{}. {} Workset:".format(idx, workset_name))
+			if inventory.categories:
+				report.line("Model Categories (total elements count - {}):".format(inventory.total), 1)
+				for category_name, bucket in inventory.sorted_categories():
+					report.start_section("{} Category ({})".format(category_name, bucket.count), 2)
 					# prepare the elements output
-					for family_type, family_count in sorted(family_types_counter.items()):
-						output.print_md("<pre>      &#9675; <span style='color: black; font-size: 13.5px; font-family: Arial;'> Family and Type: {} ({})</span><pre>".format(family_type, family_count))
-					for sys_type, sys_count in sorted(system_types_counter.items()):
-						output.print_md("<pre>      &#9675; <span style='color: black; font-size: 13.5px; font-family: Arial;'> System Type: {} ({})</span><pre>".format(sys_type, sys_count))
-					for tc_type, tc_count in sorted(service_type_counter.items()):
-						output.print_md("<pre>      &#9675; <span style='color: black; font-size: 13.5px; font-family: Arial;'> {} ({})</span><pre>".format(tc_type, tc_count))
-					for system_type, system_count in sorted(pipe_sys_counter.items()):
-						output.print_md("<pre>      &#9675; <span style='color: black; font-size: 13.5px; font-family: Arial;'> System Type: {} ({})</span><pre>".format(system_type, system_count))
-						if system_type in pipe_type_counter:
-							for pipe_type, pipe_count in sorted(pipe_type_counter[system_type].items()):
-								output.print_md("<pre>        &#9679; <span style='color: black; font-size: 12.5px; font-family: Arial;'> {} ({})</span><pre>".format(pipe_type, pipe_count))
-					for fab_type, fab_count in sorted(fabrication_types_counter.items()):
-						output.print_md("<pre>      &#9675; <span style='color: black; font-size: 13.5px; font-family: Arial;'> Fabrication Service: {} ({})</span><pre>".format(fab_type, fab_count))
+					for entry, entry_count in bucket.sorted_entries():
+						report.line("{}: {} ({})".format(entry[0], entry[1], entry_count), 3)
+						for pipe_type, pipe_count in bucket.sorted_details(entry):
+							report.line("{} ({})".format(pipe_type, pipe_count), 4)
+					report.end_section()
 			else:
-				output.print_md("<pre>   <span style='color: black; font-size: 14px; font-family: Arial;'> No model categories found on this workset</span><pre>")
-			output.print_md("-" * 50)
\ No newline at end of file
+				report.note("No model categories found on this workset")
+			report.end_section()
+			report.rule()
+	# report how many elements were reclassified and how many parameter reads were saved by the type / system type cache
+	if inspection_mode == INCREMENTAL:
+		perf.count("reclassified elements", reclassified)
+		report.note("Snapshot: {} element(s) reclassified ({}), {} element(s) in snapshot".format(reclassified, strategy, snapshot.reported_count()))
+	report.note("Type parameter cache: {}".format(reader.cache.summary()))
+	report.flush()
+	perf.finish(output)